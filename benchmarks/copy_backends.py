@@ -0,0 +1,81 @@
+"""
+Benchmark of the copier's file copy backends on a synthetic dataset tree.
+
+Builds `<files>` files of `<size>` bytes spread over class/species directories,
+then copies the whole tree once per backend and reports files/s and MB/s.
+
+    python benchmarks/copy_backends.py --files 100000 --size 16384 --workdir /mnt/scratch
+
+Run it on the filesystem you care about (`--workdir`); a tmpfs or a warm page
+cache will mostly measure syscall overhead rather than disk throughput.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from dataset_builder.builder.copier import CopyBackend, copy_file_data
+
+
+def build_tree(root: Path, files: int, size: int, species_per_class: int = 100, classes: int = 10) -> None:
+    payload = os.urandom(size)
+    per_species = max(1, files // (species_per_class * classes))
+    written = 0
+    for c in range(classes):
+        for s in range(species_per_class):
+            species_dir = root / f"class_{c}" / f"species_{s}"
+            species_dir.mkdir(parents=True, exist_ok=True)
+            for i in range(per_species):
+                if written >= files:
+                    return
+                (species_dir / f"{i}.jpg").write_bytes(payload)
+                written += 1
+
+
+def copy_tree(src_root: Path, dst_root: Path, backend: CopyBackend, fadvise: bool) -> tuple:
+    files = 0
+    total_bytes = 0
+    for class_dir in src_root.iterdir():
+        for species_dir in class_dir.iterdir():
+            dst_dir = dst_root / class_dir.name / species_dir.name
+            dst_dir.mkdir(parents=True, exist_ok=True)
+            for image in species_dir.iterdir():
+                total_bytes += copy_file_data(image, dst_dir / image.name, backend, fadvise)
+                files += 1
+    return files, total_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--size", type=int, default=16 * 1024, help="bytes per file")
+    parser.add_argument("--workdir", default=None, help="directory to build the trees in")
+    parser.add_argument("--fadvise", action="store_true", help="pass POSIX_FADV_SEQUENTIAL hints")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="copy_bench_", dir=args.workdir))
+    try:
+        src = workdir / "src"
+        print(f"Building {args.files} files of {args.size} bytes in {src}")
+        build_tree(src, args.files, args.size)
+
+        print(f"{'backend':<16}{'files/s':>12}{'MB/s':>12}{'seconds':>10}")
+        for backend in [b for b in CopyBackend if b is not CopyBackend.AUTO]:
+            dst = workdir / f"dst_{backend.value}"
+            start = time.perf_counter()
+            try:
+                files, total_bytes = copy_tree(src, dst, backend, args.fadvise)
+            except OSError as e:
+                print(f"{backend.value:<16}{'unsupported: ' + str(e):>34}")
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"{backend.value:<16}{files / elapsed:>12.0f}{total_bytes / elapsed / 1e6:>12.1f}{elapsed:>10.2f}")
+            shutil.rmtree(dst)
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of copy orderings (listing, name, inode) on a synthetic dataset tree.
+
+Builds `<files>` files of `<size>` bytes spread over class/species directories in
+a shuffled creation order, then copies the tree once per ordering with
+`copy_all_species` and reports files/s and MB/s.
+
+    sudo python benchmarks/copy_order.py --files 50000 --workdir /mnt/hdd/scratch --drop-caches
+
+The differences only show up when reads actually hit the device: run it on a
+rotational disk or an NFS mount, and pass `--drop-caches` (needs root) so every
+ordering starts from a cold page cache. On SSDs or a warm cache all orderings
+should perform about the same.
+
+For reference, `--files 20000 --drop-caches` (64 KiB files, 1 CPU) on an ext4
+virtio disk backed by flash gave, over two runs:
+
+    order          files/s        MB/s
+    listing      4437-4656     291-305
+    name         3943-4744     258-311
+    inode        4181-4451     274-292
+
+i.e. no difference beyond run-to-run noise, as expected without seek costs.
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from dataset_builder.builder.copier import copy_all_species
+from dataset_builder.builder.walker import CopyOrder, build_copy_tasks, order_copy_tasks
+
+
+def build_tree(root: Path, files: int, size: int, species_per_class: int = 50, classes: int = 10) -> dict:
+    """Writes the files in random species order so listing order and allocation order diverge."""
+    per_species = max(1, files // (species_per_class * classes))
+    slots = [(c, s, i) for c in range(classes) for s in range(species_per_class) for i in range(per_species)]
+    random.Random(0).shuffle(slots)
+    for c, s, i in slots[:files]:
+        species_dir = root / f"class_{c}" / f"species_{s}"
+        species_dir.mkdir(parents=True, exist_ok=True)
+        (species_dir / f"{i}.jpg").write_bytes(os.urandom(size))
+    return {f"class_{c}": [f"species_{s}" for s in range(species_per_class)] for c in range(classes)}
+
+
+def drop_caches() -> None:
+    os.sync()
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--size", type=int, default=64 * 1024, help="bytes per file")
+    parser.add_argument("--workdir", default=None, help="directory to build the trees in")
+    parser.add_argument("--drop-caches", action="store_true", help="drop the page cache before each run (root)")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="copy_order_bench_", dir=args.workdir))
+    try:
+        src = workdir / "src"
+        print(f"Building {args.files} files of {args.size} bytes in {src}")
+        matched = build_tree(src, args.files, args.size)
+        classes = list(matched)
+
+        print(f"{'order':<10}{'files/s':>12}{'MB/s':>12}{'seconds':>10}")
+        for order in CopyOrder:
+            dst = workdir / f"dst_{order.value}"
+            if args.drop_caches:
+                drop_caches()
+            start = time.perf_counter()
+            tasks = order_copy_tasks(build_copy_tasks(matched, classes, src, dst), order)
+            copy_all_species(tasks, order=order)
+            elapsed = time.perf_counter() - start
+            total_bytes = sum(f.stat().st_size for f in dst.rglob("*.jpg"))
+            files = total_bytes // args.size
+            print(f"{order.value:<10}{files / elapsed:>12.0f}{total_bytes / elapsed / 1e6:>12.1f}{elapsed:>10.2f}")
+            shutil.rmtree(dst)
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ Modules:
     - run_web_crawl: Scrapes species data from web pages and saves it as JSON.
 - manifest: Functions to create dataset manifests, including dominant species identification and saving data to files.
     - run_manifest_generator: Generates and saves dataset manifests, splitting data into training and validation sets.
+    - run_manifest_batch: Generates several manifest variants from a single scan of the dataset.
 - visualization: Functions for generating visual representations of species data.
     - run_visualization: Generates visualizations such as species distribution bar charts and PPF plots.
     - venn_diagram: Creates a Venn diagram showing the overlap between two datasets.
@@ -29,8 +30,30 @@ Exceptions:
 - AnalysisError: Raised when an analysis operation fails.
 """
 
-from .analysis import run_analyze_dataset, run_cross_reference
-from .builder import run_copy_matched_species, run_web_crawl
-from .core import load_config, validate_config
-from .manifest import run_manifest_generator
-from .visualization import run_visualization, venn_diagram
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from dataset_builder._lazy import lazy_exports
+
+# Subpackages, and the heavy libraries they use (pandas, pyarrow, matplotlib,
+# sklearn, requests...), are only imported when one of these names is first used.
+_EXPORTS = {
+    "run_analyze_dataset": ".analysis",
+    "run_cross_reference": ".analysis",
+    "run_copy_matched_species": ".builder",
+    "run_web_crawl": ".builder",
+    "load_config": ".core",
+    "validate_config": ".core",
+    "run_manifest_generator": ".manifest",
+    "run_manifest_batch": ".manifest",
+    "run_visualization": ".visualization",
+    "venn_diagram": ".visualization",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .analysis import run_analyze_dataset, run_cross_reference
+    from .builder import run_copy_matched_species, run_web_crawl
+    from .core import load_config, validate_config
+    from .manifest import run_manifest_generator, run_manifest_batch
+    from .visualization import run_visualization, venn_diagram
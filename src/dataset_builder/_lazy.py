@@ -0,0 +1,26 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the PEP 562 `__getattr__` and `__dir__` of a package re-exporting names lazily.
+
+    `exports` maps each public name to the submodule defining it, relative to
+    `package`. The submodule, and the heavy dependencies it imports, is only
+    loaded the first time the name is accessed; the value is then cached in
+    the package namespace so later lookups bypass `__getattr__`.
+    """
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
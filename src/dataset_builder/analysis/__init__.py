@@ -1,2 +1,14 @@
-from .analyzer import run_analyze_dataset
-from .cross_reference import run_cross_reference
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from dataset_builder._lazy import lazy_exports
+
+_EXPORTS = {
+    "run_analyze_dataset": ".analyzer",
+    "run_cross_reference": ".cross_reference",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .analyzer import run_analyze_dataset
+    from .cross_reference import run_cross_reference
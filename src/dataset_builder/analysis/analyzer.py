@@ -6,6 +6,7 @@ from dataset_builder.analysis.scanner import (
     scan_image_counts,
     scan_species_list,
 )
+from dataset_builder.core.events import add_counters, traced
 from dataset_builder.core.utility import SpeciesDict, _is_json_file, write_data_to_json
 
 
@@ -32,6 +33,7 @@ def _summarize_species_data(
     print(f"Total extracted species: {total_species}")
 
 
+@traced("analyze")
 def run_analyze_dataset(
     data_path: str,
     output_dir: str,
@@ -74,6 +76,10 @@ def run_analyze_dataset(
         species_dict, total_species = scan_species_list(data_path, target_classes)
         print(f"Total extracted species: {total_species}")
         image_counts = scan_image_counts(data_path, target_classes)
+        add_counters(
+            species=total_species,
+            files=sum(count for counts in image_counts.values() for count in counts.values()),
+        )
 
         write_data_to_json(species_output_path, "Species list", species_dict)
         write_data_to_json(counts_path, "Image composition", image_counts)
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import List, Tuple
 from dataset_builder.analysis.matching import (
     cross_reference_set,
 )
+from dataset_builder.core.events import add_counters, traced
 from dataset_builder.core.exceptions import FailedOperation
 from dataset_builder.core.log import log
 from dataset_builder.core.utility import (
@@ -18,6 +19,7 @@ def _check_json_files_exist(*paths: str) -> bool:
     return all(_is_json_file(p) for p in paths)
 
 
+@traced("cross_reference")
 def run_cross_reference(
     output_file_path: str,
     json_1_path: str,
@@ -78,6 +80,7 @@ def run_cross_reference(
     )
 
     log(f"Total matches: {total_matches}", verbose)
+    add_counters(species=total_matches)
 
     write_data_to_json(output_file_path, display_name, match_species)
     return match_species, total_matches
\ No newline at end of file
@@ -1,7 +1,9 @@
 import os
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
+from dataset_builder.core.archive import filter_counts, is_archive, load_archive_index
 from dataset_builder.core.log import log
+from dataset_builder.core.storage import is_local_dir, open_storage
 from dataset_builder.core.constants import IGNORE_DIRS
 from dataset_builder.core.utility import (
     read_species_from_json,
@@ -15,16 +17,39 @@ def _is_valid_class_dir(path: str, name: str) -> bool:
     return os.path.isdir(path) and name not in IGNORE_DIRS
 
 
+def _scan_storage(data_path: str, target_classes: Optional[List[str]]) -> Dict[str, Dict[str, int]]:
+    """Image counts of a non-local dataset (zip archive, S3 bucket), one listing per class."""
+    storage = open_storage(data_path)
+    dataset_props: Dict[str, Dict[str, int]] = {}
+    for class_name in storage.list_dir().dirs:
+        if (target_classes and class_name not in target_classes) or class_name in IGNORE_DIRS:
+            continue
+        class_props = dataset_props[class_name] = {}
+        for species in storage.list_dir(class_name).dirs:
+            files = storage.list_dir(f"{class_name}/{species}").files
+            class_props[species] = sum(1 for f in files if f.lower().endswith(IMAGE_EXTENSION))
+    return dataset_props
+
+
 def scan_species_list(
     data_path: str, target_classes: Optional[List[str]] = None
 ) -> Tuple[SpeciesDict, int]:
     """
     Scan directory structure.
 
+    `data_path` may also be a tar archive (.tar, .tar.gz, .tgz), in which case
+    the species are read from its cached index, see `load_archive_index`, or a
+    zip archive or `s3://` URL, listed through `open_storage`.
+
     Returns:
         SpeciesDict (Dict[str, list[str]]): Dictionary containing classes as keys and their species as values.
     """
 
+    if is_archive(data_path) or not is_local_dir(data_path):
+        counts = scan_image_counts(data_path, target_classes)
+        archive_species = {name: list(species) for name, species in counts.items()}
+        return archive_species, sum(len(species) for species in archive_species.values())
+
     species_counter = 0
     species_dict = defaultdict(list)
     for class_name in os.listdir(data_path):
@@ -51,11 +76,18 @@ def scan_image_counts(
     """
     Counts number of images per species under each class.
     Only image ends with .jpg is counted.
+    For a tar archive, the counts come from its index instead of a directory walk;
+    zip archives and `s3://` URLs are listed through their storage backend.
 
     Returns:
         Dict(str, Dict[str, int]): Dictionary contains class as key, an inner dictionary as values.
         The inner dictionary contains species as keys and their representations as values.
     """
+    if is_archive(data_path):
+        return filter_counts(load_archive_index(data_path), target_classes)
+    if not is_local_dir(data_path):
+        return _scan_storage(data_path, target_classes)
+
     dataset_props: Dict[str, Dict[str, int]] = defaultdict(dict)
     for class_name in os.listdir(data_path):
         if target_classes and class_name not in target_classes:
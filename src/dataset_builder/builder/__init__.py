@@ -1,3 +1,16 @@
-from .copy_matched_species import run_copy_matched_species
-# from .web_crawl import run_web_crawl
-from .web_crawl import run_web_crawl
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from dataset_builder._lazy import lazy_exports
+
+_EXPORTS = {
+    "run_copy_matched_species": ".copy_matched_species",
+    "run_copy_plan": ".copy_matched_species",
+    "run_verify_copy": ".copy_matched_species",
+    "run_web_crawl": ".web_crawl",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .copy_matched_species import run_copy_matched_species, run_copy_plan, run_verify_copy
+    from .web_crawl import run_web_crawl
@@ -1,8 +1,26 @@
+import errno
+import json
+import os
 import shutil
-from typing import Tuple, Iterator
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, List, Tuple, Iterator, Optional
 from enum import Enum
-from dataset_builder.builder.walker import CopyTask
+from dataset_builder.builder.journal import CopyJournal
+from dataset_builder.builder.walker import CopyOrder, CopyTask
 from dataset_builder.core.log import log
+from dataset_builder.core.storage import Storage, join_key
+
+TEMP_SUFFIX = ".part"
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+# Errors meaning "this kernel/filesystem cannot do it", after which the next backend is tried
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF,
+                    errno.ENOTSOCK}
 
 
 class CopyStatus(Enum):
@@ -11,7 +29,361 @@ class CopyStatus(Enum):
     MISSING = 3
 
 
-def copy_one_species_data(task: CopyTask, verbose: bool = False) -> CopyStatus:
+class CopyBackend(Enum):
+    AUTO = "auto"
+    COPY_FILE_RANGE = "copy_file_range"
+    SENDFILE = "sendfile"
+    BUFFERED = "buffered"
+    SHUTIL = "shutil"
+
+
+@dataclass
+class SpeciesTiming:
+    """Work done and time spent on one species."""
+    species_class: str
+    species: str
+    files: int = 0
+    bytes: int = 0
+    stat_seconds: float = 0.0  # listing, existence checks and mkdir
+    throttle_seconds: float = 0.0  # waiting on the bandwidth/file-rate limits
+    copy_seconds: float = 0.0  # moving file data
+    other_seconds: float = 0.0  # the rest: logging, progress callbacks, Python overhead
+
+    @property
+    def total_seconds(self) -> float:
+        return self.stat_seconds + self.throttle_seconds + self.copy_seconds + self.other_seconds
+
+
+@dataclass
+class CopyStats:
+    """Per-species timings collected by `copy_all_species`, with an end-of-run summary."""
+    species: List[SpeciesTiming] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def files(self) -> int:
+        return sum(timing.files for timing in self.species)
+
+    @property
+    def bytes(self) -> int:
+        return sum(timing.bytes for timing in self.species)
+
+    def summary(self, top: int = 5) -> str:
+        stat_seconds = sum(timing.stat_seconds for timing in self.species)
+        throttle_seconds = sum(timing.throttle_seconds for timing in self.species)
+        copy_seconds = sum(timing.copy_seconds for timing in self.species)
+        other_seconds = sum(timing.other_seconds for timing in self.species)
+        wall = self.wall_seconds or sum(timing.total_seconds for timing in self.species) or 1e-9
+        lines = [
+            f"Copied {self.files} files ({self.bytes / 1e6:.1f} MB) in {wall:.1f}s: "
+            f"{self.files / wall:.0f} files/s, {self.bytes / wall / 1e6:.1f} MB/s",
+            f"Time split (summed over workers): stat/mkdir {stat_seconds:.1f}s | data copy {copy_seconds:.1f}s | "
+            f"other (Python, logging) {other_seconds:.1f}s",
+            f"Throttle wait (summed over workers): {throttle_seconds:.1f}s",
+        ]
+        slowest = sorted(self.species, key=lambda t: t.total_seconds, reverse=True)[:top]
+        if slowest:
+            lines.append(f"Slowest {len(slowest)} species:")
+            for timing in slowest:
+                lines.append(
+                    f"\t{timing.species_class}/{timing.species}: {timing.total_seconds:.2f}s, "
+                    f"{timing.files} files, {timing.bytes / 1e6:.1f} MB"
+                )
+        return "\n".join(lines)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by all copy workers.
+
+    `acquire` reserves tokens immediately and sleeps off any deficit, so concurrent
+    callers are served in order and the long-run rate never exceeds `rate`, even for
+    requests larger than the burst size. A `rate` of None means unlimited.
+    """
+
+    def __init__(self, rate: Optional[float], burst_seconds: float = 1.0):
+        self._lock = threading.Lock()
+        self._burst_seconds = burst_seconds
+        self._updated = time.monotonic()
+        self.rate: Optional[float] = None
+        self._tokens = 0.0
+        self.set_rate(rate)
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        with self._lock:
+            self.rate = rate if rate and rate > 0 else None
+            self._tokens = min(self._tokens, self._capacity())
+
+    def _capacity(self) -> float:
+        return self.rate * self._burst_seconds if self.rate else 0.0
+
+    def acquire(self, amount: float) -> float:
+        """Takes `amount` tokens, sleeping as needed. Returns the time slept."""
+        with self._lock:
+            if self.rate is None:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self._capacity(), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class CopyScheduler:
+    """
+    Caps copy bandwidth (MB/s) and file rate (files/s) across all copy workers.
+
+    Limits can be changed while a copy runs by editing `control_file`, a JSON object
+    such as `{"max_mb_per_s": 50, "max_files_per_s": 200}` (null lifts a limit). The
+    file is re-read at most every `reload_interval` seconds, and only if its mtime changed.
+    """
+
+    def __init__(
+        self,
+        max_mb_per_s: Optional[float] = None,
+        max_files_per_s: Optional[float] = None,
+        control_file: Optional[str] = None,
+        reload_interval: float = 2.0,
+    ):
+        self.bytes_bucket = TokenBucket(max_mb_per_s * 1e6 if max_mb_per_s else None)
+        self.files_bucket = TokenBucket(max_files_per_s)
+        self.control_file = control_file
+        self.reload_interval = reload_interval
+        self._next_check = 0.0
+        self._control_mtime: Optional[float] = None
+        self._reload_lock = threading.Lock()
+        self.reload()
+
+    @property
+    def max_mb_per_s(self) -> Optional[float]:
+        rate = self.bytes_bucket.rate
+        return rate / 1e6 if rate else None
+
+    @property
+    def max_files_per_s(self) -> Optional[float]:
+        return self.files_bucket.rate
+
+    def set_limits(self, max_mb_per_s: Optional[float], max_files_per_s: Optional[float]) -> None:
+        self.bytes_bucket.set_rate(max_mb_per_s * 1e6 if max_mb_per_s else None)
+        self.files_bucket.set_rate(max_files_per_s)
+
+    def reload(self) -> None:
+        """Applies the limits from `control_file` if it changed since the last check."""
+        if not self.control_file:
+            return
+        try:
+            mtime = os.path.getmtime(self.control_file)
+        except OSError:
+            return
+        if mtime == self._control_mtime:
+            return
+        self._control_mtime = mtime
+        try:
+            with open(self.control_file, "r", encoding="utf-8") as f:
+                limits = json.load(f)
+        except (OSError, ValueError) as e:
+            log(f"Ignoring unreadable copy control file {self.control_file}: {e}", True, "WARNING")
+            return
+        self.set_limits(
+            limits.get("max_mb_per_s", self.max_mb_per_s),
+            limits.get("max_files_per_s", self.max_files_per_s),
+        )
+        log(f"Copy limits: {self.max_mb_per_s or 'unlimited'} MB/s, {self.max_files_per_s or 'unlimited'} files/s", True)
+
+    def throttle(self, nbytes: int) -> None:
+        """Accounts for one file of `nbytes`, blocking until both limits allow it."""
+        if self.control_file and time.monotonic() >= self._next_check:
+            with self._reload_lock:
+                if time.monotonic() >= self._next_check:
+                    self._next_check = time.monotonic() + self.reload_interval
+                    self.reload()
+        self.files_bucket.acquire(1)
+        self.bytes_bucket.acquire(nbytes)
+
+
+def _available_backends(backend: CopyBackend) -> Tuple[CopyBackend, ...]:
+    """
+    Backends to try, in order, for the requested one.
+
+    Backends missing from this platform's `os` module are left out. AUTO only uses
+    `sendfile` on Linux: elsewhere (macOS, BSD) it can only write to sockets.
+    """
+    copy_file_range = [CopyBackend.COPY_FILE_RANGE] if hasattr(os, "copy_file_range") else []
+    sendfile = [CopyBackend.SENDFILE] if hasattr(os, "sendfile") else []
+    if backend is CopyBackend.AUTO:
+        linux_sendfile = sendfile if sys.platform.startswith("linux") else []
+        return tuple(copy_file_range + linux_sendfile + [CopyBackend.BUFFERED])
+    if backend is CopyBackend.COPY_FILE_RANGE:
+        return tuple(copy_file_range + sendfile + [CopyBackend.BUFFERED])
+    if backend is CopyBackend.SENDFILE:
+        return tuple(sendfile + [CopyBackend.BUFFERED])
+    return (backend,)
+
+
+class ShortCopyError(OSError):
+    """A backend stopped before copying the whole file (e.g. it returned 0 early or the source shrank)."""
+
+
+def _copy_range(src_fd: int, dst_fd: int, size: int, backend: CopyBackend) -> None:
+    """
+    Copies `size` bytes from offset 0 with one backend, entirely inside the kernel when possible.
+
+    Raises:
+        ShortCopyError: If fewer than `size` bytes were copied.
+    """
+    offset = 0
+    if backend is CopyBackend.COPY_FILE_RANGE:
+        while offset < size:
+            copied = os.copy_file_range(src_fd, dst_fd, min(size - offset, COPY_BUFFER_SIZE), offset, offset)
+            if copied == 0:
+                break
+            offset += copied
+    elif backend is CopyBackend.SENDFILE:
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        while offset < size:
+            copied = os.sendfile(dst_fd, src_fd, offset, min(size - offset, COPY_BUFFER_SIZE))
+            if copied == 0:
+                break
+            offset += copied
+    else:
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        while True:
+            chunk = os.read(src_fd, COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            offset += len(chunk)
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(dst_fd, view):]
+    if offset < size:
+        raise ShortCopyError(f"{backend.value} copied {offset} of {size} bytes")
+
+
+def copy_file_data(
+    src: Path,
+    dst: Path,
+    backend: CopyBackend = CopyBackend.AUTO,
+    fadvise: bool = False,
+) -> int:
+    """
+    Copies a file's data, permission bits and timestamps with as few syscalls as possible.
+
+    On Linux the data is moved with `os.copy_file_range` (in-kernel, reflinks or
+    server-side copies where the filesystem supports them), falling back to
+    `os.sendfile` and then to a large-buffer read/write loop when a backend is not
+    supported for this pair of files. Metadata is copied with a single `fchmod`
+    and `utime`, instead of the full `shutil.copystat` sequence.
+
+    Args:
+        src (Path): Source file.
+        dst (Path): Destination file, created or truncated.
+        backend (CopyBackend): Preferred backend. `SHUTIL` uses `shutil.copy2` as before.
+        fadvise (bool): Hint the kernel that the source is read sequentially (`posix_fadvise`).
+
+    Returns:
+        int: Number of bytes copied.
+    """
+    if backend is CopyBackend.SHUTIL:
+        shutil.copy2(src, dst)
+        return dst.stat().st_size
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        src_stat = os.fstat(src_fd)
+        if fadvise and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            chain = _available_backends(backend)
+            for i, candidate in enumerate(chain):
+                try:
+                    _copy_range(src_fd, dst_fd, src_stat.st_size, candidate)
+                    break
+                except OSError as e:
+                    fallback = isinstance(e, ShortCopyError) or e.errno in _FALLBACK_ERRNOS
+                    if not fallback or i == len(chain) - 1:
+                        raise
+                    os.ftruncate(dst_fd, 0)
+            if hasattr(os, "fchmod"):
+                os.fchmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+        finally:
+            os.close(dst_fd)
+        if not hasattr(os, "fchmod"):  # Windows before Python 3.13
+            os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    finally:
+        os.close(src_fd)
+    return src_stat.st_size
+
+
+def temp_path_for(target: Path) -> Path:
+    """
+    Hidden, deterministic temp name next to `target` (`.<name>.part`), so a rerun overwrites leftovers.
+
+    Every writer that renames files into the dataset (`atomic_copy`, archive extraction)
+    uses it, so interrupted runs leave a single recognizable kind of leftover.
+    """
+    return target.with_name(f".{target.name}{TEMP_SUFFIX}")
+
+
+def atomic_copy(
+    src: Path,
+    target: Path,
+    backend: CopyBackend = CopyBackend.AUTO,
+    scheduler: Optional[CopyScheduler] = None,
+) -> int:
+    """
+    Copies `src` to `target` through a temp file that is renamed into place.
+
+    The rename is atomic on POSIX filesystems, so `target` is either absent or
+    complete, never truncated, even if the process is killed mid-copy.
+    With a `scheduler`, the copy waits for its bandwidth and file-rate tokens first.
+
+    Returns:
+        int: Number of bytes copied.
+    """
+    tmp = temp_path_for(target)
+    if scheduler is not None:
+        scheduler.throttle(os.stat(src).st_size)
+    try:
+        size = copy_file_data(src, tmp, backend)
+        os.replace(tmp, target)
+        return size
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+
+
+def list_source_files(src_dir: Path, order: CopyOrder = CopyOrder.LISTING) -> List[Path]:
+    """
+    Lists the regular files of a species directory in the requested order.
+
+    Inode numbers come from `readdir` (`DirEntry.inode()`), so `CopyOrder.INODE`
+    costs no extra stat call per file.
+    """
+    with os.scandir(src_dir) as entries:
+        files = [entry for entry in entries if entry.is_file()]
+    if order is CopyOrder.INODE:
+        files.sort(key=lambda entry: entry.inode())
+    elif order is CopyOrder.NAME:
+        files.sort(key=lambda entry: entry.name)
+    return [Path(entry.path) for entry in files]
+
+
+def copy_one_species_data(
+    task: CopyTask,
+    verbose: bool = False,
+    backend: CopyBackend = CopyBackend.AUTO,
+    stats: Optional[CopyStats] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    scheduler: Optional[CopyScheduler] = None,
+    order: CopyOrder = CopyOrder.LISTING,
+) -> CopyStatus:
     """
     Copies all image files of a single species from the source to the destination directory.
 
@@ -26,6 +398,14 @@ def copy_one_species_data(task: CopyTask, verbose: bool = False) -> CopyStatus:
             - src_dir (Path): Path to the source directory.
             - dst_dir (Path): Path to the destination directory.
         verbose (bool, optional): Whether to print detailed log messages. Defaults to False.
+        backend (CopyBackend, optional): File copy backend, see `copy_file_data`. Defaults to AUTO.
+        stats (Optional[CopyStats], optional): Collects this species' file/byte counts and the time
+            spent in stat/mkdir, throttle waits, data copy and everything else. Defaults to None.
+        progress (Optional[Callable[[int], None]], optional): Called with the size of every copied file.
+            Defaults to None.
+        scheduler (Optional[CopyScheduler], optional): Shared bandwidth/file-rate limiter. Defaults to None.
+        order (CopyOrder, optional): Order in which the species' files are copied, see
+            `list_source_files`. Defaults to LISTING.
 
     Returns:
         CopyStatus: 
@@ -34,28 +414,58 @@ def copy_one_species_data(task: CopyTask, verbose: bool = False) -> CopyStatus:
             - `CopyStatus.MISSING` if the source directory does not exist.
     """
     species_class, species, src_dir, dst_dir = task
+    timing = SpeciesTiming(species_class, species)
+    started = time.perf_counter()
     if not src_dir.exists():
         log(f"Missing source directory: {src_dir}", True, "ERROR")
         return CopyStatus.MISSING
-    
+
     dst_dir.mkdir(parents=True, exist_ok=True)
+    source_files = list_source_files(src_dir, order)
+    timing.stat_seconds += time.perf_counter() - started
     did_copied = False
 
-    for image_file in src_dir.iterdir():
-        if image_file.is_file():
-            target = dst_dir / image_file.name
-            if not target.exists():
-                shutil.copy2(image_file, target)
-                log(f"Copied {species_class}/{species}/{image_file.name}", verbose)
-                did_copied = True
-            else:
-                log(f"Skipping existing {species_class}/{species}/{image_file.name}", verbose)
+    for image_file in source_files:
+        target = dst_dir / image_file.name
+        checked = time.perf_counter()
+        exists = target.exists()
+        timing.stat_seconds += time.perf_counter() - checked
+        if not exists:
+            if scheduler is not None:
+                checked = time.perf_counter()
+                size = image_file.stat().st_size
+                throttle_started = time.perf_counter()
+                timing.stat_seconds += throttle_started - checked
+                scheduler.throttle(size)
+                timing.throttle_seconds += time.perf_counter() - throttle_started
+            copy_started = time.perf_counter()
+            size = atomic_copy(image_file, target, backend)
+            timing.copy_seconds += time.perf_counter() - copy_started
+            timing.files += 1
+            timing.bytes += size
+            if progress is not None:
+                progress(size)
+            log(lambda: f"Copied {species_class}/{species}/{image_file.name}", verbose)
+            did_copied = True
+        else:
+            log(lambda: f"Skipping existing {species_class}/{species}/{image_file.name}", verbose)
+
+    if stats is not None:
+        elapsed = time.perf_counter() - started
+        timing.other_seconds = max(elapsed - timing.stat_seconds - timing.throttle_seconds - timing.copy_seconds, 0.0)
+        stats.species.append(timing)
     return CopyStatus.COPIED if did_copied else CopyStatus.SKIPPED
 
 
 def copy_all_species(
     tasks: Iterator[CopyTask],
-    verbose: bool = False
+    verbose: bool = False,
+    journal: Optional[CopyJournal] = None,
+    backend: CopyBackend = CopyBackend.AUTO,
+    stats: Optional[CopyStats] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    scheduler: Optional[CopyScheduler] = None,
+    order: CopyOrder = CopyOrder.LISTING,
 ) -> Tuple[int, int, int]:
     """
     Executes copy operations for multiple species based on the provided tasks.
@@ -65,10 +475,23 @@ def copy_all_species(
     the number of species that were copied, skipped (already exist), or failed 
     due to missing source directories.
 
+    With a `journal`, species it records as finished are counted as skipped without
+    touching the filesystem, and every species that completes is recorded in it.
+
     Args:
         tasks (Iterator[CopyTask]): An iterable of `CopyTask` tuples, each representing
             a species to copy.
         verbose (bool, optional): Whether to print detailed logs. Defaults to False.
+        journal (Optional[CopyJournal], optional): Journal of finished species used to resume
+            an interrupted run. Defaults to None.
+        backend (CopyBackend, optional): File copy backend, see `copy_file_data`. Defaults to AUTO.
+        stats (Optional[CopyStats], optional): Collects per-species timings and the wall-clock
+            time of the run. Defaults to None.
+        progress (Optional[Callable[[int], None]], optional): Called with the size of every copied file.
+            Defaults to None.
+        scheduler (Optional[CopyScheduler], optional): Shared bandwidth/file-rate limiter. Defaults to None.
+        order (CopyOrder, optional): File order within each species, see `list_source_files`.
+            Order the tasks themselves with `order_copy_tasks`. Defaults to LISTING.
 
     Returns:
         Tuple[int, int, int]: A tuple of three integers:
@@ -79,12 +502,114 @@ def copy_all_species(
     copied = 0
     skipped = 0
     missing = 0
+    started = time.perf_counter()
     for task in tasks:
-        status = copy_one_species_data(task, verbose)
+        species_class, species = task[0], task[1]
+        if journal is not None and journal.is_done(species_class, species):
+            skipped += 1
+            continue
+        status = copy_one_species_data(
+            task, verbose, backend=backend, stats=stats, progress=progress, scheduler=scheduler, order=order
+        )
         if status is CopyStatus.COPIED:
             copied += 1
         elif status is CopyStatus.SKIPPED:
             skipped += 1
         else:
             missing += 1
-    return copied, skipped, missing
\ No newline at end of file
+        if journal is not None and status is not CopyStatus.MISSING:
+            journal.mark_done(species_class, species)
+    if stats is not None:
+        stats.wall_seconds += time.perf_counter() - started
+    return copied, skipped, missing
+
+
+def transfer_file(
+    src: Storage,
+    dst: Storage,
+    key: str,
+    size: int,
+    backend: CopyBackend = CopyBackend.AUTO,
+    scheduler: Optional[CopyScheduler] = None,
+) -> int:
+    """
+    Copies one file between storage backends.
+
+    Local-to-local transfers go through `atomic_copy` (kernel copies); anything else
+    reads the file into memory and writes it with the destination's `write_bytes`.
+
+    Returns:
+        int: Number of bytes copied.
+    """
+    src_path, dst_path = src.local_path(key), dst.local_path(key)
+    if src_path is not None and dst_path is not None:
+        return atomic_copy(Path(src_path), Path(dst_path), backend, scheduler)
+    if scheduler is not None:
+        scheduler.throttle(size)
+    data = src.read_bytes(key)
+    dst.write_bytes(key, data)
+    return len(data)
+
+
+def transfer_all_species(
+    src: Storage,
+    dst: Storage,
+    species: Iterable[Tuple[str, str]],
+    verbose: bool = False,
+    max_workers: Optional[int] = 16,
+    backend: CopyBackend = CopyBackend.AUTO,
+    scheduler: Optional[CopyScheduler] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Tuple[int, int, int]:
+    """
+    Copies species between any two storage backends, e.g. a zip archive or an S3 bucket.
+
+    Each species is listed once on both sides (remote listings are cached per class,
+    see `S3Storage`), and its missing files are transferred concurrently on a shared
+    thread pool, which hides per-request latency on object stores.
+
+    Args:
+        src (Storage): Source dataset.
+        dst (Storage): Destination dataset.
+        species (Iterable[Tuple[str, str]]): (class, species) pairs to copy.
+        verbose (bool, optional): Whether to log every copied file. Defaults to False.
+        max_workers (Optional[int], optional): Number of concurrent transfers. Defaults to 16.
+        backend (CopyBackend, optional): Copy backend for local-to-local transfers. Defaults to AUTO.
+        scheduler (Optional[CopyScheduler], optional): Shared bandwidth/file-rate limiter. Defaults to None.
+        progress (Optional[Callable[[int], None]], optional): Called with the size of every copied file.
+            Defaults to None.
+
+    Returns:
+        Tuple[int, int, int]: Number of species copied, skipped and missing, as `copy_all_species`.
+    """
+    copied = 0
+    skipped = 0
+    missing = 0
+
+    def _transfer(key: str, size: int) -> int:
+        nbytes = transfer_file(src, dst, key, size, backend, scheduler)
+        if progress is not None:
+            progress(nbytes)
+        log(lambda: f"Copied {key}", verbose)
+        return nbytes
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for species_class, species_name in species:
+            species_key = join_key(species_class, species_name)
+            try:
+                src_files = src.list_dir(species_key).files
+            except FileNotFoundError:
+                log(f"Missing source directory: {src.uri(species_key)}", True, "ERROR")
+                missing += 1
+                continue
+            try:
+                existing = dst.list_dir(species_key).files
+            except FileNotFoundError:
+                existing = {}
+            to_copy = [(join_key(species_key, name), size) for name, size in src_files.items() if name not in existing]
+            if not to_copy:
+                skipped += 1
+                continue
+            list(executor.map(lambda item: _transfer(*item), to_copy))
+            copied += 1
+    return copied, skipped, missing
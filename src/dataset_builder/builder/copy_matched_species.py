@@ -1,22 +1,141 @@
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from tqdm import tqdm  # type: ignore
 
-from dataset_builder.builder.copier import copy_all_species
+from dataset_builder.builder.copier import CopyBackend, CopyScheduler, CopyStats, copy_all_species, transfer_all_species
+from dataset_builder.builder.extract import extract_matched_species
 from dataset_builder.builder.io import load_matched_species
-from dataset_builder.builder.walker import build_copy_tasks
+from dataset_builder.builder.journal import CopyJournal, journal_path_for
+from dataset_builder.builder.planner import CopyPlan, execute_plan, plan_copy
+from dataset_builder.builder.sync import SyncAction, apply_sync, plan_sync
+from dataset_builder.builder.verify import DigestCache, VerifyReport, digest_cache_path_for, verify_copy
+from dataset_builder.builder.walker import CopyOrder, build_copy_tasks, order_copy_tasks
+from dataset_builder.core.archive import is_archive
+from dataset_builder.core.events import add_counters, traced
 from dataset_builder.core.exceptions import FailedOperation
+from dataset_builder.core.storage import is_local_dir, open_storage
+from dataset_builder.core.utility import SpeciesDict
 
 
+def _run_sync(
+    matched_species: SpeciesDict,
+    target_classes: List[str],
+    src_root: Path,
+    dst_root: Path,
+    total_tasks: int,
+    overwrite: bool,
+    verbose: bool,
+    quarantine_dir: Optional[str],
+    checksum: bool,
+    backend: CopyBackend,
+    scheduler: Optional[CopyScheduler],
+) -> None:
+    """Plans and applies an incremental sync, see `plan_sync` and `apply_sync`."""
+    print(f"Syncing data to {dst_root}")
+    plan = plan_sync(matched_species, target_classes, src_root, dst_root, checksum)
+    missing = len(plan.missing_species)
+    if missing > 0 and not overwrite:
+        raise FailedOperation(f"Missing images in {missing} of {total_tasks} species")
+
+    print(
+        f"Plan: {plan.count(SyncAction.COPY)} new, {plan.count(SyncAction.UPDATE)} updated, "
+        f"{plan.count(SyncAction.DELETE_FILE)} stale files, {plan.count(SyncAction.DELETE_SPECIES)} stale species, "
+        f"{plan.unchanged} unchanged ({plan.bytes_to_copy / 1e6:.1f} MB to copy)"
+    )
+    if not plan.operations:
+        print(f"All {total_tasks - missing} species already up-to-date; nothing to do")
+        return
+    quarantine = Path(quarantine_dir) if quarantine_dir else None
+    apply_sync(plan, dst_root, quarantine, verbose=verbose, backend=backend, scheduler=scheduler)
+    add_counters(files=plan.count(SyncAction.COPY) + plan.count(SyncAction.UPDATE), bytes=plan.bytes_to_copy)
+
+
+def _run_extract(
+    archive_path: str,
+    matched_species: SpeciesDict,
+    target_classes: List[str],
+    dst_root: Path,
+    total_tasks: int,
+    overwrite: bool,
+    verbose: bool,
+    scheduler: Optional[CopyScheduler],
+) -> None:
+    """Extracts the matched species from a tar archive source, see `extract_matched_species`."""
+    print(f"Extracting data from {archive_path} to {dst_root}")
+    result = extract_matched_species(
+        archive_path, dst_root, matched_species, target_classes, verbose, scheduler=scheduler
+    )
+    add_counters(files=result.files, bytes=result.bytes)
+    print(f"Extracted {result.files} files ({result.bytes / 1e6:.1f} MB), skipped {result.skipped} existing")
+    missing = len(result.missing_species)
+    if missing > 0 and not overwrite:
+        raise FailedOperation(f"Missing images in {missing} of {total_tasks} species")
+
+
+def _run_storage_copy(
+    src_location: str,
+    dst_location: str,
+    matched_species: SpeciesDict,
+    target_classes: List[str],
+    total_tasks: int,
+    overwrite: bool,
+    verbose: bool,
+    backend: CopyBackend,
+    scheduler: Optional[CopyScheduler],
+) -> None:
+    """Copies between storage backends (zip, S3, local), see `transfer_all_species`."""
+    src, dst = open_storage(src_location), open_storage(dst_location)
+    print(f"Copying data from {src.uri()} to {dst.uri()}")
+    species = [
+        (species_class, species)
+        for species_class, species_list in matched_species.items()
+        if species_class in target_classes
+        for species in species_list
+    ]
+    with tqdm(desc="Copying", unit="B", unit_scale=True, unit_divisor=1024) as progress_bar:
+        copied, skipped, missing = transfer_all_species(
+            src, dst, species, verbose, backend=backend, scheduler=scheduler, progress=progress_bar.update
+        )
+        add_counters(bytes=progress_bar.n, species=copied)
+    if missing > 0 and not overwrite:
+        raise FailedOperation(f"Missing images in {missing} of {total_tasks} species")
+    elif copied == 0 and skipped > 0:
+        print(f"All {skipped} species already up-to-date; nothing to do")
+
+
+def _make_scheduler(
+    max_mb_per_s: Optional[float],
+    max_files_per_s: Optional[float],
+    control_file: Optional[str],
+) -> Optional[CopyScheduler]:
+    if max_mb_per_s is None and max_files_per_s is None and control_file is None:
+        return None
+    return CopyScheduler(max_mb_per_s, max_files_per_s, control_file)
+
+
+@traced("copy")
 def run_copy_matched_species(
     src_dataset: str,
     dst_dataset: str,
     matched_species_json: str,
     target_classes: List[str],
     overwrite: bool = False,
-    verbose: bool = False
-) -> None:
+    verbose: bool = False,
+    resume: bool = True,
+    sync: bool = False,
+    quarantine_dir: Optional[str] = None,
+    checksum: bool = False,
+    copy_backend: str = "auto",
+    dry_run: bool = False,
+    plan_path: Optional[str] = None,
+    max_mb_per_s: Optional[float] = None,
+    max_files_per_s: Optional[float] = None,
+    throttle_control_file: Optional[str] = None,
+    copy_order: str = "listing",
+    plan_throughput_mb_s: Optional[float] = None,
+    plan_probe_dir: Optional[str] = None,
+) -> Optional[CopyPlan]:
     """
     Copies matched species data from the source dataset to the destination directory.
 
@@ -28,6 +147,20 @@ def run_copy_matched_species(
     copied, skipped (already exist), or missing (source directory does not exist).
     If any species are missing and `overwrite` is False, the function raises a `FailedOperation`.
 
+    `src_dataset` may also be a tar archive (.tar, .tar.gz, .tgz) of the dataset, such as
+    iNaturalist's `train_val_images.tar.gz`: the matched species are then extracted from it
+    in one streaming pass, without unpacking the rest (see `extract_matched_species`).
+    Either side may also be a zip archive (source only) or an `s3://bucket/prefix` URL, in
+    which case files are transferred through the storage backends of `open_storage`.
+
+    Finished species are recorded in a journal next to `dst_dataset` (`<dst_dataset>.copy_journal`).
+    If the run is interrupted, the next run skips them without re-checking their files;
+    the journal is removed once a run completes.
+
+    With `sync`, files are compared by size and mtime (and optionally digest) instead of
+    existence only: changed files are refreshed, and files or species no longer in the
+    matched JSON are deleted from `dst_dataset`, or moved to `quarantine_dir`.
+
     Args:
         src_dataset (str): Path to the source dataset directory.
         dst_dataset (str): Path to the destination dataset directory.
@@ -35,23 +168,208 @@ def run_copy_matched_species(
         target_classes (List[str]): List of species classes to filter and copy.
         overwrite (bool, optional): Whether to ignore missing species and proceed anyway. Defaults to False.
         verbose (bool, optional): Whether to print detailed logs during copy. Defaults to False.
+        resume (bool, optional): Whether to resume from the journal of an interrupted run. Defaults to True.
+        sync (bool, optional): Run an rsync-style incremental sync instead of a plain copy. Defaults to False.
+        quarantine_dir (Optional[str], optional): In sync mode, move stale files and species here
+            instead of deleting them. Defaults to None.
+        checksum (bool, optional): In sync mode, also compare BLAKE2 digests of files whose size
+            and mtime match. Defaults to False.
+        copy_backend (str, optional): "auto", "copy_file_range", "sendfile", "buffered" or "shutil".
+            "auto" uses in-kernel copies where available. Defaults to "auto".
+        dry_run (bool, optional): Only plan the copy: stat every file in one parallel pass, print
+            files to copy/skip, bytes and ETA per class, and return the plan. Nothing is written
+            to `dst_dataset`. Defaults to False.
+        plan_path (Optional[str], optional): In dry-run mode, also save the plan here so it can
+            be executed later with `run_copy_plan`. Defaults to None.
+        max_mb_per_s (Optional[float], optional): Bandwidth ceiling shared by all copy workers.
+            Defaults to None (unlimited).
+        max_files_per_s (Optional[float], optional): File-rate ceiling shared by all copy workers.
+            Defaults to None (unlimited).
+        throttle_control_file (Optional[str], optional): JSON file with `max_mb_per_s` and
+            `max_files_per_s` keys; editing it changes the limits of the running copy. Defaults to None.
+        copy_order (str, optional): "listing", "name" or "inode". "inode" walks species and files
+            in inode order, which avoids random seeks on spinning disks and cold NFS caches.
+            Defaults to "listing".
+        plan_throughput_mb_s (Optional[float], optional): In dry-run mode, copy throughput used
+            for the ETA. Defaults to None.
+        plan_probe_dir (Optional[str], optional): In dry-run mode, measure the throughput by
+            copying a sample of the files into this scratch directory (through the bandwidth
+            limits) when `plan_throughput_mb_s` is not given. Without either, no ETA is printed.
+            Defaults to None.
+
+    Returns:
+        Optional[CopyPlan]: The plan in dry-run mode, None otherwise.
 
     Raises:
-        FailedOperation: If some species are missing in the source dataset and `overwrite` is False.
+        FailedOperation: If some species are missing in the source dataset and `overwrite` is False,
+            or if `sync` or `dry_run` is requested for a source or destination that is not a local directory.
     """
     matched_species = load_matched_species(matched_species_json)
+    backend = CopyBackend(copy_backend)
+    scheduler = _make_scheduler(max_mb_per_s, max_files_per_s, throttle_control_file)
 
     total_tasks = sum(
         len(species_list)
         for species_class, species_list in matched_species.items()
         if species_class in target_classes
     )
-    tasks = build_copy_tasks(matched_species, target_classes, Path(src_dataset), Path(dst_dataset))
+    if not (is_local_dir(src_dataset) and is_local_dir(dst_dataset)):
+        if sync or dry_run:
+            raise FailedOperation("Sync and dry-run modes need a local directory source and destination")
+        if is_archive(src_dataset) and is_local_dir(dst_dataset):
+            _run_extract(
+                src_dataset, matched_species, target_classes, Path(dst_dataset),
+                total_tasks, overwrite, verbose, scheduler,
+            )
+        else:
+            _run_storage_copy(
+                src_dataset, dst_dataset, matched_species, target_classes,
+                total_tasks, overwrite, verbose, backend, scheduler,
+            )
+        return None
+
+    if dry_run:
+        tasks = build_copy_tasks(matched_species, target_classes, Path(src_dataset), Path(dst_dataset))
+        plan = plan_copy(
+            tasks,
+            Path(plan_probe_dir) if plan_probe_dir else None,
+            throughput_mb_s=plan_throughput_mb_s,
+            scheduler=scheduler,
+        )
+        print(plan.summary())
+        if plan_path:
+            plan.save(plan_path)
+            print(f"Copy plan → {plan_path}")
+        return plan
+
+    if sync:
+        _run_sync(
+            matched_species, target_classes, Path(src_dataset), Path(dst_dataset),
+            total_tasks, overwrite, verbose, quarantine_dir, checksum, backend, scheduler,
+        )
+        return None
+
+    order = CopyOrder(copy_order)
+    tasks = order_copy_tasks(
+        build_copy_tasks(matched_species, target_classes, Path(src_dataset), Path(dst_dataset)), order
+    )
 
     print(f"Copying data to {dst_dataset}")
-    tasks_with_progress = tqdm(tasks, total=total_tasks, desc="Species", unit="species")
-    copied, skipped, missing = copy_all_species(tasks_with_progress, verbose)
+    stats = CopyStats()
+    progress_bar = tqdm(desc="Copying", unit="B", unit_scale=True, unit_divisor=1024)
+    species_done = 0
+
+    def _on_file_copied(size: int) -> None:
+        progress_bar.update(size)
+
+    def _tasks_with_progress():
+        nonlocal species_done
+        for task in tasks:
+            yield task
+            species_done += 1
+            progress_bar.set_postfix(files=stats.files, species=f"{species_done}/{total_tasks}")
+
+    journal = CopyJournal(journal_path_for(dst_dataset)) if resume else None
+    if journal is not None and len(journal) > 0:
+        print(f"Resuming interrupted copy: {len(journal)} species already done")
+    try:
+        copied, skipped, missing = copy_all_species(
+            _tasks_with_progress(), verbose, journal, backend,
+            stats=stats, progress=_on_file_copied, scheduler=scheduler, order=order,
+        )
+    finally:
+        progress_bar.close()
+        if journal is not None:
+            journal.close()
+
+    add_counters(files=stats.files, bytes=stats.bytes, species=copied)
+    if stats.files > 0:
+        print(stats.summary())
+    if journal is not None and (missing == 0 or overwrite):
+        journal.discard()
     if missing > 0 and not overwrite:
         raise FailedOperation(f"Missing images in {missing} of {total_tasks} species")
     elif copied == 0 and skipped > 0:
-        print(f"All {skipped} species already up-to-date; nothing to do")
\ No newline at end of file
+        print(f"All {skipped} species already up-to-date; nothing to do")
+    return None
+
+
+@traced("copy")
+def run_copy_plan(
+    plan_path: str,
+    overwrite: bool = False,
+    verbose: bool = False,
+    copy_backend: str = "auto",
+    max_mb_per_s: Optional[float] = None,
+    max_files_per_s: Optional[float] = None,
+    throttle_control_file: Optional[str] = None,
+) -> None:
+    """
+    Executes a copy plan saved by `run_copy_matched_species(dry_run=True, plan_path=...)`.
+
+    Only the files the plan marked for copy are copied; the trees are not re-scanned.
+
+    Args:
+        plan_path (str): Path to the saved plan.
+        overwrite (bool, optional): Whether to proceed when the plan lists missing species. Defaults to False.
+        verbose (bool, optional): Whether to print detailed logs during copy. Defaults to False.
+        copy_backend (str, optional): File copy backend, see `run_copy_matched_species`. Defaults to "auto".
+        max_mb_per_s (Optional[float], optional): Bandwidth ceiling, see `run_copy_matched_species`.
+        max_files_per_s (Optional[float], optional): File-rate ceiling, see `run_copy_matched_species`.
+        throttle_control_file (Optional[str], optional): Runtime limits file, see `run_copy_matched_species`.
+
+    Raises:
+        FailedOperation: If the plan lists missing species and `overwrite` is False.
+    """
+    plan = CopyPlan.load(plan_path)
+    missing = len(plan.missing_species)
+    if missing > 0 and not overwrite:
+        raise FailedOperation(f"Copy plan lists {missing} missing species")
+    scheduler = _make_scheduler(max_mb_per_s, max_files_per_s, throttle_control_file)
+    files, copied_bytes = execute_plan(plan, verbose, CopyBackend(copy_backend), scheduler=scheduler)
+    add_counters(files=files, bytes=copied_bytes)
+    print(f"Copied {files} files ({copied_bytes / 1e6:.1f} MB) from plan {plan_path}")
+
+
+@traced("verify")
+def run_verify_copy(
+    src_dataset: str,
+    dst_dataset: str,
+    matched_species_json: str,
+    target_classes: List[str],
+    checksum: Optional[str] = None,
+    report_path: Optional[str] = None,
+    use_cache: bool = True,
+) -> VerifyReport:
+    """
+    Verifies that `dst_dataset` holds an identical copy of the matched species.
+
+    Files are compared by size, and by digest when `checksum` is "blake2b" or "xxhash".
+    Digests are cached in a sidecar file next to `dst_dataset` (`<dst_dataset>.digests.json`),
+    so verifying again only hashes files whose size or mtime changed.
+
+    Args:
+        src_dataset (str): Path to the source dataset directory.
+        dst_dataset (str): Path to the destination dataset directory.
+        matched_species_json (str): Path to the matched species JSON used for the copy.
+        target_classes (List[str]): Classes to verify.
+        checksum (Optional[str], optional): Digest algorithm, or None for a size-only check. Defaults to None.
+        report_path (Optional[str], optional): Where to save the JSON report of mismatched species. Defaults to None.
+        use_cache (bool, optional): Whether to read and update the sidecar digest cache. Defaults to True.
+
+    Returns:
+        VerifyReport: The verification report; `report.ok` is True when everything matched.
+    """
+    matched_species = load_matched_species(matched_species_json)
+    cache = DigestCache(digest_cache_path_for(dst_dataset) if use_cache else None)
+    print(f"Verifying {dst_dataset} against {src_dataset}")
+    report = verify_copy(
+        matched_species, target_classes, Path(src_dataset), Path(dst_dataset), checksum, cache=cache
+    )
+    cache.save()
+    add_counters(files=report.files_checked, hashed=report.files_hashed, mismatched_species=len(report.mismatches))
+    print(report.summary())
+    if report_path:
+        report.save(report_path)
+        print(f"Verification report → {report_path}")
+    return report
@@ -0,0 +1,120 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, List, Optional, Set, Tuple
+
+from dataset_builder.builder.copier import CopyScheduler, temp_path_for
+from dataset_builder.core.archive import open_archive_stream, split_member_name
+from dataset_builder.core.log import log
+from dataset_builder.core.utility import SpeciesDict
+
+MAX_PENDING_WRITES = 64
+
+
+@dataclass
+class ExtractResult:
+    files: int = 0
+    bytes: int = 0
+    skipped: int = 0
+    missing_species: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def _write_member(data: bytes, target: Path, mtime: float) -> int:
+    """Writes one extracted image through a temp file renamed into place, like `atomic_copy`."""
+    tmp = temp_path_for(target)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.utime(tmp, (mtime, mtime))
+        os.replace(tmp, target)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+    return len(data)
+
+
+def extract_matched_species(
+    archive_path: str,
+    dst_root: Path,
+    matched_species: SpeciesDict,
+    target_classes: List[str],
+    verbose: bool = False,
+    use_pigz: bool = True,
+    max_workers: Optional[int] = 4,
+    scheduler: Optional[CopyScheduler] = None,
+) -> ExtractResult:
+    """
+    Extracts the matched species' images from a tar archive in a single streaming pass.
+
+    Only members whose class and species are matched are read; everything else is
+    skipped in the stream, so the archive never has to be unpacked in full. Images
+    are written straight to `dst_root/<class>/<species>/` by a small thread pool while
+    the main thread keeps decompressing (with `pigz` when available, see
+    `open_archive_stream`). Files that already exist at the destination are skipped.
+
+    Args:
+        archive_path (str): Path to the .tar, .tar.gz or .tgz archive.
+        dst_root (Path): Root of the destination dataset.
+        matched_species (SpeciesDict): Species to extract, grouped by class.
+        target_classes (List[str]): Classes of `matched_species` to extract.
+        verbose (bool): Whether to log every extracted file.
+        use_pigz (bool): Decompress with `pigz` when it is installed.
+        max_workers (Optional[int]): Number of writer threads.
+        scheduler (Optional[CopyScheduler]): Bandwidth/file-rate limiter for the writes.
+
+    Returns:
+        ExtractResult: Files and bytes written, files skipped, and the matched species
+        that do not appear in the archive.
+    """
+    wanted: Set[Tuple[str, str]] = {
+        (species_class, species)
+        for species_class, species_list in matched_species.items()
+        if species_class in target_classes
+        for species in species_list
+    }
+    seen: Set[Tuple[str, str]] = set()
+    created_dirs: Set[Path] = set()
+    result = ExtractResult()
+    pending: Deque[Future] = deque()
+
+    def _collect(future: Future) -> None:
+        result.bytes += future.result()
+        result.files += 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            open_archive_stream(archive_path, use_pigz) as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            parsed = split_member_name(member.name)
+            if parsed is None or (parsed[0], parsed[1]) not in wanted:
+                continue
+            species_class, species, filename = parsed
+            seen.add((species_class, species))
+
+            species_dir = dst_root / species_class / species
+            if species_dir not in created_dirs:
+                species_dir.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(species_dir)
+            target = species_dir / filename
+            if target.exists():
+                result.skipped += 1
+                log(lambda: f"Skipping existing {species_class}/{species}/{filename}", verbose)
+                continue
+
+            if scheduler is not None:
+                scheduler.throttle(member.size)
+            data = tar.extractfile(member).read()  # type: ignore[union-attr]
+            pending.append(executor.submit(_write_member, data, target, member.mtime))
+            log(lambda: f"Extracted {species_class}/{species}/{filename}", verbose)
+            # Bound the memory held by queued writes
+            while len(pending) > MAX_PENDING_WRITES:
+                _collect(pending.popleft())
+        while pending:
+            _collect(pending.popleft())
+
+    result.missing_species = sorted(wanted - seen)
+    return result
@@ -0,0 +1,72 @@
+import json
+import os
+from typing import Optional, Set, TextIO, Tuple
+
+
+class CopyJournal:
+    """
+    Append-only record of the species a copy run has fully finished.
+
+    Each finished species is written as one JSON line (`["Aves", "Parus major"]`)
+    and flushed to disk immediately, so an interrupted run can resume without
+    re-checking the species it already completed. A torn last line left by a
+    crash is ignored on load.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._done: Set[Tuple[str, str]] = set()
+        self._handle: Optional[TextIO] = None
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        species_class, species = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._done.add((species_class, species))
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def __enter__(self) -> "CopyJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def is_done(self, species_class: str, species: str) -> bool:
+        """Returns True if the species was recorded as finished."""
+        return (species_class, species) in self._done
+
+    def mark_done(self, species_class: str, species: str) -> None:
+        """Durably records a species as finished."""
+        if self._handle is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._handle = open(self.path, "a", encoding="utf-8")
+        self._handle.write(json.dumps([species_class, species]) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._done.add((species_class, species))
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def discard(self) -> None:
+        """Closes and deletes the journal, once the run it tracks has completed."""
+        self.close()
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+        self._done.clear()
+
+
+def journal_path_for(dst_dataset: str) -> str:
+    """
+    Returns the journal location for a destination dataset.
+
+    The journal sits next to the dataset rather than inside it, so scanners walking
+    `dst_dataset` never mistake it for a class directory.
+    """
+    return os.path.normpath(dst_dataset) + ".copy_journal"
@@ -0,0 +1,226 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from dataset_builder.builder.copier import CopyBackend, CopyScheduler, atomic_copy
+from dataset_builder.builder.walker import CopyTask
+from dataset_builder.core.log import log
+
+DEFAULT_PROBE_BYTES = 64 * 1024 * 1024
+
+
+class PlanEntry(NamedTuple):
+    species_class: str
+    species: str
+    src: str
+    dst: str
+    size: int
+    copy: bool
+
+
+@dataclass
+class CopyPlan:
+    """File-level expansion of a set of `CopyTask`s, with sizes, for dry runs and deferred execution."""
+    entries: List[PlanEntry] = field(default_factory=list)
+    missing_species: List[Tuple[str, str]] = field(default_factory=list)
+    throughput: Optional[float] = None  # measured bytes per second
+
+    @property
+    def files_to_copy(self) -> int:
+        return sum(1 for entry in self.entries if entry.copy)
+
+    @property
+    def files_to_skip(self) -> int:
+        return sum(1 for entry in self.entries if not entry.copy)
+
+    @property
+    def bytes_to_copy(self) -> int:
+        return sum(entry.size for entry in self.entries if entry.copy)
+
+    def per_class(self) -> Dict[str, Dict[str, int]]:
+        """Files to copy/skip and bytes to copy, per class."""
+        breakdown: Dict[str, Dict[str, int]] = defaultdict(lambda: {"files_to_copy": 0, "files_to_skip": 0, "bytes_to_copy": 0})
+        for entry in self.entries:
+            stats = breakdown[entry.species_class]
+            if entry.copy:
+                stats["files_to_copy"] += 1
+                stats["bytes_to_copy"] += entry.size
+            else:
+                stats["files_to_skip"] += 1
+        return dict(breakdown)
+
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated copy time at the measured throughput, None if it was not measured."""
+        if not self.throughput:
+            return None
+        return self.bytes_to_copy / self.throughput
+
+    def summary(self) -> str:
+        lines = [
+            f"Files to copy: {self.files_to_copy} | Files to skip: {self.files_to_skip} | "
+            f"Missing species: {len(self.missing_species)}",
+            f"Total to copy: {self.bytes_to_copy / 1e6:.1f} MB",
+        ]
+        for class_name, stats in sorted(self.per_class().items()):
+            lines.append(
+                f"\t{class_name}: {stats['files_to_copy']} to copy ({stats['bytes_to_copy'] / 1e6:.1f} MB), "
+                f"{stats['files_to_skip']} to skip"
+            )
+        eta = self.eta_seconds()
+        if eta is not None:
+            lines.append(f"Estimated time: {eta:.0f}s at {self.throughput / 1e6:.1f} MB/s")  # type: ignore[operator]
+        return "\n".join(lines)
+
+    def save(self, path: str) -> None:
+        """Exports the plan as JSON, so it can be executed later without re-stat'ing."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "throughput": self.throughput,
+                "missing_species": self.missing_species,
+                "entries": [list(entry) for entry in self.entries],
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> "CopyPlan":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            entries=[PlanEntry(*entry) for entry in data["entries"]],
+            missing_species=[tuple(species) for species in data["missing_species"]],  # type: ignore[misc]
+            throughput=data["throughput"],
+        )
+
+
+def _plan_species(task: CopyTask) -> Optional[List[PlanEntry]]:
+    """Stats one species' source files and checks which already exist at the destination."""
+    species_class, species, src_dir, dst_dir = task
+    try:
+        with os.scandir(src_dir) as entries:
+            src_files = [(entry.name, entry.stat().st_size) for entry in entries if entry.is_file()]
+    except FileNotFoundError:
+        return None
+    try:
+        existing = set(os.listdir(dst_dir))
+    except FileNotFoundError:
+        existing = set()
+    return [
+        PlanEntry(species_class, species, str(src_dir / name), str(dst_dir / name), size, name not in existing)
+        for name, size in src_files
+    ]
+
+
+def _measure_throughput(
+    entries: List[PlanEntry],
+    probe_dir: Path,
+    probe_bytes: int,
+    scheduler: Optional[CopyScheduler] = None,
+) -> Optional[float]:
+    """Copies a sample of the planned files into a scratch directory under `probe_dir` and times it."""
+    sample: List[PlanEntry] = []
+    sampled_bytes = 0
+    for entry in entries:
+        if entry.copy:
+            sample.append(entry)
+            sampled_bytes += entry.size
+            if sampled_bytes >= probe_bytes:
+                break
+    if not sample or sampled_bytes == 0:
+        return None
+
+    probe_dir.mkdir(parents=True, exist_ok=True)
+    scratch = Path(tempfile.mkdtemp(prefix=".plan_probe_", dir=probe_dir))
+    try:
+        start = time.perf_counter()
+        for i, entry in enumerate(sample):
+            atomic_copy(Path(entry.src), scratch / str(i), scheduler=scheduler)
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(scratch)
+    return sampled_bytes / elapsed if elapsed > 0 else None
+
+
+def plan_copy(
+    tasks: Iterable[CopyTask],
+    probe_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    probe_bytes: int = DEFAULT_PROBE_BYTES,
+    throughput_mb_s: Optional[float] = None,
+    scheduler: Optional[CopyScheduler] = None,
+) -> CopyPlan:
+    """
+    Expands copy tasks into a file-level plan in one parallel stat pass.
+
+    Each species directory is scanned once on a thread pool; a file is planned for
+    copy when it does not exist at the destination, the same rule as
+    `copy_one_species_data`. Planning never writes to the destination. The ETA uses
+    `throughput_mb_s` when given; otherwise, when `probe_dir` is given, up to
+    `probe_bytes` of the planned files are copied to a scratch directory under it
+    (then removed) to measure the throughput, through `scheduler` if one is set.
+
+    Args:
+        tasks (Iterable[CopyTask]): Species to plan, from `build_copy_tasks`.
+        probe_dir (Optional[Path]): Scratch location for the throughput probe. No probe if None.
+        max_workers (Optional[int]): Number of stat threads.
+        probe_bytes (int): Amount of data to copy when measuring throughput.
+        throughput_mb_s (Optional[float]): Known copy throughput, used instead of a probe.
+        scheduler (Optional[CopyScheduler]): Bandwidth/file-rate limiter the probe copies go through.
+
+    Returns:
+        CopyPlan: The plan.
+    """
+    task_list = list(tasks)
+    plan = CopyPlan()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for task, entries in zip(task_list, executor.map(_plan_species, task_list)):
+            if entries is None:
+                plan.missing_species.append((task[0], task[1]))
+            else:
+                plan.entries.extend(entries)
+
+    if throughput_mb_s is not None:
+        plan.throughput = throughput_mb_s * 1e6
+    elif probe_dir is not None:
+        plan.throughput = _measure_throughput(plan.entries, probe_dir, probe_bytes, scheduler)
+    return plan
+
+
+def execute_plan(
+    plan: CopyPlan,
+    verbose: bool = False,
+    backend: CopyBackend = CopyBackend.AUTO,
+    max_workers: Optional[int] = None,
+    scheduler: Optional[CopyScheduler] = None,
+) -> Tuple[int, int]:
+    """
+    Copies the files a `CopyPlan` marks for copy, without re-stat'ing the trees.
+
+    Args:
+        plan (CopyPlan): Plan from `plan_copy` or `CopyPlan.load`.
+        verbose (bool): Whether to log every copied file.
+        backend (CopyBackend): File copy backend, see `copy_file_data`.
+        max_workers (Optional[int]): Number of copy threads.
+        scheduler (Optional[CopyScheduler]): Bandwidth/file-rate limiter shared by the workers.
+
+    Returns:
+        Tuple[int, int]: Number of files and bytes copied.
+    """
+    to_copy = [entry for entry in plan.entries if entry.copy]
+    for dst_dir in {os.path.dirname(entry.dst) for entry in to_copy}:
+        os.makedirs(dst_dir, exist_ok=True)
+
+    def _copy(entry: PlanEntry) -> int:
+        size = atomic_copy(Path(entry.src), Path(entry.dst), backend, scheduler)
+        log(f"Copied {entry.species_class}/{entry.species}/{os.path.basename(entry.dst)}", verbose)
+        return size
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        copied_bytes = sum(executor.map(_copy, to_copy))
+    return len(to_copy), copied_bytes
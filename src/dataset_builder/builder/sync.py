@@ -0,0 +1,257 @@
+import hashlib
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from dataset_builder.builder.copier import CopyBackend, CopyScheduler, atomic_copy
+from dataset_builder.core.log import log
+from dataset_builder.core.utility import SpeciesDict
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class SyncAction(Enum):
+    COPY = 1
+    UPDATE = 2
+    DELETE_FILE = 3
+    DELETE_SPECIES = 4
+
+
+class SyncOperation(NamedTuple):
+    action: SyncAction
+    species_class: str
+    species: str
+    src: Optional[Path]
+    dst: Path
+    size: int
+
+
+@dataclass
+class SyncPlan:
+    """File-level operations needed to bring `dst_root` in line with the matched species."""
+    operations: List[SyncOperation] = field(default_factory=list)
+    unchanged: int = 0
+    missing_species: List[Tuple[str, str]] = field(default_factory=list)
+
+    def count(self, action: SyncAction) -> int:
+        return sum(1 for op in self.operations if op.action is action)
+
+    @property
+    def bytes_to_copy(self) -> int:
+        return sum(op.size for op in self.operations if op.action in (SyncAction.COPY, SyncAction.UPDATE))
+
+
+def scan_species_dir(path: Path) -> Optional[Dict[str, os.stat_result]]:
+    """
+    Lists the regular files of a species directory with their stat results, None if it does not exist.
+
+    One `os.scandir` per directory; shared by `plan_sync` and `verify_copy`.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.stat() for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return None
+
+
+def _list_subdirs(path: Path) -> List[str]:
+    try:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_stale(src_stat: os.stat_result, dst_stat: os.stat_result, modify_window: float) -> bool:
+    return src_stat.st_size != dst_stat.st_size or abs(src_stat.st_mtime - dst_stat.st_mtime) > modify_window
+
+
+def plan_sync(
+    matched_species: SpeciesDict,
+    target_classes: List[str],
+    src_root: Path,
+    dst_root: Path,
+    checksum: bool = False,
+    modify_window: float = 1.0,
+    max_workers: Optional[int] = None,
+) -> SyncPlan:
+    """
+    Compares the source and destination trees and plans what a sync has to do.
+
+    Both trees are scanned once, one `os.scandir` per species directory on a thread
+    pool, and the file lists are then diffed in memory:
+
+    - files missing from the destination are copied,
+    - files whose size or mtime differ (beyond `modify_window` seconds), or whose
+      BLAKE2 digest differs when `checksum` is set, are updated,
+    - destination files absent from the source are deleted,
+    - destination species of the target classes that are no longer matched are deleted.
+
+    Args:
+        matched_species (SpeciesDict): Species to keep, grouped by class.
+        target_classes (List[str]): Classes to sync; other destination classes are left alone.
+        src_root (Path): Root of the source dataset.
+        dst_root (Path): Root of the destination dataset.
+        checksum (bool): Also compare file digests when size and mtime match.
+        modify_window (float): Tolerated mtime difference in seconds (coarse NFS timestamps).
+        max_workers (Optional[int]): Number of scanning/hashing threads.
+
+    Returns:
+        SyncPlan: The planned operations.
+    """
+    wanted = [
+        (species_class, species)
+        for species_class, species_list in matched_species.items()
+        if species_class in target_classes
+        for species in species_list
+    ]
+    wanted_set = set(wanted)
+    plan = SyncPlan()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dst_species = dict(zip(target_classes, executor.map(_list_subdirs, [dst_root / c for c in target_classes])))
+        src_listings = list(executor.map(scan_species_dir, [src_root / c / s for c, s in wanted]))
+        dst_listings = list(executor.map(scan_species_dir, [dst_root / c / s for c, s in wanted]))
+
+        to_hash: List[Tuple[str, str, Path, Path, int]] = []
+        for (species_class, species), src_files, dst_files in zip(wanted, src_listings, dst_listings):
+            if src_files is None:
+                plan.missing_species.append((species_class, species))
+                continue
+            src_dir = src_root / species_class / species
+            dst_dir = dst_root / species_class / species
+            dst_files = dst_files or {}
+            for name, src_stat in src_files.items():
+                dst_stat = dst_files.get(name)
+                if dst_stat is None:
+                    plan.operations.append(SyncOperation(
+                        SyncAction.COPY, species_class, species, src_dir / name, dst_dir / name, src_stat.st_size))
+                elif _is_stale(src_stat, dst_stat, modify_window):
+                    plan.operations.append(SyncOperation(
+                        SyncAction.UPDATE, species_class, species, src_dir / name, dst_dir / name, src_stat.st_size))
+                elif checksum:
+                    to_hash.append((species_class, species, src_dir / name, dst_dir / name, src_stat.st_size))
+                else:
+                    plan.unchanged += 1
+            for name, dst_stat in dst_files.items():
+                if name not in src_files:
+                    plan.operations.append(SyncOperation(
+                        SyncAction.DELETE_FILE, species_class, species, None, dst_dir / name, dst_stat.st_size))
+
+        if to_hash:
+            src_digests = executor.map(_file_digest, [item[2] for item in to_hash])
+            dst_digests = executor.map(_file_digest, [item[3] for item in to_hash])
+            for (species_class, species, src, dst, size), src_digest, dst_digest in zip(to_hash, src_digests, dst_digests):
+                if src_digest != dst_digest:
+                    plan.operations.append(SyncOperation(SyncAction.UPDATE, species_class, species, src, dst, size))
+                else:
+                    plan.unchanged += 1
+
+    for species_class in target_classes:
+        for species in sorted(dst_species[species_class]):
+            if (species_class, species) not in wanted_set:
+                plan.operations.append(SyncOperation(
+                    SyncAction.DELETE_SPECIES, species_class, species, None, dst_root / species_class / species, 0))
+    return plan
+
+
+def _unique_quarantine_path(destination: Path) -> Path:
+    """`destination`, or a timestamped sibling of it if an earlier sync already quarantined that name."""
+    if not destination.exists():
+        return destination
+    stem, suffix = (destination.stem, destination.suffix) if destination.is_file() else (destination.name, "")
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    candidate = destination.with_name(f"{stem}.{stamp}{suffix}")
+    n = 1
+    while candidate.exists():
+        candidate = destination.with_name(f"{stem}.{stamp}-{n}{suffix}")
+        n += 1
+    return candidate
+
+
+def _remove(op: SyncOperation, dst_root: Path, quarantine_dir: Optional[Path]) -> None:
+    if quarantine_dir is not None:
+        destination = _unique_quarantine_path(quarantine_dir / op.dst.relative_to(dst_root))
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(op.dst), str(destination))
+    elif op.action is SyncAction.DELETE_SPECIES:
+        shutil.rmtree(op.dst)
+    else:
+        op.dst.unlink()
+
+
+def _apply_one(
+    op: SyncOperation,
+    dst_root: Path,
+    quarantine_dir: Optional[Path],
+    verbose: bool,
+    backend: CopyBackend,
+    scheduler: Optional[CopyScheduler],
+) -> SyncAction:
+    species_path = f"{op.species_class}/{op.species}"
+    if op.action in (SyncAction.COPY, SyncAction.UPDATE):
+        op.dst.parent.mkdir(parents=True, exist_ok=True)
+        atomic_copy(op.src, op.dst, backend, scheduler)  # type: ignore[arg-type]
+        verb = "Copied" if op.action is SyncAction.COPY else "Updated"
+        log(lambda: f"{verb} {species_path}/{op.dst.name}", verbose)
+    else:
+        _remove(op, dst_root, quarantine_dir)
+        verb = "Quarantined" if quarantine_dir is not None else "Deleted"
+        target = species_path if op.action is SyncAction.DELETE_SPECIES else f"{species_path}/{op.dst.name}"
+        log(lambda: f"{verb} stale {target}", verbose)
+    return op.action
+
+
+def apply_sync(
+    plan: SyncPlan,
+    dst_root: Path,
+    quarantine_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    verbose: bool = False,
+    backend: CopyBackend = CopyBackend.AUTO,
+    scheduler: Optional[CopyScheduler] = None,
+) -> Dict[SyncAction, int]:
+    """
+    Executes a `SyncPlan` on a thread pool.
+
+    Copies and updates go through `atomic_copy`. Stale files and species are deleted,
+    or moved under `quarantine_dir` (keeping their class/species layout) when given;
+    an entry already quarantined by an earlier sync is kept, and the new one gets a
+    timestamp suffix (`dropped.20240101-120000`, `gone.20240101-120000.jpg`).
+
+    Args:
+        plan (SyncPlan): Plan produced by `plan_sync`.
+        dst_root (Path): Root of the destination dataset the plan was made for.
+        quarantine_dir (Optional[Path]): Where to move stale entries instead of deleting them.
+        max_workers (Optional[int]): Number of worker threads.
+        verbose (bool): Whether to log every operation.
+        backend (CopyBackend): File copy backend, see `copy_file_data`.
+        scheduler (Optional[CopyScheduler]): Bandwidth/file-rate limiter shared by the workers.
+
+    Returns:
+        Dict[SyncAction, int]: Number of operations done per action.
+    """
+    done = {action: 0 for action in SyncAction}
+    # Stale species first, so their files are never touched twice
+    species_ops = [op for op in plan.operations if op.action is SyncAction.DELETE_SPECIES]
+    file_ops = [op for op in plan.operations if op.action is not SyncAction.DELETE_SPECIES]
+    for op in species_ops:
+        done[_apply_one(op, dst_root, quarantine_dir, verbose, backend, scheduler)] += 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for action in executor.map(lambda op: _apply_one(op, dst_root, quarantine_dir, verbose, backend, scheduler), file_ops):
+            done[action] += 1
+    return done
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from dataset_builder.builder.sync import HASH_CHUNK_SIZE, scan_species_dir
+from dataset_builder.core.exceptions import FailedOperation
+from dataset_builder.core.utility import SpeciesDict
+
+DIGEST_CACHE_SUFFIX = ".digests.json"
+DIGEST_ALGORITHMS = ("blake2b", "xxhash")
+
+
+def _hasher_factory(algorithm: str) -> Callable:
+    if algorithm == "blake2b":
+        return hashlib.blake2b
+    if algorithm == "xxhash":
+        try:
+            import xxhash  # type: ignore
+        except ImportError as e:
+            raise FailedOperation("The 'xxhash' checksum needs the xxhash package: pip install xxhash") from e
+        return xxhash.xxh3_128
+    raise FailedOperation(f"Unknown checksum algorithm '{algorithm}', expected one of {DIGEST_ALGORITHMS}")
+
+
+def file_digest(path: str, algorithm: str = "blake2b") -> str:
+    digest = _hasher_factory(algorithm)()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def digest_cache_path_for(dst: str) -> str:
+    """Sidecar digest cache of a destination dataset, next to it like the copy journal."""
+    return os.path.normpath(dst) + DIGEST_CACHE_SUFFIX
+
+
+class DigestCache:
+    """
+    Digests of previously verified files, keyed by path and invalidated by size and mtime.
+
+    Stored as a JSON sidecar file, so a repeat verification only hashes the files
+    that changed since the last one.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._entries: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        if path and os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except ValueError:
+                self._entries = {}
+
+    def digest(self, path: str, stat: os.stat_result, algorithm: str) -> str:
+        """Returns the digest of `path`, from the cache when its size and mtime are unchanged."""
+        entry = self._entries.get(path)
+        if entry is not None and entry[:3] == [stat.st_size, stat.st_mtime_ns, algorithm]:
+            with self._lock:
+                self.hits += 1
+            return entry[3]
+        value = file_digest(path, algorithm)
+        with self._lock:
+            self._entries[path] = [stat.st_size, stat.st_mtime_ns, algorithm, value]
+        return value
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp = self.path + ".part"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp, self.path)
+
+
+class Mismatch(NamedTuple):
+    name: str
+    reason: str  # "missing", "size", "digest" or "extra"
+
+
+@dataclass
+class VerifyReport:
+    files_checked: int = 0
+    files_hashed: int = 0
+    mismatches: Dict[Tuple[str, str], List[Mismatch]] = field(default_factory=dict)
+    missing_species: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches and not self.missing_species
+
+    def summary(self) -> str:
+        lines = [
+            f"Verified {self.files_checked} files ({self.files_hashed} hashed): "
+            f"{len(self.mismatches)} mismatched species, {len(self.missing_species)} missing from source"
+        ]
+        for (species_class, species), mismatches in sorted(self.mismatches.items()):
+            reasons: Dict[str, int] = {}
+            for mismatch in mismatches:
+                reasons[mismatch.reason] = reasons.get(mismatch.reason, 0) + 1
+            detail = ", ".join(f"{count} {reason}" for reason, count in sorted(reasons.items()))
+            lines.append(f"\t{species_class}/{species}: {detail}")
+        return "\n".join(lines)
+
+    def save(self, path: str) -> None:
+        """Writes the mismatches per species as JSON."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "files_checked": self.files_checked,
+                "files_hashed": self.files_hashed,
+                "missing_species": self.missing_species,
+                "mismatches": [
+                    {"class": species_class, "species": species, "files": [list(m) for m in mismatches]}
+                    for (species_class, species), mismatches in sorted(self.mismatches.items())
+                ],
+            }, f, indent=2)
+
+
+def verify_copy(
+    matched_species: SpeciesDict,
+    target_classes: List[str],
+    src_root: Path,
+    dst_root: Path,
+    checksum: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache: Optional[DigestCache] = None,
+) -> VerifyReport:
+    """
+    Checks that the destination holds an identical copy of every matched species.
+
+    Both trees are listed once per species on a thread pool and compared by name and
+    size. With `checksum` ("blake2b" or "xxhash"), files whose sizes match are also
+    hashed on both sides, in parallel; a `cache` skips files hashed by an earlier run
+    that have not changed since.
+
+    Args:
+        matched_species (SpeciesDict): Species that were copied, grouped by class.
+        target_classes (List[str]): Classes to verify.
+        src_root (Path): Root of the source dataset.
+        dst_root (Path): Root of the destination dataset.
+        checksum (Optional[str]): Digest algorithm, or None to compare sizes only.
+        max_workers (Optional[int]): Number of listing/hashing threads.
+        cache (Optional[DigestCache]): Digest cache to read and update.
+
+    Returns:
+        VerifyReport: Checked file counts and mismatches per species.
+
+    Raises:
+        FailedOperation: If `checksum` is unknown or its library is not installed.
+    """
+    if checksum is not None:
+        _hasher_factory(checksum)
+    cache = cache or DigestCache()
+    hits_before = cache.hits
+    wanted = [
+        (species_class, species)
+        for species_class, species_list in matched_species.items()
+        if species_class in target_classes
+        for species in species_list
+    ]
+    report = VerifyReport()
+    to_hash: List[Tuple[Tuple[str, str], str, str, str, os.stat_result, os.stat_result]] = []
+
+    def _flag(key: Tuple[str, str], name: str, reason: str) -> None:
+        report.mismatches.setdefault(key, []).append(Mismatch(name, reason))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        src_listings = list(executor.map(scan_species_dir, [src_root / c / s for c, s in wanted]))
+        dst_listings = list(executor.map(scan_species_dir, [dst_root / c / s for c, s in wanted]))
+
+        for key, src_files, dst_files in zip(wanted, src_listings, dst_listings):
+            if src_files is None:
+                report.missing_species.append(key)
+                continue
+            dst_files = dst_files or {}
+            src_dir, dst_dir = src_root / key[0] / key[1], dst_root / key[0] / key[1]
+            for name, src_stat in sorted(src_files.items()):
+                report.files_checked += 1
+                dst_stat = dst_files.get(name)
+                if dst_stat is None:
+                    _flag(key, name, "missing")
+                elif dst_stat.st_size != src_stat.st_size:
+                    _flag(key, name, "size")
+                elif checksum is not None:
+                    to_hash.append((key, name, str(src_dir / name), str(dst_dir / name), src_stat, dst_stat))
+            for name in sorted(set(dst_files) - set(src_files)):
+                _flag(key, name, "extra")
+
+        def _compare(item) -> bool:
+            _, _, src, dst, src_stat, dst_stat = item
+            return cache.digest(src, src_stat, checksum) == cache.digest(dst, dst_stat, checksum)  # type: ignore
+
+        for item, same in zip(to_hash, executor.map(_compare, to_hash)):
+            if not same:
+                _flag(item[0], item[1], "digest")
+
+    report.files_hashed = 2 * len(to_hash) - (cache.hits - hits_before)
+    for mismatches in report.mismatches.values():
+        mismatches.sort()
+    return report
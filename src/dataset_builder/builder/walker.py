@@ -1,11 +1,19 @@
+import os
+from enum import Enum
 from pathlib import Path
 from dataset_builder.core.utility import SpeciesDict
-from typing import Iterator, Tuple, List
+from typing import Iterable, Iterator, Tuple, List
 
 
 CopyTask = Tuple[str, str, Path, Path]
 
 
+class CopyOrder(Enum):
+    LISTING = "listing"  # directory listing / JSON order, as before
+    NAME = "name"
+    INODE = "inode"  # follows on-disk allocation order on most local filesystems
+
+
 def build_copy_tasks(
     matched_species: SpeciesDict,
     target_classes: List[str],
@@ -24,3 +32,34 @@ def build_copy_tasks(
                     src_root / species_class / species,
                     dst_root / species_class / species,
                 )
+
+
+def _inode_or_max(path: Path) -> int:
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return 1 << 64  # missing sources go last; the copier reports them
+
+
+def order_copy_tasks(tasks: Iterable[CopyTask], order: CopyOrder = CopyOrder.LISTING) -> List[CopyTask]:
+    """
+    Orders copy tasks for locality on the source storage.
+
+    With `CopyOrder.INODE`, species are sorted by the inode number of their source
+    directory. Inodes are allocated roughly in creation order, so on ext4/XFS HDDs
+    and cold NFS exports this turns the walk into a mostly forward sweep instead of
+    random seeks. `CopyOrder.NAME` sorts by class then species name.
+
+    Args:
+        tasks (Iterable[CopyTask]): Tasks from `build_copy_tasks`.
+        order (CopyOrder): Ordering mode. `LISTING` keeps the input order.
+
+    Returns:
+        List[CopyTask]: The ordered tasks.
+    """
+    task_list = list(tasks)
+    if order is CopyOrder.NAME:
+        task_list.sort(key=lambda task: (task[0], task[1]))
+    elif order is CopyOrder.INODE:
+        task_list.sort(key=lambda task: _inode_or_max(task[2]))
+    return task_list
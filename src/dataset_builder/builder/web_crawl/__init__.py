@@ -1,4 +1,19 @@
-from dataset_builder.builder.web_crawl.fetcher import fetch_page
-from dataset_builder.builder.web_crawl.parser import parse_species_page
-from dataset_builder.builder.web_crawl.scraper import scrape_pages
-from dataset_builder.builder.web_crawl.web_crawler import run_web_crawl
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from dataset_builder._lazy import lazy_exports
+
+# requests and bs4 are only imported once the crawler is used
+_EXPORTS = {
+    "fetch_page": ".fetcher",
+    "parse_species_page": ".parser",
+    "scrape_pages": ".scraper",
+    "run_web_crawl": ".web_crawler",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from dataset_builder.builder.web_crawl.fetcher import fetch_page
+    from dataset_builder.builder.web_crawl.parser import parse_species_page
+    from dataset_builder.builder.web_crawl.scraper import scrape_pages
+    from dataset_builder.builder.web_crawl.web_crawler import run_web_crawl
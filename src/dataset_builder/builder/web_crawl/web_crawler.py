@@ -4,6 +4,7 @@ from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List
 
+from dataset_builder.core.events import add_counters, traced
 from dataset_builder.core.exceptions import FailedOperation
 from dataset_builder.core.utility import write_data_to_json
 from dataset_builder.builder.web_crawl.scraper import scrape_pages
@@ -30,6 +31,7 @@ def _validate_web_crawl_rules(base_url: str, total_pages: int, delay: float):
         raise FailedOperation("'delay_between_requests' should be a positive number")
 
 
+@traced("web_crawl")
 def run_web_crawl(
     base_url: str,
     output_path: str,
@@ -77,6 +79,7 @@ def run_web_crawl(
         for page_data in page_iter:
             for species_class, species_list in page_data.items():
                 all_species[species_class].extend(species_list)
+        add_counters(pages=total_pages, species=sum(len(species) for species in all_species.values()))
         write_data_to_json(str(path), "Web crawl results", all_species)
     except Exception as e:
             raise FailedOperation(f"Unexpected error during web crawl: {e}")
\ No newline at end of file
@@ -1,14 +1,43 @@
+from typing import TYPE_CHECKING
+
+from dataset_builder._lazy import lazy_exports
 from .exceptions import PipelineError, FailedOperation, ConfigError
-from .utility import banner
-from .config import (
-    build_interactive_config,
-    load_config,
-    save_config,
-    Config,
-    GlobalConfig,
-    PathsConfig,
-    WebCrawlConfig,
-    TrainValSplitConfig,
-    validate_dict_against_dataclass,
-    validate_config,
-)
\ No newline at end of file
+
+_EXPORTS = {
+    "banner": ".utility",
+    "ManifestView": ".manifest_view",
+    "load_manifest_view": ".manifest_view",
+    **{
+        name: ".config"
+        for name in [
+            "build_interactive_config",
+            "load_config",
+            "save_config",
+            "Config",
+            "GlobalConfig",
+            "PathsConfig",
+            "WebCrawlConfig",
+            "TrainValSplitConfig",
+            "validate_dict_against_dataclass",
+            "validate_config",
+        ]
+    },
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+__all__ = ["PipelineError", "FailedOperation", "ConfigError", *_EXPORTS]
+
+if TYPE_CHECKING:
+    from .utility import banner
+    from .manifest_view import ManifestView, load_manifest_view
+    from .config import (
+        build_interactive_config,
+        load_config,
+        save_config,
+        Config,
+        GlobalConfig,
+        PathsConfig,
+        WebCrawlConfig,
+        TrainValSplitConfig,
+        validate_dict_against_dataclass,
+        validate_config,
+    )
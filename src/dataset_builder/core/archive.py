@@ -0,0 +1,134 @@
+import json
+import os
+import shutil
+import subprocess
+import tarfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from dataset_builder.core.exceptions import FailedOperation
+from dataset_builder.core.log import log
+
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz")
+ARCHIVE_INDEX_SUFFIX = ".index.json"
+IMAGE_EXTENSION = ".jpg"
+
+ImageCounts = Dict[str, Dict[str, int]]
+
+
+def is_archive(path: str) -> bool:
+    """Whether `path` is a tar archive usable as a dataset source."""
+    return os.path.isfile(path) and path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def split_member_name(name: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Splits a tar member path into (class, species, filename).
+
+    The last three components are used, so any top-level folder the archive wraps the
+    dataset in (`train_val_images/` for iNaturalist 2017) is ignored. Returns None for
+    members that are not images.
+    """
+    parts = name.strip("/").split("/")
+    if len(parts) < 3 or not parts[-1].lower().endswith(IMAGE_EXTENSION):
+        return None
+    return parts[-3], parts[-2], parts[-1]
+
+
+@contextmanager
+def open_archive_stream(archive_path: str, use_pigz: bool = True) -> Iterator[tarfile.TarFile]:
+    """
+    Opens a tar archive for one sequential pass over its members.
+
+    Gzipped archives are decompressed by `pigz` in a subprocess when it is installed,
+    which moves decompression off the Python thread and onto several cores; otherwise
+    Python's `gzip` module is used.
+
+    Raises:
+        FailedOperation: If `pigz` exits with an error.
+    """
+    gzipped = archive_path.lower().endswith((".gz", ".tgz"))
+    pigz = shutil.which("pigz") if gzipped and use_pigz else None
+    if pigz is None:
+        with tarfile.open(archive_path, "r|gz" if gzipped else "r|") as tar:
+            yield tar
+        return
+
+    proc = subprocess.Popen([pigz, "-dc", archive_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+            yield tar
+    finally:
+        proc.stdout.close()  # type: ignore[union-attr]
+        proc.wait()
+    if proc.returncode != 0:
+        stderr = proc.stderr.read().decode(errors="replace") if proc.stderr else ""
+        raise FailedOperation(f"pigz failed on {archive_path}: {stderr.strip()}")
+
+
+def _index_path(archive_path: str) -> str:
+    return archive_path + ARCHIVE_INDEX_SUFFIX
+
+
+def build_archive_index(archive_path: str, use_pigz: bool = True, index_path: Optional[str] = None) -> ImageCounts:
+    """
+    Counts the images per class and species of an archive and caches the result.
+
+    The counts are read from the tar headers only, in one streaming pass, and saved
+    next to the archive (`<archive>.index.json`), or to `index_path`, together with
+    its size and mtime. Saving is best-effort: if the index cannot be written (e.g.
+    the archive sits on a read-only mount), a warning is logged and the counts are
+    still returned.
+
+    Args:
+        archive_path (str): Path to the tar archive.
+        use_pigz (bool): Decompress with `pigz` when it is installed.
+        index_path (Optional[str]): Where to save the index. Defaults to next to the archive.
+
+    Returns:
+        ImageCounts: Image count per species, grouped by class.
+    """
+    counts: ImageCounts = {}
+    with open_archive_stream(archive_path, use_pigz) as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            parsed = split_member_name(member.name)
+            if parsed is None:
+                continue
+            species_class, species, _ = parsed
+            class_counts = counts.setdefault(species_class, {})
+            class_counts[species] = class_counts.get(species, 0) + 1
+
+    stat = os.stat(archive_path)
+    index_path = index_path or _index_path(archive_path)
+    try:
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump({"size": stat.st_size, "mtime": stat.st_mtime, "counts": counts}, f)
+    except OSError as e:
+        log(f"Cannot save archive index {index_path}: {e}", True, "WARNING")
+    return counts
+
+
+def load_archive_index(archive_path: str, use_pigz: bool = True, index_path: Optional[str] = None) -> ImageCounts:
+    """
+    Returns the image counts of an archive, from its cached index when it is up to date.
+
+    The index (next to the archive, or at `index_path`) is rebuilt when missing or
+    when the archive's size or mtime changed.
+    """
+    try:
+        with open(index_path or _index_path(archive_path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        stat = os.stat(archive_path)
+        if index["size"] == stat.st_size and index["mtime"] == stat.st_mtime:
+            return index["counts"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_archive_index(archive_path, use_pigz, index_path)
+
+
+def filter_counts(counts: ImageCounts, target_classes: Optional[List[str]] = None) -> ImageCounts:
+    if not target_classes:
+        return counts
+    return {name: species for name, species in counts.items() if name in target_classes}
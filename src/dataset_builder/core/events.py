@@ -0,0 +1,209 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from dataset_builder.core.log import BufferedLogFile
+
+EVENTS_FILE_PATH: Optional[str] = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_events_file: Optional[BufferedLogFile] = None
+_local = threading.local()
+
+
+def initialize_event_log(path: str) -> None:
+    """
+    Starts writing JSON-lines events to `path` (appended to if it exists).
+
+    Events share the buffered, fork-aware writer of `core.log`; call `flush_events`
+    before reading the file.
+    """
+    global EVENTS_FILE_PATH, _events_file
+    close_event_log()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    EVENTS_FILE_PATH = path
+    _events_file = BufferedLogFile(path)
+
+
+def close_event_log() -> None:
+    """Flushes and closes the event log, if one is open; later events are dropped."""
+    global EVENTS_FILE_PATH, _events_file
+    if _events_file is not None:
+        _events_file.close()
+    EVENTS_FILE_PATH = None
+    _events_file = None
+
+
+def flush_events() -> None:
+    if _events_file is not None:
+        _events_file.flush()
+
+
+def emit(event: str, **fields: Any) -> None:
+    """Writes one event, if an event log is initialized."""
+    if _events_file is None:
+        return
+    record = {"event": event, "time": time.time(), "pid": os.getpid(), **fields}
+    _events_file.write(json.dumps(record, default=str) + "\n")
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process and its reaped children, in MB; None where `resource` is unavailable (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KB on Linux
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return peak * scale / 1e6
+
+
+class Span:
+    """
+    Timed section of a pipeline stage, emitted as one "span" event when it ends.
+
+    Spans nest per thread: a span opened inside another records the path of its
+    parents (`copy/verify`), which is what `summarize_events` groups on.
+    """
+
+    def __init__(self, stage: str, **attrs: Any):
+        self.stage = stage
+        self.attrs = attrs
+        self.counters: Dict[str, float] = defaultdict(float)
+        self.path = stage
+        self._start = 0.0
+
+    def add(self, **counters: float) -> None:
+        for name, value in counters.items():
+            self.counters[name] += value
+
+    def __enter__(self) -> "Span":
+        stack = _span_stack()
+        if stack:
+            self.path = f"{stack[-1].path}/{self.stage}"
+        stack.append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self._start
+        _span_stack().pop()
+        peak_rss = peak_rss_mb()
+        emit(
+            "span",
+            stage=self.stage,
+            path=self.path,
+            duration=duration,
+            status="error" if exc_type is not None else "ok",
+            counters={name: int(v) if float(v).is_integer() else v for name, v in self.counters.items()},
+            peak_rss_mb=round(peak_rss, 1) if peak_rss is not None else None,
+            **self.attrs,
+        )
+
+
+def _span_stack() -> List[Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def span(stage: str, **attrs: Any) -> Span:
+    return Span(stage, **attrs)
+
+
+def current_span() -> Optional[Span]:
+    stack = _span_stack()
+    return stack[-1] if stack else None
+
+
+def add_counters(**counters: float) -> None:
+    """Adds to the counters of the innermost open span of this thread; no-op outside a span."""
+    current = current_span()
+    if current is not None:
+        current.add(**counters)
+
+
+def traced(stage: str) -> Callable[[F], F]:
+    """Decorator running the function inside a `span(stage)`."""
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def load_events(path: str) -> List[Dict[str, Any]]:
+    """Reads an event log, skipping torn or malformed lines."""
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+def summarize_events(path: str, width: int = 40) -> str:
+    """
+    Flame-style breakdown of the spans of an event log.
+
+    Spans are grouped by path, in the order the stages first started, and nested
+    stages are indented under their parent. Each line shows the total time and its
+    share of the whole run as a bar, the number of calls, the summed counters and
+    the highest peak RSS seen (when the platform reports it).
+    """
+    totals: Dict[str, Dict[str, Any]] = {}
+    for event in load_events(path):
+        if event.get("event") != "span":
+            continue
+        start = event["time"] - event["duration"]
+        entry = totals.setdefault(
+            event["path"], {"duration": 0.0, "calls": 0, "counters": defaultdict(float), "rss": None, "start": start}
+        )
+        entry["start"] = min(entry["start"], start)
+        entry["duration"] += event["duration"]
+        entry["calls"] += 1
+        if event.get("peak_rss_mb") is not None:
+            entry["rss"] = max(entry["rss"] or 0.0, event["peak_rss_mb"])
+        for name, value in event.get("counters", {}).items():
+            entry["counters"][name] += value
+    if not totals:
+        return "No spans recorded"
+
+    run_total = sum(entry["duration"] for span_path, entry in totals.items() if "/" not in span_path) or 1.0
+    lines = [f"{'stage':<32}{'seconds':>10}{'share':>8}  {'':<{width}}  details"]
+
+    def _order(span_path: str):
+        parts = span_path.split("/")
+        return tuple(
+            totals.get("/".join(parts[:i + 1]), {"start": 0.0})["start"] for i in range(len(parts))
+        ), span_path
+
+    for span_path in sorted(totals, key=_order):
+        entry = totals[span_path]
+        depth = span_path.count("/")
+        share = entry["duration"] / run_total
+        bar = "█" * max(1, round(share * width)) if entry["duration"] > 0 else ""
+        counters = ", ".join(f"{name}={value:g}" for name, value in sorted(entry["counters"].items()))
+        details = f"calls={entry['calls']}" + (f", peak_rss={entry['rss']:.0f}MB" if entry["rss"] is not None else "")
+        details += f", {counters}" if counters else ""
+        label = "  " * depth + span_path.rsplit("/", 1)[-1]
+        lines.append(f"{label:<32}{entry['duration']:>10.2f}{share:>8.1%}  {bar:<{width}}  {details}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(summarize_events(sys.argv[1]))
@@ -1,10 +1,144 @@
+import atexit
 import os
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Union
 
 
 LOG_FILE_PATH: Optional[str] = None
 
+LOG_LEVELS: Dict[str, int] = {"DEBUG": 10, "INFO": 20, "WARN": 30, "WARNING": 30, "ERROR": 40}
+LOG_LEVEL: str = "DEBUG"
+FLUSH_INTERVAL = 0.5  # seconds between background flushes
+MAX_BUFFERED_LINES = 1000
+
+Message = Union[str, Callable[[], str]]
+
+
+class BufferedLogFile:
+    """
+    Append-only log file kept open for the life of the process, with batched writes.
+
+    Lines are buffered in memory and written with a single `os.write` on an
+    `O_APPEND` descriptor, either when the buffer fills up, every `FLUSH_INTERVAL`
+    seconds from a daemon thread, or at exit. One write per batch keeps lines from
+    several processes appending to the same file from interleaving mid-line.
+
+    Forked workers (`multiprocessing.Pool`, `ProcessPoolExecutor`) exit through
+    `os._exit` without running `atexit`, and the flusher thread does not survive
+    the fork, so in any process other than the one that created the file each line
+    is written straight away.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._owner_pid = os.getpid()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._fd: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _check_pid(self) -> None:
+        # A forked worker inherits the parent's buffer (the parent writes it) and thread-less state
+        if os.getpid() != self._pid:
+            self._reset()
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def write(self, line: str) -> None:
+        self._check_pid()
+        if self._pid != self._owner_pid:
+            with self._lock:
+                os.write(self._open(), line.encode("utf-8"))
+            return
+        with self._lock:
+            self._buffer.append(line)
+            full = len(self._buffer) >= MAX_BUFFERED_LINES
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+                self._thread.start()
+        if full:
+            self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self) -> None:
+        self._check_pid()
+        with self._lock:
+            if not self._buffer:
+                return
+            data = "".join(self._buffer).encode("utf-8")
+            self._buffer.clear()
+            os.write(self._open(), data)
+
+    def close(self) -> None:
+        """Stops the flusher thread, writes what is buffered and closes the file."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._lock:
+            if self._fd is not None and os.getpid() == self._pid:
+                os.close(self._fd)
+                self._fd = None
+
+
+_writer: Optional[BufferedLogFile] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer(path: str) -> BufferedLogFile:
+    global _writer
+    writer = _writer
+    if writer is not None and writer.path == path:
+        return writer
+    with _writer_lock:
+        if _writer is None or _writer.path != path:
+            if _writer is not None:
+                _writer.close()
+            _writer = BufferedLogFile(path)
+        return _writer
+
+
+def flush_logs() -> None:
+    """Writes out the buffered log lines; call it before reading the log file."""
+    if _writer is not None:
+        _writer.flush()
+
+
+def _after_fork_in_child() -> None:
+    global _writer_lock
+    _writer_lock = threading.Lock()
+
+
+atexit.register(flush_logs)
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def set_log_level(level: str) -> None:
+    """
+    Sets the minimum level written to the console and the log file.
+
+    Messages below it are dropped before they are formatted, so callable messages
+    are never evaluated. Levels outside `LOG_LEVELS` are always logged.
+    """
+    global LOG_LEVEL
+    if level not in LOG_LEVELS:
+        raise ValueError(f"Unknown log level '{level}', expected one of {list(LOG_LEVELS)}")
+    LOG_LEVEL = level
+
 
 def initialize_logger(log_dir: str = "./logs", filename: Optional[str] = None):
     """
@@ -21,24 +155,30 @@ def initialize_logger(log_dir: str = "./logs", filename: Optional[str] = None):
     if not filename:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"log_{timestamp}.txt"
+    flush_logs()
     LOG_FILE_PATH = os.path.join(log_dir, filename)
 
 
-def log(message: str, verbose: bool = True, level: str = "INFO"):
+def log(message: Message, verbose: bool = True, level: str = "INFO"):
     """
     Logs a message to the console and to the log file.
 
-    The message is printed to the console if `verbose` is True and appended to 
-    the log file specified by `initialize_logger`.
+    The message is printed to the console if `verbose` is True and appended to
+    the log file specified by `initialize_logger`. File writes are buffered and
+    flushed in batches (see `flush_logs`); messages below the level set with
+    `set_log_level` are dropped.
 
     Args:
-        message (str): The message to log.
+        message (Message): The message to log, or a callable returning it, which is only
+            called if the message is actually logged.
         verbose (bool, optional): Whether to print the message to the console. Defaults to True.
         level (str, optional): The log level (e.g., "INFO", "ERROR"). Defaults to "INFO".
     """
-    formatted = f"[{level}] {message}"
+    path = LOG_FILE_PATH
+    if not (verbose or path) or LOG_LEVELS.get(level, 100) < LOG_LEVELS[LOG_LEVEL]:
+        return
+    formatted = f"[{level}] {message() if callable(message) else message}"
     if verbose:
         print(formatted)
-    if LOG_FILE_PATH:
-        with open(LOG_FILE_PATH, "a", encoding="utf-8") as f:
-            f.write(f"{formatted}\n")
+    if path:
+        _get_writer(path).write(f"{formatted}\n")
@@ -0,0 +1,218 @@
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
+import pyarrow.parquet as pq  # type: ignore
+
+from dataset_builder.core.exceptions import PipelineError
+
+# Captures the class directory of ".../<class>/<species>/<file>" from an image path.
+_CLASS_FROM_PATH = r"(?P<class>[^/\\]+)[/\\][^/\\]+[/\\][^/\\]+$"
+
+ROOT_METADATA_KEY = b"dataset_builder.root"
+COMPACT_COLUMNS = ["class", "species", "filename"]
+
+
+def build_compact_manifest_table(manifest: Sequence[Tuple[str, int]], root: str) -> pa.Table:
+    """
+    Converts (image_path, label_id) pairs into the compact, relative manifest layout.
+
+    Every `image_path` must be `<root>/<class>/<species>/<filename>`. The table stores
+    dictionary-encoded `class` and `species` columns, the bare `filename` and `label_id`;
+    `root` is kept once in the schema metadata instead of on every row.
+
+    Args:
+        manifest (Sequence[Tuple[str, int]]): List of (image_path, label_id).
+        root (str): Dataset root every image path is relative to.
+
+    Returns:
+        pa.Table: The compact manifest table.
+
+    Raises:
+        PipelineError: If an image path is not exactly three levels below `root`.
+    """
+    root = os.path.abspath(root)
+    checked_prefixes = {root}
+    classes: List[str] = []
+    species: List[str] = []
+    filenames: List[str] = []
+    labels: List[int] = []
+
+    for img_path, label in manifest:
+        parts = img_path.rsplit(os.sep, 3)
+        if len(parts) != 4:
+            raise PipelineError(f"Image path is not under '{root}/<class>/<species>/': {img_path}")
+        prefix = parts[0]
+        if prefix not in checked_prefixes:
+            if os.path.abspath(prefix) != root:
+                raise PipelineError(f"Image path is not under '{root}/<class>/<species>/': {img_path}")
+            checked_prefixes.add(prefix)
+        classes.append(parts[1])
+        species.append(parts[2])
+        filenames.append(parts[3])
+        labels.append(int(label))
+
+    table = pa.table({
+        "class": pa.array(classes, pa.string()).dictionary_encode(),
+        "species": pa.array(species, pa.string()).dictionary_encode(),
+        "filename": pa.array(filenames, pa.string()),
+        "label_id": pa.array(labels, pa.int64()),
+    })
+    return table.replace_schema_metadata({ROOT_METADATA_KEY: root.encode("utf-8")})
+
+
+class ManifestView:
+    """
+    Lazily loaded, memory-mapped view over a Parquet dataset manifest.
+
+    Nothing is read until the first access; the manifest is then loaded as an
+    Arrow table (column-projected and filtered at read time) and indexed without
+    materializing Python tuples for every row.
+
+    Rows behave like the tuples returned by `load_manifest_parquet`:
+    `view[i]` returns `(image_path, label_id)` for the default projection, or a
+    tuple of the requested `columns` otherwise. For compact manifests (see
+    `build_compact_manifest_table`), `image_path` is rebuilt from the root and the
+    class/species/filename columns only when a row is accessed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[Sequence[str]] = None,
+        label_ids: Optional[Sequence[int]] = None,
+        classes: Optional[Sequence[str]] = None,
+        root: Optional[str] = None,
+    ):
+        """
+        Args:
+            path (str): Path to the Parquet manifest.
+            columns (Optional[Sequence[str]]): Columns to load (e.g. ["label_id"]). Defaults to all columns.
+            label_ids (Optional[Sequence[int]]): Only keep rows with one of these labels.
+            classes (Optional[Sequence[str]]): Only keep rows whose image belongs to one of these classes.
+            root (Optional[str]): Dataset root for compact manifests, overrides the stored one
+                (e.g. after the dataset was moved).
+
+        Raises:
+            FileNotFoundError: If `path` does not exist.
+        """
+        self.path = path
+        # Reading the footer only, fails fast on a missing file
+        self.schema = pq.read_schema(path)
+        self.compact = "image_path" not in self.schema.names and "filename" in self.schema.names
+        metadata: Dict[bytes, bytes] = self.schema.metadata or {}
+        stored_root = metadata.get(ROOT_METADATA_KEY, b"").decode("utf-8")
+        self.root = root or stored_root
+        if columns:
+            self.columns: List[str] = list(columns)
+        elif self.compact:
+            self.columns = ["image_path", "label_id"]
+        else:
+            self.columns = list(self.schema.names)
+        self.label_ids = list(label_ids) if label_ids is not None else None
+        self.classes = list(classes) if classes is not None else None
+        self._table: Optional[pa.Table] = None
+
+    @property
+    def table(self) -> pa.Table:
+        """The underlying Arrow table, loaded on first access."""
+        if self._table is None:
+            self._table = self._load()
+        return self._table
+
+    def _load(self) -> pa.Table:
+        filters: List[Tuple[str, str, Any]] = []
+        if self.label_ids is not None:
+            filters.append(("label_id", "in", self.label_ids))
+        has_class_column = "class" in self.schema.names
+        if self.classes is not None and has_class_column:
+            filters.append(("class", "in", self.classes))
+
+        read_columns = self._physical_columns()
+        needs_path_filter = self.classes is not None and not has_class_column
+        if needs_path_filter and "image_path" not in read_columns:
+            read_columns.append("image_path")
+
+        table = pq.read_table(
+            self.path,
+            columns=read_columns,
+            filters=filters or None,
+            memory_map=True,
+        )
+        if needs_path_filter:
+            class_names = pc.struct_field(pc.extract_regex(table.column("image_path"), _CLASS_FROM_PATH), [0])
+            table = table.filter(pc.is_in(class_names, value_set=pa.array(self.classes, pa.string())))
+            table = table.select(self._physical_columns())
+        # Single chunk per column keeps random indexing O(1)
+        return table.combine_chunks()
+
+    def _physical_columns(self) -> List[str]:
+        """Columns to read from disk; a compact `image_path` is rebuilt from its parts."""
+        if not self.compact:
+            return list(self.columns)
+        physical: List[str] = []
+        for name in self.columns:
+            for column in (COMPACT_COLUMNS if name == "image_path" else [name]):
+                if column not in physical:
+                    physical.append(column)
+        return physical
+
+    def _column_values(self, name: str) -> Iterator[Any]:
+        if self.compact and name == "image_path":
+            parts = (self.table.column(column).to_pylist() for column in COMPACT_COLUMNS)
+            return (os.path.join(self.root, *row) for row in zip(*parts))
+        return iter(self.table.column(name).to_pylist())
+
+    def _value(self, name: str, index: int) -> Any:
+        if self.compact and name == "image_path":
+            parts = (self.table.column(column).chunk(0)[index].as_py() for column in COMPACT_COLUMNS)
+            return os.path.join(self.root, *parts)
+        return self.table.column(name).chunk(0)[index].as_py()
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __getitem__(self, index: int) -> Tuple:
+        num_rows = len(self)
+        if index < 0:
+            index += num_rows
+        if not 0 <= index < num_rows:
+            raise IndexError(f"Manifest index {index} out of range for {num_rows} rows")
+        return tuple(self._value(name, index) for name in self.columns)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return zip(*(self._column_values(name) for name in self.columns))
+
+    def labels(self) -> np.ndarray:
+        """Returns the `label_id` column as a NumPy array."""
+        return self.table.column("label_id").to_numpy()
+
+    def to_list(self) -> List[Tuple]:
+        """Materializes the view as a list of tuples, like `load_manifest_parquet`."""
+        return list(self)
+
+
+def load_manifest_view(
+    path: str,
+    columns: Optional[Sequence[str]] = None,
+    label_ids: Optional[Sequence[int]] = None,
+    classes: Optional[Sequence[str]] = None,
+    root: Optional[str] = None,
+) -> ManifestView:
+    """
+    Opens a Parquet dataset manifest as a lazy, memory-mapped `ManifestView`.
+
+    Args:
+        path (str): Path to the Parquet manifest.
+        columns (Optional[Sequence[str]]): Column projection, e.g. ["label_id"] to read labels only.
+        label_ids (Optional[Sequence[int]]): Label filter, pushed down to the Parquet reader.
+        classes (Optional[Sequence[str]]): Class filter, derived from `image_path` when the
+            manifest has no `class` column.
+        root (Optional[str]): Dataset root for compact manifests, overrides the stored one.
+
+    Returns:
+        ManifestView: The lazily evaluated manifest.
+    """
+    return ManifestView(path, columns, label_ids, classes, root)
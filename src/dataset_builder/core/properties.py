@@ -0,0 +1,89 @@
+import json
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class ClassCounts(NamedTuple):
+    """Image counts of the species of one class, sorted by count, largest first."""
+    names: List[str]
+    counts: np.ndarray  # int64, aligned with `names`
+    cumulative: np.ndarray  # running total of `counts`
+
+    @property
+    def total(self) -> int:
+        return int(self.cumulative[-1]) if len(self.cumulative) else 0
+
+
+def _sorted_class_counts(species_counts: Dict[str, int]) -> ClassCounts:
+    names = list(species_counts)
+    counts = np.fromiter(species_counts.values(), dtype=np.int64, count=len(names))
+    # Stable, so species with the same count keep the order of the file
+    order = np.argsort(-counts, kind="stable")
+    counts = counts[order]
+    cumulative = np.cumsum(counts)
+    counts.flags.writeable = False
+    cumulative.flags.writeable = False
+    return ClassCounts([names[i] for i in order], counts, cumulative)
+
+
+class PropertiesStore:
+    """
+    In-memory cache of dataset properties files (`<dataset>_composition.json`).
+
+    Each file is parsed once and its classes pre-sorted into `ClassCounts`; the
+    entry is reused until the file's mtime or size changes. The arrays are
+    read-only since every consumer shares them.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[Tuple[int, int], Dict[str, ClassCounts]]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def load(self, path: str) -> Dict[str, ClassCounts]:
+        """
+        Returns the sorted counts of every class in `path`.
+
+        Raises:
+            FileNotFoundError: If `path` does not exist.
+            json.JSONDecodeError: If `path` is not valid JSON.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        with open(path, "r", encoding="utf-8") as file:
+            species_data = json.load(file)
+        classes = {
+            species_class: _sorted_class_counts(species_counts or {})
+            for species_class, species_counts in species_data.items()
+            if isinstance(species_counts, dict)
+        }
+        with self._lock:
+            self._entries[path] = (key, classes)
+            self.loads += 1
+        return classes
+
+    def class_counts(self, path: str, species_class: str) -> Optional[ClassCounts]:
+        """Sorted counts of one class of `path`, or None if the class is not in the file."""
+        return self.load(path).get(species_class)
+
+    def preload(self, *paths: str) -> None:
+        """Loads the readable files among `paths`, e.g. before forking workers that share them."""
+        for path in paths:
+            try:
+                self.load(path)
+            except (OSError, ValueError):
+                continue
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+PROPERTIES = PropertiesStore()
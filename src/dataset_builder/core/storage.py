@@ -0,0 +1,343 @@
+import os
+import posixpath
+import tarfile
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from dataset_builder.core.archive import ARCHIVE_SUFFIXES
+from dataset_builder.core.exceptions import FailedOperation
+
+S3_SCHEME = "s3://"
+LIST_PAGE_SIZE = 1000
+
+
+class Listing(NamedTuple):
+    dirs: List[str]
+    files: Dict[str, int]  # name -> size in bytes
+
+
+def join_key(*parts: str) -> str:
+    """Joins '/'-separated storage keys, ignoring empty parts ('' is the storage root)."""
+    return posixpath.join(*[part for part in parts if part]) if any(parts) else ""
+
+
+class Storage(ABC):
+    """
+    Read/write access to a dataset tree.
+
+    Entries are addressed by '/'-separated keys relative to the storage root
+    ("" is the root, "Aves/Passer domesticus/1.jpg" an image), whatever the backend.
+    """
+
+    @abstractmethod
+    def list_dir(self, key: str = "") -> Listing:
+        """Lists the sub-directories and files directly under `key`.
+
+        Raises:
+            FileNotFoundError: If `key` is not a directory.
+        """
+
+    @abstractmethod
+    def read_bytes(self, key: str) -> bytes:
+        ...
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        raise FailedOperation(f"{type(self).__name__} is read-only, cannot write {key}")
+
+    @abstractmethod
+    def uri(self, key: str = "") -> str:
+        """Location of `key` usable in manifests and logs; archive members are `<archive>/<key>`."""
+
+    def local_path(self, key: str = "") -> Optional[str]:
+        """Filesystem path of `key` if the backend is a local directory, None otherwise."""
+        return None
+
+    def exists(self, key: str) -> bool:
+        parent, name = posixpath.split(key)
+        try:
+            listing = self.list_dir(parent)
+        except FileNotFoundError:
+            return False
+        return name in listing.files or name in listing.dirs
+
+
+class LocalStorage(Storage):
+    def __init__(self, root: str):
+        self.root = root
+
+    def local_path(self, key: str = "") -> str:
+        return os.path.join(self.root, *key.split("/")) if key else self.root
+
+    def uri(self, key: str = "") -> str:
+        return self.local_path(key)
+
+    def list_dir(self, key: str = "") -> Listing:
+        dirs: List[str] = []
+        files: Dict[str, int] = {}
+        with os.scandir(self.local_path(key)) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                elif entry.is_file():
+                    files[entry.name] = entry.stat().st_size
+        return Listing(dirs, files)
+
+    def read_bytes(self, key: str) -> bytes:
+        with open(self.local_path(key), "rb") as f:
+            return f.read()
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        """Writes through a hidden temp file renamed into place, so readers never see partial files."""
+        path = self.local_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.part")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.local_path(key))
+
+
+class _TreeIndex:
+    """In-memory directory tree built from flat (key, size) listings, safe to fill from several threads."""
+
+    def __init__(self) -> None:
+        self._dirs: Dict[str, Listing] = {}
+        self._lock = threading.Lock()
+
+    def _ensure_dir(self, key: str) -> Listing:
+        listing = self._dirs.get(key)
+        if listing is None:
+            listing = self._dirs[key] = Listing([], {})
+            if key:
+                parent, name = posixpath.split(key)
+                parent_listing = self._ensure_dir(parent)
+                if name not in parent_listing.dirs:
+                    parent_listing.dirs.append(name)
+        return listing
+
+    def add_dir(self, key: str) -> None:
+        with self._lock:
+            self._ensure_dir(key.strip("/"))
+
+    def add_files(self, entries: Iterable[Tuple[str, int]]) -> None:
+        with self._lock:
+            for key, size in entries:
+                parent, name = posixpath.split(key.strip("/"))
+                if name:
+                    self._ensure_dir(parent).files[name] = size
+
+    def get(self, key: str) -> Optional[Listing]:
+        with self._lock:
+            listing = self._dirs.get(key)
+            return Listing(list(listing.dirs), dict(listing.files)) if listing is not None else None
+
+
+class _ArchiveStorage(Storage):
+    """Read-only archive whose member listing is indexed once, when it is opened."""
+    path: str
+    _index: _TreeIndex
+
+    def list_dir(self, key: str = "") -> Listing:
+        listing = self._index.get(key)
+        if listing is None:
+            raise FileNotFoundError(self.uri(key))
+        return listing
+
+    def uri(self, key: str = "") -> str:
+        return f"{self.path}/{key}" if key else self.path
+
+
+class ZipStorage(_ArchiveStorage):
+    """Read-only view of a zip archive, indexed from its central directory."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._index = _TreeIndex()
+        for info in self._zip.infolist():
+            if info.is_dir():
+                self._index.add_dir(info.filename)
+        self._index.add_files((info.filename, info.file_size) for info in self._zip.infolist() if not info.is_dir())
+        self._index.add_dir("")
+
+    def read_bytes(self, key: str) -> bytes:
+        return self._zip.read(key)
+
+
+class TarStorage(_ArchiveStorage):
+    """
+    Read-only random-access view of a tar archive, indexed from its member headers.
+
+    Reads of a compressed archive seek through the gzip stream, so for a one-off bulk
+    extraction `extract_matched_species` (a single sequential pass) is much faster.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._tar = tarfile.open(path, "r:*")
+        self._lock = threading.Lock()
+        self._members: Dict[str, tarfile.TarInfo] = {}
+        self._index = _TreeIndex()
+        for member in self._tar.getmembers():
+            name = member.name.strip("/")
+            if member.isdir():
+                self._index.add_dir(name)
+            elif member.isfile():
+                self._members[name] = member
+        self._index.add_files((name, member.size) for name, member in self._members.items())
+        self._index.add_dir("")
+
+    def read_bytes(self, key: str) -> bytes:
+        member = self._members.get(key)
+        if member is None:
+            raise FileNotFoundError(self.uri(key))
+        with self._lock:  # TarFile shares one file object between readers
+            return self._tar.extractfile(member).read()  # type: ignore[union-attr]
+
+
+class S3Storage(Storage):
+    """
+    Dataset tree stored under `prefix` in an S3-compatible bucket.
+
+    `client` needs the `list_objects_v2`, `get_object` and `put_object` calls of a
+    boto3 S3 client. Listings are cached per class: the first listing of anything
+    under a class directory fetches every key below that class in one paginated
+    request sequence, after which its species directories (and `exists` checks on
+    them) are answered from the cache. The root is listed with a delimiter, so it
+    costs one request per page of classes.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", client: Any = None, page_size: int = LIST_PAGE_SIZE):
+        if client is None:
+            client = _make_s3_client()
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = client
+        self.page_size = page_size
+        self._index = _TreeIndex()
+        self._listed: Set[str] = set()  # top-level directories whose whole subtree is cached
+        self._root_listing: Optional[Listing] = None
+        self._list_lock = threading.Lock()
+        self._subtree_locks: Dict[str, threading.Lock] = {}
+
+    @classmethod
+    def from_url(cls, url: str, client: Any = None) -> "S3Storage":
+        bucket, _, prefix = url[len(S3_SCHEME):].partition("/")
+        return cls(bucket, prefix, client)
+
+    def _full_key(self, key: str) -> str:
+        return join_key(self.prefix, key)
+
+    def uri(self, key: str = "") -> str:
+        return f"{S3_SCHEME}{self.bucket}/{self._full_key(key)}"
+
+    def _pages(self, prefix: str, delimiter: Optional[str] = None):
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket, "Prefix": prefix, "MaxKeys": self.page_size}
+        if delimiter:
+            kwargs["Delimiter"] = delimiter
+        while True:
+            page = self.client.list_objects_v2(**kwargs)
+            yield page
+            if not page.get("IsTruncated"):
+                return
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    def _relative(self, full_key: str) -> str:
+        return full_key[len(self.prefix) + 1:] if self.prefix else full_key
+
+    @staticmethod
+    def _top_level(key: str) -> str:
+        return key.split("/", 1)[0]
+
+    def _is_cached(self, key: str) -> bool:
+        return self._top_level(key) in self._listed
+
+    def _list_root(self) -> Listing:
+        if self._root_listing is None:
+            dirs: List[str] = []
+            files: Dict[str, int] = {}
+            base = self.prefix + "/" if self.prefix else ""
+            for page in self._pages(base, delimiter="/"):
+                dirs.extend(p["Prefix"][len(base):].rstrip("/") for p in page.get("CommonPrefixes", []))
+                files.update((obj["Key"][len(base):], obj["Size"]) for obj in page.get("Contents", []))
+            self._root_listing = Listing(dirs, files)
+        return Listing(list(self._root_listing.dirs), dict(self._root_listing.files))
+
+    def _list_subtree(self, key: str) -> None:
+        """Fetches every key under the top-level directory `key` and caches the whole subtree."""
+        with self._list_lock:
+            lock = self._subtree_locks.setdefault(key, threading.Lock())
+        with lock:  # threads visiting species of the same class wait for one listing
+            if key in self._listed:
+                return
+            found = False
+            for page in self._pages(self._full_key(key) + "/"):
+                contents = page.get("Contents", [])
+                found = found or bool(contents)
+                self._index.add_files((self._relative(obj["Key"]), obj["Size"]) for obj in contents)
+            if found:
+                self._index.add_dir(key)
+            with self._list_lock:
+                self._listed.add(key)
+
+    def list_dir(self, key: str = "") -> Listing:
+        key = key.strip("/")
+        if not key:
+            return self._list_root()
+        if not self._is_cached(key):
+            self._list_subtree(self._top_level(key))
+        listing = self._index.get(key)
+        if listing is None:
+            raise FileNotFoundError(self.uri(key))
+        return listing
+
+    def read_bytes(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=self._full_key(key))["Body"].read()
+
+    def write_bytes(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._full_key(key), Body=data)
+        if self._is_cached(key):
+            self._index.add_files([(key, len(data))])
+
+
+def _make_s3_client() -> Any:
+    try:
+        import boto3  # type: ignore
+    except ImportError as e:
+        raise FailedOperation("S3 storage needs boto3: pip install 'dataset_builder_inat[s3]'") from e
+    return boto3.client("s3")
+
+
+def is_local_dir(location: str) -> bool:
+    """Whether `location` is a plain local path rather than a URL or an archive file."""
+    return not location.startswith(S3_SCHEME) and not (
+        os.path.isfile(location) and location.lower().endswith((".zip",) + ARCHIVE_SUFFIXES)
+    )
+
+
+def open_storage(location: str, client: Any = None) -> Storage:
+    """
+    Opens the storage backend matching `location`.
+
+    - `s3://bucket/prefix`: an S3-compatible bucket (`client` defaults to a boto3 client),
+    - a `.zip` file: a read-only zip archive,
+    - a `.tar`, `.tar.gz` or `.tgz` file: a read-only tar archive,
+    - anything else: a local directory.
+    """
+    if location.startswith(S3_SCHEME):
+        return S3Storage.from_url(location, client)
+    lowered = location.lower()
+    if os.path.isfile(location) and lowered.endswith(".zip"):
+        return ZipStorage(location)
+    if os.path.isfile(location) and lowered.endswith(ARCHIVE_SUFFIXES):
+        return TarStorage(location)
+    return LocalStorage(location)
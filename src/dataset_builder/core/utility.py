@@ -3,8 +3,6 @@ import os
 import shutil
 from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
-
 from dataset_builder.core.log import log
 
 SpeciesDict = Dict[str, List[str]]
@@ -66,14 +64,24 @@ def _is_a_valid_species_dict(obj: Any) -> bool:
     return True
 
 
-def save_manifest_parquet(manifest: List[Tuple[str, int]], path: str):
+def save_manifest_parquet(manifest: List[Tuple[str, int]], path: str, root: Optional[str] = None):
     """
     Saves a dataset manifest to Parquet format.
 
     Args:
         manifest: List of (image_path, label_id)
         path: Output file path (.parquet)
+        root: If given, stores paths relative to this dataset root, as dictionary-encoded
+            `class`/`species` columns plus `filename`, instead of full `image_path` strings.
     """
+    # pandas/pyarrow are imported here so the copy and scan paths do not pay for them
+    import pandas as pd
+    import pyarrow.parquet as pq  # type: ignore
+    from dataset_builder.core.manifest_view import build_compact_manifest_table
+
+    if root is not None:
+        pq.write_table(build_compact_manifest_table(manifest, root), path)
+        return
     df = pd.DataFrame(manifest, columns=["image_path", "label_id"])
     df.to_parquet(path, index=False)
 
@@ -81,9 +89,14 @@ def save_manifest_parquet(manifest: List[Tuple[str, int]], path: str):
 def load_manifest_parquet(path: str) -> List[Tuple[str, int]]:
     """
     Loads a Parquet dataset manifest and returns it as a list of tuples.
+
+    Compact manifests (saved with a `root`) are returned with their full image paths.
+    For large manifests prefer `load_manifest_view`, which keeps the rows in a
+    memory-mapped Arrow table instead of materializing one tuple per row.
     """
-    df = pd.read_parquet(path)
-    return list(df.itertuples(index=False, name=None))
+    from dataset_builder.core.manifest_view import load_manifest_view
+
+    return load_manifest_view(path).to_list()
 
 
 def write_data_to_json(file_output_path: str, display_name: str, species_data, verbose: bool = True) -> None:
@@ -144,6 +157,9 @@ def _prepare_data_cdf_ppf(
     """
     Loads species image data from JSON dataset properties file, sorts by image count, and prepares data for CDF/PPF calculations.
 
+    The file is read through the shared `PROPERTIES` store, so it is only parsed
+    again when it changes on disk.
+
     Args:
         properties_json_path: Path to the dataset properties JSON file.
         class_to_analyze: The target class (e.g., 'Aves', 'Insecta').
@@ -151,9 +167,10 @@ def _prepare_data_cdf_ppf(
     Returns:
         Optional[Tuple[List[str], List[int]]]: Species names and corresponding image counts sorted by number of images.
     """
+    from dataset_builder.core.properties import PROPERTIES
+
     try:
-        with open(properties_json_path, "r", encoding="utf-8") as file:
-            species_data = json.load(file)
+        class_counts = PROPERTIES.class_counts(properties_json_path, class_to_analyze)
     except FileNotFoundError:
         print(f"File not found: {properties_json_path}")
         return None
@@ -161,16 +178,11 @@ def _prepare_data_cdf_ppf(
         print(f"Not a valid JSON file: {e}")
         return None
 
-    species_images_data: Dict[str, int] = species_data.get(class_to_analyze, {})
-    if not species_images_data:
+    if class_counts is None or not class_counts.names:
         print(f"ERROR: Class '{class_to_analyze}' not found or contains no data")
         return None
-    sorted_species = sorted(
-        species_images_data.items(), key=lambda x: x[1], reverse=True
-    )
-    species_names, image_counts = zip(*sorted_species)
 
-    return list(species_names), list(image_counts)
+    return list(class_counts.names), class_counts.counts.tolist()
 
 
 def cleanup(**remove_paths):
@@ -1,4 +1,44 @@
-from .manifest_builder import run_manifest_generator
-from .composition import generate_species_composition, split_train_val
-from .exporter import export_dataset_files
-from .identifying_dominant_species import identifying_dominant_species, analyze_single_class
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from dataset_builder._lazy import lazy_exports
+
+_EXPORTS = {
+    "run_manifest_generator": ".manifest_builder",
+    "run_manifest_batch": ".batch",
+    "ManifestVariant": ".batch",
+    "standard_variants": ".batch",
+    "scan_file_table": ".batch",
+    "generate_species_composition": ".composition",
+    "split_train_val": ".composition",
+    "export_dataset_files": ".exporter",
+    "identifying_dominant_species": ".identifying_dominant_species",
+    "analyze_single_class": ".identifying_dominant_species",
+    "sweep_dominance_thresholds": ".identifying_dominant_species",
+    "DominancePolicy": ".dominance_policy",
+    "CombineMode": ".dominance_policy",
+    "select_dominant_species": ".dominance_policy",
+    "LabelRegistry": ".label_registry",
+    "write_class_weights": ".class_weights",
+    "load_class_weights": ".class_weights",
+    "write_embedded_dataset": ".embedded_export",
+    "open_embedded_dataset": ".embedded_export",
+    "write_species_partitions": ".species_partitions",
+    "load_species_partition": ".species_partitions",
+    "list_species_partitions": ".species_partitions",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .manifest_builder import run_manifest_generator
+    from .batch import run_manifest_batch, ManifestVariant, standard_variants, scan_file_table
+    from .composition import generate_species_composition, split_train_val
+    from .exporter import export_dataset_files
+    from .identifying_dominant_species import (
+        identifying_dominant_species, analyze_single_class, sweep_dominance_thresholds
+    )
+    from .dominance_policy import DominancePolicy, CombineMode, select_dominant_species
+    from .label_registry import LabelRegistry
+    from .class_weights import write_class_weights, load_class_weights
+    from .embedded_export import write_embedded_dataset, open_embedded_dataset
+    from .species_partitions import write_species_partitions, load_species_partition, list_species_partitions
@@ -0,0 +1,258 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pyarrow as pa  # type: ignore
+
+from dataset_builder.core.events import add_counters, span, traced
+from dataset_builder.core.exceptions import PipelineError
+from dataset_builder.core.log import log
+from dataset_builder.core.utility import SpeciesDict
+from dataset_builder.manifest.composition import composition_from_labels, split_train_val
+from dataset_builder.manifest.data_preparer import assign_species_labels, get_dominant_species_if_needed, scan_dataset
+from dataset_builder.manifest.dominance_policy import DominancePolicy
+from dataset_builder.manifest.exporter import export_dataset_files
+from dataset_builder.manifest.label_registry import LabelRegistry
+
+ManifestResult = Tuple[List[Tuple[str, int]], List[Tuple[str, int]], List[Tuple[str, int]], Dict[int, str], Dict[str, int]]
+
+
+@dataclass(frozen=True)
+class ManifestVariant:
+    """
+    One manifest derived by `run_manifest_batch`, written to `<output_dir>/<name>/`.
+
+    Attributes:
+        name (str): Name of the variant and of its output directory.
+        threshold (Union[float, DominancePolicy]): Dominance threshold or policy, 1.0 for every species.
+        just_other (bool): Only keep the non-dominant species, each with its own label.
+        binary_classification (bool): Label images as dominant (0) vs. other (1).
+        train_size (Optional[float]): Train fraction, defaults to the batch's.
+        random_state (Optional[int]): Split seed, defaults to the batch's.
+        label_registry_path (Optional[str]): JSON label registry (see `LabelRegistry`) to take the
+            label IDs from, defaults to the batch's. Variants naming the same file share its IDs.
+    """
+    name: str
+    threshold: Union[float, DominancePolicy] = 1.0
+    just_other: bool = False
+    binary_classification: bool = False
+    train_size: Optional[float] = None
+    random_state: Optional[int] = None
+    label_registry_path: Optional[str] = None
+
+
+def standard_variants(threshold: Union[float, DominancePolicy]) -> List[ManifestVariant]:
+    """The four manifests built per region: full, dominant + "Other", just "Other", and binary."""
+    return [
+        ManifestVariant("full"),
+        ManifestVariant("dominant", threshold),
+        ManifestVariant("just_other", threshold, just_other=True),
+        ManifestVariant("binary", threshold, binary_classification=True),
+    ]
+
+
+@dataclass
+class FileTable:
+    """
+    Columnar listing of a dataset, one row per image.
+
+    Rows are grouped by species and species by class, both in sorted order:
+    the images of species `e` are rows `offsets[e]:offsets[e + 1]`, and the species
+    of class `c` are `class_offsets[c]:class_offsets[c + 1]`.
+    """
+    classes: List[str]
+    class_offsets: np.ndarray
+    species: List[str]
+    offsets: np.ndarray
+    image_paths: np.ndarray  # object array of str
+
+    def __len__(self) -> int:
+        return len(self.image_paths)
+
+    def to_arrow(self) -> pa.Table:
+        species_sizes = np.diff(self.offsets)
+        species_class = np.repeat(np.arange(len(self.classes)), np.diff(self.class_offsets))
+        return pa.table({
+            "class": pa.DictionaryArray.from_arrays(
+                pa.array(np.repeat(species_class, species_sizes), pa.int32()), pa.array(self.classes, pa.string())
+            ),
+            "species": pa.DictionaryArray.from_arrays(
+                pa.array(np.repeat(np.arange(len(self.species)), species_sizes), pa.int32()),
+                pa.array(self.species, pa.string()),
+            ),
+            "image_path": pa.array(self.image_paths.tolist(), pa.string()),
+        })
+
+
+def scan_file_table(
+    data_dir: str,
+    max_workers: Optional[int] = None,
+    max_images_per_species: Optional[int] = None,
+    seed: int = 0,
+) -> FileTable:
+    """
+    Walks the dataset once (see `scan_dataset`) and returns it as a `FileTable`.
+
+    Args:
+        data_dir (str): Root of the dataset, a local directory, archive or `s3://` URL.
+        max_workers (Optional[int]): Number of listing threads.
+        max_images_per_species (Optional[int]): Cap on the images kept per species.
+        seed (int): Seed of the per-species sample.
+
+    Returns:
+        FileTable: The images of every species of every class.
+    """
+    class_names, _, scanned = scan_dataset(data_dir, max_workers, max_images_per_species, seed)
+    species: List[str] = []
+    image_paths: List[str] = []
+    offsets = [0]
+    class_offsets = [0]
+    for species_files in scanned:
+        for species_name, species_path, img_files in species_files:
+            species.append(species_name)
+            image_paths.extend(os.path.join(species_path, img_file) for img_file in img_files)
+            offsets.append(len(image_paths))
+        class_offsets.append(len(species))
+    paths = np.empty(len(image_paths), dtype=object)
+    paths[:] = image_paths
+    return FileTable(class_names, np.array(class_offsets, dtype=np.int64), species, np.array(offsets, dtype=np.int64), paths)
+
+
+def relabel_file_table(
+    table: FileTable,
+    dominant_species: Optional[SpeciesDict],
+    just_other: bool = False,
+    binary_classification: bool = False,
+    label_registry: Optional[LabelRegistry] = None,
+) -> Tuple[List[Tuple[str, int]], Dict[int, str]]:
+    """
+    Labels a `FileTable` the way `collect_images` labels the tree it walks.
+
+    Labels are decided once per species with `assign_species_labels`; the rows are
+    then reordered and labelled with NumPy, without touching the images one by one.
+    With a `label_registry`, the IDs are taken from it and new species are appended to it.
+
+    Returns:
+        Tuple containing the (image_path, label) list, in the order `collect_images`
+        produces it, and the mapping from label ID to species name.
+    """
+    species_to_id: Dict[str, int] = {}
+    species_dict: Dict[int, str] = {}
+    current_id = 0
+    kept_species: List[int] = []
+    kept_labels: List[int] = []
+    for c, class_name in enumerate(table.classes):
+        first, last = table.class_offsets[c], table.class_offsets[c + 1]
+        species_labels, current_id = assign_species_labels(
+            class_name, table.species[first:last], dominant_species, species_to_id, species_dict, current_id,
+            just_other, binary_classification, label_registry,
+        )
+        kept_species.extend(first + index for index, _ in species_labels)
+        kept_labels.extend(int(label) for _, label in species_labels)
+
+    entries = np.array(kept_species, dtype=np.int64)
+    starts = table.offsets[entries]
+    sizes = table.offsets[entries + 1] - starts
+    # Row indices of the kept species, concatenated in labelling order
+    rows = np.repeat(starts - np.concatenate([[0], np.cumsum(sizes)[:-1]]), sizes) + np.arange(sizes.sum())
+    labels = np.repeat(np.array(kept_labels, dtype=np.int64), sizes)
+    image_list = list(zip(table.image_paths[rows].tolist(), labels.tolist()))
+    return image_list, dict(sorted(species_dict.items()))
+
+
+@traced("manifest_batch")
+def run_manifest_batch(
+    data_dir: str,
+    output_dir: str,
+    dataset_properties_path: str,
+    train_size: float,
+    random_state: int,
+    target_classes: List[str],
+    variants: List[ManifestVariant],
+    per_species_list: bool = False,
+    export: bool = True,
+    embed_format: Optional[str] = None,
+    relative_paths: bool = False,
+    max_images_per_species: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    label_registry_path: Optional[str] = None,
+) -> Dict[str, ManifestResult]:
+    """
+    Builds several manifest variants of a dataset from a single scan.
+
+    The tree is walked once into a `FileTable`; each variant is then derived from
+    it with `relabel_file_table`, split and exported to `<output_dir>/<variant name>/`.
+    Each variant's output matches a `run_manifest_generator` call with the same options.
+    Label registries are loaded once per file and saved after every variant is derived.
+
+    Args:
+        data_dir (str): Root path of the dataset, organized by class and species folders.
+        output_dir (str): Parent directory of the variants' output directories.
+        dataset_properties_path (str): Path to the JSON file with precomputed image counts.
+        train_size (float): Default fraction of data to use for training.
+        random_state (int): Default split seed, also the seed of the per-species sample.
+        target_classes (List[str]): Classes analyzed for dominant species.
+        variants (List[ManifestVariant]): Manifests to build, see `standard_variants`.
+        per_species_list (bool, optional): Whether to export per-species image manifests. Default is False.
+        export (bool, optional): Whether to save dataset files to disk. Default is True.
+        embed_format (Optional[str], optional): "parquet" or "arrow" to also export embedded images.
+        relative_paths (bool, optional): Store manifest paths relative to `data_dir`. Default is False.
+        max_images_per_species (Optional[int], optional): Cap on the images kept per species.
+        max_workers (Optional[int], optional): Number of threads scanning the dataset.
+        label_registry_path (Optional[str], optional): Default label registry of the variants that
+            do not set their own, see `ManifestVariant`. Default is None (IDs follow the sorted listing).
+
+    Returns:
+        Dict[str, ManifestResult]: For each variant name, the image list, train and val splits,
+        label mapping and species composition, as returned by `run_manifest_generator`.
+
+    Raises:
+        PipelineError: If two variants share a name.
+    """
+    names = [variant.name for variant in variants]
+    if len(set(names)) != len(names):
+        raise PipelineError(f"Manifest variant names must be unique, got {names}")
+
+    with span("scan"):
+        table = scan_file_table(data_dir, max_workers, max_images_per_species, random_state)
+    add_counters(files=len(table), species=len(table.species), variants=len(variants))
+
+    registries: Dict[str, LabelRegistry] = {}
+    results: Dict[str, ManifestResult] = {}
+    for variant in variants:
+        with span("variant", variant=variant.name):
+            registry_path = variant.label_registry_path or label_registry_path
+            label_registry = None
+            if registry_path:
+                if registry_path not in registries:
+                    registries[registry_path] = LabelRegistry(registry_path)
+                label_registry = registries[registry_path]
+            dominant_species = get_dominant_species_if_needed(dataset_properties_path, variant.threshold, target_classes)
+            image_list, species_dict = relabel_file_table(
+                table, dominant_species, variant.just_other, variant.binary_classification, label_registry
+            )
+            labels = np.fromiter((label for _, label in image_list), dtype=np.int64, count=len(image_list))
+            species_composition = composition_from_labels(labels, species_dict)
+            train_data, val_data = split_train_val(
+                image_list,
+                variant.train_size if variant.train_size is not None else train_size,
+                variant.random_state if variant.random_state is not None else random_state,
+            )
+            if export:
+                export_dataset_files(
+                    os.path.join(output_dir, variant.name), image_list, train_data, val_data, species_dict,
+                    species_composition, per_species_list,
+                    embed_format=embed_format,
+                    relative_root=data_dir if relative_paths else None,
+                )
+            print(f"[{variant.name}] Total species: {len(species_dict)} | Total Images: {len(image_list)} "
+                  f"| Train: {len(train_data)} | Val: {len(val_data)}")
+            results[variant.name] = (image_list, train_data, val_data, species_dict, species_composition)
+
+    for label_registry in registries.values():
+        if label_registry.added:
+            log(f"Label registry {label_registry.path}: {len(label_registry.added)} new labels, "
+                f"{len(label_registry)} in total", True)
+        label_registry.save()
+    return results
@@ -0,0 +1,108 @@
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from dataset_builder.core.exceptions import PipelineError
+
+CLASS_WEIGHTS_DIR = "class_weights"
+DEFAULT_BETA = 0.999
+
+# Arrays written by `write_class_weights`, one `.npy` file each
+LABEL_COUNTS = "label_counts"  # int64, images per label id in the train split
+INVERSE_FREQUENCY = "inverse_frequency"  # float32, N / (C * n_c) per label id
+EFFECTIVE_NUMBER = "effective_number"  # float32, (1 - beta) / (1 - beta^n_c) per label id, normalized
+SAMPLE_WEIGHTS = "train_sample_weights"  # float32, one weight per row of train.parquet
+WEIGHT_ARRAYS = (LABEL_COUNTS, INVERSE_FREQUENCY, EFFECTIVE_NUMBER, SAMPLE_WEIGHTS)
+
+
+def compute_class_weights(
+    labels: np.ndarray,
+    num_labels: int,
+    beta: float = DEFAULT_BETA,
+) -> Dict[str, np.ndarray]:
+    """
+    Computes per-label counts, class weights and per-row sampling weights.
+
+    Weights are indexed by label id; labels without images get a weight of 0, and
+    both weightings are scaled so they average to 1 over the labels that occur.
+    The per-row weight is the inverse-frequency weight of the row's label, so a
+    weighted sampler draws every label equally often, "Other" included.
+
+    Args:
+        labels (np.ndarray): Label id of every training row.
+        num_labels (int): Number of label ids (the largest id plus one).
+        beta (float): Effective-number hyperparameter, in [0, 1).
+
+    Returns:
+        Dict[str, np.ndarray]: The arrays of `WEIGHT_ARRAYS`, by name.
+
+    Raises:
+        PipelineError: If `beta` is outside [0, 1) or a label is outside [0, num_labels).
+    """
+    if not 0 <= beta < 1:
+        raise PipelineError("'beta' must be in [0, 1)")
+    labels = np.asarray(labels, dtype=np.int64)
+    if labels.size and (labels.min() < 0 or labels.max() >= num_labels):
+        raise PipelineError(f"Label ids must be in [0, {num_labels})")
+
+    counts = np.bincount(labels, minlength=num_labels).astype(np.int64)
+    present = counts > 0
+    inverse = np.zeros(num_labels, dtype=np.float64)
+    effective = np.zeros(num_labels, dtype=np.float64)
+    if present.any():
+        inverse[present] = labels.size / (present.sum() * counts[present])
+        effective[present] = (1.0 - beta) / -np.expm1(counts[present] * np.log(beta)) if beta > 0 else 1.0
+        effective[present] *= present.sum() / effective[present].sum()
+
+    return {
+        LABEL_COUNTS: counts,
+        INVERSE_FREQUENCY: inverse.astype(np.float32),
+        EFFECTIVE_NUMBER: effective.astype(np.float32),
+        SAMPLE_WEIGHTS: inverse[labels].astype(np.float32),
+    }
+
+
+def write_class_weights(
+    output_dir: str,
+    train_data: List[Tuple[str, int]],
+    species_dict: Dict[int, str],
+    beta: float = DEFAULT_BETA,
+) -> str:
+    """
+    Writes the class weights of the train split as `.npy` files under `<output_dir>/class_weights/`.
+
+    Each array is a plain, uncompressed `.npy` file, so trainers can map it with
+    `np.load(path, mmap_mode="r")` (see `load_class_weights`) instead of
+    recomputing the weights from `train.parquet`.
+
+    Args:
+        output_dir (str): Directory of the exported manifests.
+        train_data (List[Tuple[str, int]]): Training split, in the row order of `train.parquet`.
+        species_dict (Dict[int, str]): Mapping from label IDs to species names.
+        beta (float): Effective-number hyperparameter, see `compute_class_weights`.
+
+    Returns:
+        str: The directory the arrays were written to.
+    """
+    labels = np.fromiter((label for _, label in train_data), dtype=np.int64, count=len(train_data))
+    num_labels = max([int(label) for label in species_dict] + [int(labels.max()) if labels.size else -1]) + 1
+    weights_dir = os.path.join(output_dir, CLASS_WEIGHTS_DIR)
+    os.makedirs(weights_dir, exist_ok=True)
+    for name, array in compute_class_weights(labels, num_labels, beta).items():
+        np.save(os.path.join(weights_dir, f"{name}.npy"), array)
+    return weights_dir
+
+
+def load_class_weights(output_dir: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Loads the arrays written by `write_class_weights`, memory-mapped read-only by default.
+
+    Raises:
+        FileNotFoundError: If the manifests were exported without class weights.
+    """
+    weights_dir = os.path.join(output_dir, CLASS_WEIGHTS_DIR)
+    return {
+        name: np.load(os.path.join(weights_dir, f"{name}.npy"), mmap_mode="r" if mmap else None)
+        for name in WEIGHT_ARRAYS
+    }
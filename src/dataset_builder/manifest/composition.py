@@ -1,4 +1,5 @@
 from typing import List, Dict, Tuple
+import numpy as np
 from sklearn.model_selection import train_test_split  # type: ignore
 from dataset_builder.core.log import log
 
@@ -37,6 +38,25 @@ def generate_species_composition(
     return species_composition
 
 
+def composition_from_labels(labels: np.ndarray, species_dict: Dict[int, str]) -> Dict[str, int]:
+    """
+    Vectorized `generate_species_composition` for an array of labels.
+
+    Args:
+        labels (np.ndarray): Label ID of every image.
+        species_dict (Dict[int, str]): A mapping from integer species ID to species name.
+
+    Returns:
+        Dict[str, int]: A dictionary mapping species names to the number of images belonging to them.
+    """
+    size = max([int(label) for label in species_dict] + [int(labels.max()) if labels.size else -1]) + 1
+    counts = np.bincount(labels, minlength=size) if labels.size else np.zeros(size, dtype=np.int64)
+    species_composition = {species_name: int(counts[label]) for label, species_name in species_dict.items()}
+    totals = [int(counts[label]) for label in species_dict]
+    log(f"Highest vs lowest amount of representation: {max(totals, default=0)} / {min(totals, default=99999999)}")
+    return species_composition
+
+
 def split_train_val(
     image_list: List[Tuple[str, int]],
     train_size: float,
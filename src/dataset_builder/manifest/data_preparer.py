@@ -1,11 +1,20 @@
+import hashlib
+import heapq
 import os
-from typing import List, Optional, Dict, Set, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, List, Optional, Dict, Set, Tuple, Union
+from dataset_builder.core.storage import Storage, is_local_dir, join_key, open_storage
 from dataset_builder.core.utility import SpeciesDict
 from dataset_builder.core.log import log
+from dataset_builder.manifest.dominance_policy import DominancePolicy, select_dominant_species
 from dataset_builder.manifest.identifying_dominant_species import identifying_dominant_species
+from dataset_builder.manifest.label_registry import OTHER_LABEL, LabelRegistry
 from dataset_builder.core.exceptions import PipelineError
 from enum import IntEnum
 
+SpeciesFiles = List[Tuple[str, str, List[str]]]
+
 
 class BinarySpeciesType(IntEnum):
     DOMINANT = 0
@@ -14,15 +23,229 @@ class BinarySpeciesType(IntEnum):
 
 def get_dominant_species_if_needed(
     dataset_properties_path: str,
-    threshold: float,
+    threshold: Union[float, DominancePolicy],
     target_classes: List[str]
 ) -> Optional[SpeciesDict]:
+    """
+    Selects the dominant species, or returns None when every species keeps its own label.
+
+    Args:
+        dataset_properties_path (str): Path to the JSON file with precomputed image counts.
+        threshold (Union[float, DominancePolicy]): Per-class CDF threshold, 1.0 to keep every
+            species, or a `DominancePolicy` combining several rules.
+        target_classes (List[str]): Classes to analyze.
+
+    Returns:
+        Optional[SpeciesDict]: Dominant species per class, or None for a threshold of 1.0.
+    """
+    if isinstance(threshold, DominancePolicy):
+        return select_dominant_species(dataset_properties_path, threshold, target_classes)
     if threshold == 1.0:
         log("Selecting the entire dataset, no 'Other' label.", True)
         return None
     return identifying_dominant_species(dataset_properties_path, threshold, target_classes)
 
 
+def _list_species_dirs(class_path: str) -> List[Tuple[str, str]]:
+    """Lists the species subdirectories of a class directory, sorted by name."""
+    with os.scandir(class_path) as entries:
+        species_dirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+    return sorted(species_dirs)
+
+
+def _sample_key(name: str, seed: int) -> int:
+    return int.from_bytes(hashlib.blake2b(name.encode("utf-8"), digest_size=8, key=str(seed).encode()).digest(), "big")
+
+
+def sample_image_files(names: Iterable[str], max_files: int, seed: int = 0) -> List[str]:
+    """
+    Draws a uniform sample of at most `max_files` names from a stream, sorted by name.
+
+    Reservoir sampling with random sort keys: each name gets a pseudo-random key
+    from a hash seeded with `seed`, and the reservoir keeps the `max_files` smallest
+    keys in a heap. Memory stays proportional to `max_files`, and since the keys
+    depend only on the names and the seed, the sample does not depend on the order
+    the directory is listed in (sampling an already sampled list returns it unchanged).
+
+    Args:
+        names (Iterable[str]): File names, e.g. streamed from `os.scandir`.
+        max_files (int): Size of the sample.
+        seed (int): Seed of the sample.
+
+    Returns:
+        List[str]: The sampled names, sorted.
+    """
+    reservoir: List[Tuple[int, str]] = []  # max-heap of the kept keys, stored negated
+    if max_files <= 0:
+        return []
+    for name in names:
+        item = (-_sample_key(name, seed), name)
+        if len(reservoir) < max_files:
+            heapq.heappush(reservoir, item)
+        elif item > reservoir[0]:
+            heapq.heapreplace(reservoir, item)
+    return sorted(name for _, name in reservoir)
+
+
+def _list_image_files(species_path: str, max_files: Optional[int] = None, seed: int = 0) -> List[str]:
+    """Lists the image file names of a species directory, sorted by name, sampling at most `max_files`."""
+    if max_files is None:
+        return sorted(os.listdir(species_path))
+    with os.scandir(species_path) as entries:
+        return sample_image_files((entry.name for entry in entries), max_files, seed)
+
+
+def scan_class_dirs(
+    class_paths: List[str],
+    max_workers: Optional[int] = None,
+    storage: Optional[Storage] = None,
+    max_files_per_species: Optional[int] = None,
+    seed: int = 0,
+) -> List[SpeciesFiles]:
+    """
+    Lists the species and image files of several class directories on a thread pool.
+
+    Every directory is listed exactly once: first the class directories (one task per
+    class), then all their species directories (one task per species). Results are
+    sorted by name and returned in the order of `class_paths`, so they do not depend
+    on scheduling.
+
+    With a `storage`, `class_paths` are keys in it and the species paths returned are
+    `storage.uri(...)` locations; on S3 each class costs a single paginated listing.
+
+    With `max_files_per_species`, species directories are sampled while they are
+    listed (see `sample_image_files`), so large species are never held in full.
+
+    Args:
+        class_paths (List[str]): Class directories to scan.
+        max_workers (Optional[int]): Number of worker threads. Defaults to the executor's default.
+        storage (Optional[Storage]): Storage backend holding the classes. Defaults to the local filesystem.
+        max_files_per_species (Optional[int]): Maximum number of files listed per species. Defaults to all.
+        seed (int): Seed of the per-species sample.
+
+    Returns:
+        List[SpeciesFiles]: For each class, its (species, species_path, image_files) entries.
+    """
+    if storage is not None:
+        return _scan_storage_class_dirs(storage, class_paths, max_workers, max_files_per_species, seed)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        species_per_class = list(executor.map(_list_species_dirs, class_paths))
+        flat_species = [species_path for species_dirs in species_per_class for _, species_path in species_dirs]
+        files_iter = executor.map(partial(_list_image_files, max_files=max_files_per_species, seed=seed), flat_species)
+
+        scanned: List[SpeciesFiles] = []
+        for species_dirs in species_per_class:
+            scanned.append([(species, species_path, next(files_iter)) for species, species_path in species_dirs])
+    return scanned
+
+
+def _scan_storage_class_dirs(
+    storage: Storage,
+    class_keys: List[str],
+    max_workers: Optional[int],
+    max_files_per_species: Optional[int] = None,
+    seed: int = 0,
+) -> List[SpeciesFiles]:
+    def _list_files(species_key: str) -> List[str]:
+        files = storage.list_dir(species_key).files
+        if max_files_per_species is None:
+            return sorted(files)
+        return sample_image_files(files, max_files_per_species, seed)
+
+    def _scan_class(class_key: str) -> SpeciesFiles:
+        return [
+            (species, storage.uri(join_key(class_key, species)), _list_files(join_key(class_key, species)))
+            for species in sorted(storage.list_dir(class_key).dirs)
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_scan_class, class_keys))
+
+
+def assign_species_labels(
+    class_name: str,
+    species_names: List[str],
+    dominant_species: Optional[Dict[str, List[str]]],
+    species_to_id: Dict[str, int],
+    species_dict: Dict[int, str],
+    current_id: int,
+    just_other: bool = False,
+    binary_classification: bool = False,
+    label_registry: Optional[LabelRegistry] = None,
+) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Decides the label of every species of a class, without touching its images.
+
+    This holds the labelling rules of `collect_images_by_dominance`, which then
+    lists the images of each species under its label; batch manifests apply the
+    same rules and relabel a whole file table at once (see `run_manifest_batch`).
+
+    Args:
+        class_name: The species class to process.
+        species_names: Species of the class, in listing order.
+        dominant_species: A dictionary of dominant species by class.
+        species_to_id: A mapping of species names to unique IDs, updated in place.
+        species_dict: A mapping of species IDs to species names, updated in place.
+        current_id: The current species ID to assign.
+        just_other: Only keep the non-dominant species, each with its own label.
+        binary_classification: Label species as dominant (0) vs. other (1).
+        label_registry: Persistent registry to take the IDs from, see `collect_images_by_dominance`.
+
+    Returns:
+        Tuple containing:
+            - (index in `species_names`, label) of the kept species, in the order their images are listed.
+            - The updated species ID.
+
+    Raises:
+        PipelineError: If both `just_other` and `binary_classification` are enabled.
+    """
+    dominant_set: Optional[Set[str]] = set(dominant_species.get(class_name, [])) if dominant_species else None
+    labels: List[Tuple[int, int]] = []
+
+    def _assign_label(species: str) -> int:
+        nonlocal current_id
+        if label_registry is not None:
+            label = species_to_id[species] = label_registry.label_for(species)
+            species_dict[label] = species
+            return label
+        label = species_to_id.setdefault(species, current_id)
+        if label == current_id:
+            species_dict[current_id] = species
+            current_id += 1
+        return label
+
+    if dominant_set is None:
+        labels = [(i, _assign_label(species)) for i, species in enumerate(species_names)]
+    elif just_other and dominant_set and not binary_classification:
+        print("Generating for just 'Other'")
+        labels = [(i, _assign_label(species)) for i, species in enumerate(species_names) if species not in dominant_set]
+    elif binary_classification and dominant_set and not just_other:
+        labels = [
+            (i, BinarySpeciesType.DOMINANT if species in dominant_set else BinarySpeciesType.OTHER)
+            for i, species in enumerate(species_names)
+        ]
+        species_dict[BinarySpeciesType.DOMINANT] = "Dominant"
+        species_dict[BinarySpeciesType.OTHER] = "Other"
+    elif binary_classification and just_other:
+        raise PipelineError("Cannot enable both 'binary_classification' and 'just_other' option.")
+    else:
+        # First pass: dominant species
+        labels = [(i, _assign_label(species)) for i, species in enumerate(species_names) if species in dominant_set]
+
+        # Second pass: non-dominant species → "Other"
+        if label_registry is not None:
+            other_label = label_registry.label_for(OTHER_LABEL)
+        else:
+            other_label = sum(len(species_list) for species_list in dominant_species.values())  # type: ignore
+        labels.extend((i, other_label) for i, species in enumerate(species_names) if species not in dominant_set)
+
+        # No species is ever given `other_label`, so the key alone tells whether "Other" is set
+        species_dict.setdefault(other_label, OTHER_LABEL)
+
+    return labels, current_id
+
+
 def collect_images_by_dominance(
     dataset_path: str,
     class_name: str,
@@ -32,13 +255,18 @@ def collect_images_by_dominance(
     image_list: List[Tuple[str, int]],
     current_id: int,
     just_other: bool = False,
-    binary_classification: bool=False
+    binary_classification: bool = False,
+    species_files: Optional[SpeciesFiles] = None,
+    max_images_per_species: Optional[int] = None,
+    seed: int = 0,
+    label_registry: Optional[LabelRegistry] = None,
 ) -> int:
     """
     Collects image paths for dominant and non-dominant species from the dataset.
 
     First, it processes dominant species, assigning unique species IDs. Then, it 
     processes non-dominant species, assigning them to the "Other" category.
+    Species are visited in sorted order and every directory is listed once.
 
     Args:
         dataset_path: The path to the dataset containing species folders.
@@ -48,6 +276,16 @@ def collect_images_by_dominance(
         species_dict: A mapping of species IDs to species names.
         image_list: The list to accumulate image paths and their corresponding species IDs.
         current_id: The current species ID to assign.
+        just_other: Only keep the non-dominant species, each with its own label.
+        binary_classification: Label images as dominant (0) vs. other (1).
+        species_files: Pre-scanned listing of `dataset_path` from `scan_class_dirs`.
+            If None, the directory is listed here.
+        max_images_per_species: Keep at most this many images per species, sampled with
+            `sample_image_files` while the directories are listed. Defaults to all images.
+        seed: Seed of the per-species sample.
+        label_registry: Persistent registry to take the species and "Other" IDs from, extended
+            with the species it does not know yet. Ignored for binary classification, whose labels
+            are fixed. If None, IDs are assigned sequentially from `current_id`.
 
     Returns:
         int: The updated species ID after processing the species.
@@ -55,89 +293,75 @@ def collect_images_by_dominance(
     Raises:
         FailedOperation: If no dominant species are found for the given class.
     """
-    dominant_set: Optional[Set[str]] = set(dominant_species.get(class_name, [])) if dominant_species else None
+    if max_images_per_species is not None and max_images_per_species <= 0:
+        raise PipelineError("'max_images_per_species' must be a positive number of images")
+    if species_files is None:
+        species_files = scan_class_dirs(
+            [dataset_path], max_workers=1, max_files_per_species=max_images_per_species, seed=seed
+        )[0]
 
-    if dominant_set is None:
-        for species in sorted(os.listdir(dataset_path)):
-            species_path = os.path.join(dataset_path, species)
-            if not os.path.isdir(species_path):
-                continue
-            label = species_to_id.setdefault(species, current_id)
-            if label == current_id:
-                species_dict[current_id] = species
-                current_id += 1
-            for img_file in os.listdir(species_path):
-                img_path = os.path.join(species_path, img_file)
-                image_list.append((img_path, label))
-    elif just_other and dominant_set and not binary_classification:
-        print("Generating for just 'Other'")
-        for species in sorted(os.listdir(dataset_path)):
-            if species in dominant_set:
-                continue
-            species_path = os.path.join(dataset_path, species)
-            if not os.path.isdir(species_path):
-                continue
-            label = species_to_id.setdefault(species, current_id)
-            if label == current_id:
-                species_dict[current_id] = species
-                current_id += 1
-            for img_file in os.listdir(species_path):
-                img_path = os.path.join(species_path, img_file)
-                image_list.append((img_path, label))       
-    elif binary_classification and dominant_set and not just_other:
-        for species in sorted(os.listdir(dataset_path)):
-            species_path = os.path.join(dataset_path, species)
-            if not os.path.isdir(species_path):
-                continue
-            if species in dominant_set:
-                for img_file in os.listdir(species_path):
-                    img_path = os.path.join(species_path, img_file)
-                    image_list.append((img_path, BinarySpeciesType.DOMINANT))
-            else:
-                for img_file in os.listdir(species_path):
-                    img_path = os.path.join(species_path, img_file)
-                    image_list.append((img_path, BinarySpeciesType.OTHER))
-        species_dict[BinarySpeciesType.DOMINANT] = "Dominant"
-        species_dict[BinarySpeciesType.OTHER] = "Other"
-    elif binary_classification and just_other:
-        raise PipelineError("Cannot enable both 'binary_classification' and 'just_other' option.")
-    else:
-        # First pass: dominant species
-        for species in sorted(os.listdir(dataset_path)):
-            species_path = os.path.join(dataset_path, species)
-            if not os.path.isdir(species_path):
-                continue
-            if species in dominant_set:
-                label = species_to_id.setdefault(species, current_id)
-                if label == current_id:
-                    species_dict[current_id] = species
-                    current_id += 1
-                for img_file in os.listdir(species_path):
-                    img_path = os.path.join(species_path, img_file)
-                    image_list.append((img_path, label))
+    def _add_species(species_path: str, img_files: List[str], label: int) -> None:
+        if max_images_per_species is not None and len(img_files) > max_images_per_species:
+            # Listings scanned without the cap; a no-op on already sampled ones
+            img_files = sample_image_files(img_files, max_images_per_species, seed)
+        image_list.extend((os.path.join(species_path, img_file), label) for img_file in img_files)
 
-        # Second pass: non-dominant species → "Other"
-        other_label = sum(len(species_list) for species_list in dominant_species.values())  # type: ignore
-        for species in os.listdir(dataset_path):
-            species_path = os.path.join(dataset_path, species)
-            if not os.path.isdir(species_path):
-                continue
-            if species not in dominant_set:
-                for img_file in os.listdir(species_path):
-                    img_path = os.path.join(species_path, img_file)
-                    image_list.append((img_path, other_label))
-
-        if "Other" not in species_dict.values():
-            species_dict[other_label] = "Other"
+    species_labels, current_id = assign_species_labels(
+        class_name,
+        [species for species, _, _ in species_files],
+        dominant_species,
+        species_to_id,
+        species_dict,
+        current_id,
+        just_other,
+        binary_classification,
+        label_registry,
+    )
+    for index, label in species_labels:
+        _, species_path, img_files = species_files[index]
+        _add_species(species_path, img_files, label)
 
     return current_id
 
 
+def scan_dataset(
+    data_dir: str,
+    max_workers: Optional[int] = None,
+    max_images_per_species: Optional[int] = None,
+    seed: int = 0,
+) -> Tuple[List[str], List[str], List[SpeciesFiles]]:
+    """
+    Lists the classes of a dataset and scans them with `scan_class_dirs`.
+
+    Returns:
+        Tuple containing the sorted class names, their paths (or storage URIs), and
+        the (species, species_path, image_files) listing of each class.
+    """
+    if is_local_dir(data_dir):
+        class_names = [
+            class_name
+            for class_name in sorted(os.listdir(data_dir))
+            if os.path.isdir(os.path.join(data_dir, class_name)) or class_name == "species_lists"
+        ]
+        class_paths = [os.path.join(data_dir, class_name) for class_name in class_names]
+        return class_names, class_paths, scan_class_dirs(
+            class_paths, max_workers, max_files_per_species=max_images_per_species, seed=seed
+        )
+    storage = open_storage(data_dir)
+    class_names = sorted(storage.list_dir().dirs)
+    class_paths = [storage.uri(class_name) for class_name in class_names]
+    return class_names, class_paths, scan_class_dirs(class_names, max_workers, storage, max_images_per_species, seed)
+
+
 def collect_images(
     data_dir: str,
     dominant_species: Optional[SpeciesDict],
     just_other: bool = False,
-    binary_classification: bool = False
+    binary_classification: bool = False,
+    max_workers: Optional[int] = None,
+    max_images_per_species: Optional[int] = None,
+    seed: int = 0,
+    label_registry: Optional[LabelRegistry] = None,
 ) -> Tuple[List[Tuple[str, int]], Dict[int, str], Dict[str, int]]:
     """
     Collects all image paths and assigns labels to species in a dataset directory.
@@ -146,11 +370,26 @@ def collect_images(
     dominant species list to determine whether to include all species or map 
     non-dominant ones to a shared "Other" class.
 
+    Directories are listed in parallel (see `scan_class_dirs`), while labels are
+    assigned afterwards in sorted class and species order, so the result is
+    reproducible regardless of how the listing work was scheduled.
+
+    `data_dir` may also be a zip archive or an `s3://` URL (see `open_storage`);
+    image paths are then the storage's URIs.
+
     Args:
         data_dir (str): Root directory containing class folders with species subdirectories.
         dominant_species (Optional[SpeciesDict]): Mapping from class names to lists of dominant species.
             If None, all species are considered. If provided, only dominant species are individually labeled;
             others are grouped under an "Other" label.
+        just_other (bool): Only keep the non-dominant species, each with its own label.
+        binary_classification (bool): Label images as dominant (0) vs. other (1).
+        max_workers (Optional[int]): Number of threads listing class and species directories.
+        max_images_per_species (Optional[int]): Cap on the images kept per species, sampled during
+            the directory walk. Defaults to all images.
+        seed (int): Seed of the per-species sample.
+        label_registry (Optional[LabelRegistry]): Registry keeping label IDs stable across runs,
+            extended in memory with new species (the caller saves it).
 
     Returns:
         Tuple containing:
@@ -163,20 +402,25 @@ def collect_images(
     image_list: List[Tuple[str, int]] = []
     current_id = 0
 
-    for class_name in os.listdir(data_dir):
-        class_path = os.path.join(data_dir, class_name)
-        if os.path.isdir(class_path) or class_name == "species_lists":
-            current_id = collect_images_by_dominance(
-                class_path,
-                class_name,
-                dominant_species,
-                species_to_id,
-                species_dict,
-                image_list,
-                current_id,
-                just_other,
-                binary_classification
-            )
+    class_names, class_paths, scanned = scan_dataset(data_dir, max_workers, max_images_per_species, seed)
+
+    # Labels are assigned sequentially over the sorted listings, independent of scheduling
+    for class_name, class_path, species_files in zip(class_names, class_paths, scanned):
+        current_id = collect_images_by_dominance(
+            class_path,
+            class_name,
+            dominant_species,
+            species_to_id,
+            species_dict,
+            image_list,
+            current_id,
+            just_other,
+            binary_classification,
+            species_files,
+            max_images_per_species,
+            seed,
+            label_registry,
+        )
     species_dict = dict(sorted(species_dict.items()))
 
     return image_list, species_dict, species_to_id
\ No newline at end of file
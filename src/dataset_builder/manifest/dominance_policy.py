@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from dataset_builder.core.exceptions import PipelineError
+from dataset_builder.core.properties import PROPERTIES, ClassCounts
+from dataset_builder.core.utility import SpeciesDict
+
+
+class CombineMode(Enum):
+    ALL = "all"  # dominant if every rule selects the species
+    ANY = "any"  # dominant if at least one rule selects it
+
+
+@dataclass(frozen=True)
+class DominancePolicy:
+    """
+    Rules deciding which species are dominant; the others are grouped into "Other".
+
+    Every rule left to None is ignored, the ones that are set are combined with `mode`.
+
+    Attributes:
+        class_cdf (Optional[float]): Per-class cumulative threshold, as in `analyze_single_class`.
+        global_cdf (Optional[float]): Cumulative threshold over the species of all analyzed classes together.
+        top_k (Optional[int]): Number of largest species kept per class (ties broken by file order).
+        min_images (Optional[int]): Minimum number of images of a species.
+        mode (CombineMode): How the rules that are set are combined.
+    """
+    class_cdf: Optional[float] = None
+    global_cdf: Optional[float] = None
+    top_k: Optional[int] = None
+    min_images: Optional[int] = None
+    mode: CombineMode = CombineMode.ALL
+
+    def __post_init__(self):
+        if all(rule is None for rule in (self.class_cdf, self.global_cdf, self.top_k, self.min_images)):
+            raise PipelineError("A dominance policy needs at least one rule")
+        for name in ("class_cdf", "global_cdf"):
+            value = getattr(self, name)
+            if value is not None and not 0 <= value <= 1:
+                raise PipelineError(f"{name} must be between 0 and 1")
+        for name in ("top_k", "min_images"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise PipelineError(f"{name} must not be negative")
+
+
+def _global_cdf_cutoff(counts: np.ndarray, threshold: float) -> int:
+    """Image count of the species where the CDF of all `counts`, largest first, reaches `threshold`."""
+    ranked = -np.sort(-counts)
+    cumulative = np.cumsum(ranked)
+    cdf_values = cumulative / cumulative[-1]
+    cut_index = min(int(np.searchsorted(cdf_values, threshold, side="left")), len(ranked) - 1)
+    if cut_index == 0 and cdf_values[0] > threshold:
+        raise PipelineError(
+            f"Threshold {threshold:.2f} is too low to select any meaningful dominant species in the included classes"
+            f"\nMinimum: {cdf_values[0]}"
+        )
+    return int(ranked[cut_index])
+
+
+def select_dominant_species(
+    properties_json_path: str,
+    policy: DominancePolicy,
+    classes_to_analyze: List[str],
+) -> SpeciesDict:
+    """
+    Selects the dominant species of several classes according to a `DominancePolicy`.
+
+    The properties file is read once (through the shared store). The sorted counts
+    of all classes are concatenated into one array and every rule is evaluated on it
+    as a boolean mask, so the cost does not grow with the number of per-class reads.
+    Like `analyze_single_class`, CDF rules keep every species tied with the cut-off count.
+
+    Args:
+        properties_json_path (str): Path to the JSON file containing image statistics per species per class.
+        policy (DominancePolicy): Rules to apply.
+        classes_to_analyze (List[str]): Classes to analyze; the global CDF spans all of them.
+
+    Returns:
+        SpeciesDict: Dominant species per class, largest first.
+
+    Raises:
+        PipelineError: If the properties file or a class cannot be loaded, or a CDF
+            threshold is too low to select any species.
+    """
+    try:
+        properties = PROPERTIES.load(properties_json_path)
+    except (OSError, ValueError) as e:
+        raise PipelineError(f"ERROR: Cannot load dataset properties {properties_json_path}: {e}") from e
+    per_class: List[ClassCounts] = []
+    for species_class in classes_to_analyze:
+        if species_class not in properties:
+            raise PipelineError(f"ERROR: Data preparation failed for {species_class}")
+        per_class.append(properties[species_class])
+
+    sizes = np.array([len(c.names) for c in per_class], dtype=np.int64)
+    if sizes.sum() == 0:
+        return {species_class: [] for species_class in classes_to_analyze}
+    counts = np.concatenate([c.counts for c in per_class])
+    class_ids = np.repeat(np.arange(len(per_class)), sizes)
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    class_totals = np.array([c.total for c in per_class], dtype=np.float64)
+
+    masks: List[np.ndarray] = []
+    if policy.top_k is not None:
+        masks.append(np.arange(len(counts)) - offsets[class_ids] < policy.top_k)
+    if policy.min_images is not None:
+        masks.append(counts >= policy.min_images)
+    if policy.class_cdf is not None:
+        running = np.cumsum(counts)
+        class_start = np.concatenate([[0], running])[offsets]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cdf_values = (running - class_start[class_ids]) / class_totals[class_ids]
+        # CDFs rise within each class, so the cut-off is the first species of the class reaching it
+        cut_index = offsets + np.bincount(class_ids, weights=cdf_values < policy.class_cdf, minlength=len(sizes)).astype(np.int64)
+        cut_index = np.minimum(cut_index, offsets + sizes - 1)
+        has_images = class_totals > 0
+        too_low = has_images & (cut_index == offsets) & (cdf_values[np.minimum(offsets, len(counts) - 1)] > policy.class_cdf)
+        if too_low.any():
+            i = int(np.argmax(too_low))
+            raise PipelineError(
+                f"Threshold {policy.class_cdf:.2f} is too low to select any meaningful dominant species in class "
+                f"'{classes_to_analyze[i]}'\nMinimum: {cdf_values[offsets[i]]}"
+            )
+        cutoffs = np.where(has_images & (sizes > 0), counts[np.clip(cut_index, 0, len(counts) - 1)], np.iinfo(np.int64).max)
+        masks.append(counts >= cutoffs[class_ids])
+    if policy.global_cdf is not None:
+        masks.append(counts >= _global_cdf_cutoff(counts, policy.global_cdf) if class_totals.sum() > 0
+                     else np.zeros(len(counts), dtype=bool))
+
+    combine = np.logical_and if policy.mode is CombineMode.ALL else np.logical_or
+    selected = combine.reduce(masks)
+    # A class with no images has no dominant species, as in `analyze_single_class`
+    selected &= class_totals[class_ids] > 0
+
+    dominant: Dict[str, List[str]] = {}
+    for i, (species_class, class_counts) in enumerate(zip(classes_to_analyze, per_class)):
+        class_selected = selected[offsets[i]:offsets[i] + sizes[i]]
+        dominant[species_class] = [name for name, keep in zip(class_counts.names, class_selected) if keep]
+    return dominant
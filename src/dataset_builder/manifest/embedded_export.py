@@ -0,0 +1,133 @@
+import os
+from typing import Iterator, List, Tuple, Union
+
+import pyarrow as pa  # type: ignore
+import pyarrow.parquet as pq  # type: ignore
+
+from dataset_builder.core.exceptions import PipelineError
+from dataset_builder.core.log import log
+
+EMBEDDED_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+DEFAULT_ROW_GROUP_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_ROWS_PER_GROUP = 1024
+
+EMBEDDED_SCHEMA = pa.schema([
+    ("image", pa.binary()),
+    ("label_id", pa.int64()),
+    ("species", pa.string()),
+    ("class", pa.string()),
+])
+
+
+def _iter_row_groups(
+    image_list: List[Tuple[str, int]],
+    row_group_bytes: int,
+    max_rows_per_group: int,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Reads images from disk and yields them as record batches of bounded size.
+
+    A batch is closed as soon as it reaches `row_group_bytes` of image data or
+    `max_rows_per_group` rows, so at most one row group is held in memory.
+    """
+    images: List[bytes] = []
+    labels: List[int] = []
+    species: List[str] = []
+    classes: List[str] = []
+    pending_bytes = 0
+
+    for img_path, label in image_list:
+        with open(img_path, "rb") as f:
+            data = f.read()
+        parts = img_path.split(os.sep)
+        images.append(data)
+        labels.append(int(label))
+        species.append(parts[-2])
+        classes.append(parts[-3])
+        pending_bytes += len(data)
+
+        if pending_bytes >= row_group_bytes or len(images) >= max_rows_per_group:
+            yield pa.record_batch([images, labels, species, classes], schema=EMBEDDED_SCHEMA)
+            images, labels, species, classes = [], [], [], []
+            pending_bytes = 0
+
+    if images:
+        yield pa.record_batch([images, labels, species, classes], schema=EMBEDDED_SCHEMA)
+
+
+def write_embedded_dataset(
+    image_list: List[Tuple[str, int]],
+    path: str,
+    file_format: str = "parquet",
+    row_group_bytes: int = DEFAULT_ROW_GROUP_BYTES,
+    max_rows_per_group: int = DEFAULT_MAX_ROWS_PER_GROUP,
+) -> int:
+    """
+    Streams images into a single Parquet or Arrow IPC file with the raw bytes embedded.
+
+    Each row holds the encoded image (`image`), its `label_id`, and the `species` and
+    `class` directories it was read from (the real species, even when labelled "Other").
+    Rows are written one row group (Parquet) or record batch (Arrow IPC) at a time,
+    so memory stays bounded by `row_group_bytes` regardless of the dataset size.
+
+    Args:
+        image_list (List[Tuple[str, int]]): List of (image_path, label_id) pairs to embed.
+        path (str): Output file path.
+        file_format (str): Either "parquet" or "arrow" (Arrow IPC file format).
+        row_group_bytes (int): Target amount of image data per row group.
+        max_rows_per_group (int): Upper bound on rows per row group, keeps random access cheap
+            for datasets made of small images.
+
+    Returns:
+        int: Number of rows written.
+
+    Raises:
+        PipelineError: If `file_format` is not supported.
+    """
+    if file_format not in EMBEDDED_FORMATS:
+        raise PipelineError(f"Unsupported embedded format '{file_format}', expected one of {list(EMBEDDED_FORMATS)}")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    batches = _iter_row_groups(image_list, row_group_bytes, max_rows_per_group)
+    total_rows = 0
+
+    if file_format == "parquet":
+        # Encoded images do not compress, only the label columns benefit from it.
+        with pq.ParquetWriter(
+            path,
+            EMBEDDED_SCHEMA,
+            compression={"image": "NONE", "label_id": "SNAPPY", "species": "SNAPPY", "class": "SNAPPY"},
+            use_dictionary=["species", "class"],
+        ) as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=batch.num_rows)
+                total_rows += batch.num_rows
+    else:
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, EMBEDDED_SCHEMA) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                total_rows += batch.num_rows
+
+    log(f"Embedded {total_rows} images → {path}", False)
+    return total_rows
+
+
+def open_embedded_dataset(path: str) -> Union[pa.Table, pq.ParquetFile]:
+    """
+    Opens an embedded-bytes dataset written by `write_embedded_dataset`.
+
+    Arrow IPC files are memory-mapped and returned as a `pyarrow.Table` whose
+    image buffers point straight into the mapping (zero-copy). Parquet files are
+    returned as a memory-mapped `pyarrow.parquet.ParquetFile`, so callers can read
+    individual row groups with `read_row_group`.
+
+    Args:
+        path (str): Path to a `.arrow` or `.parquet` file.
+
+    Returns:
+        Union[pa.Table, pq.ParquetFile]: The opened dataset.
+    """
+    if path.endswith(EMBEDDED_FORMATS["arrow"]):
+        source = pa.memory_map(path, "r")
+        return pa.ipc.open_file(source).read_all()
+    return pq.ParquetFile(path, memory_map=True)
@@ -1,8 +1,10 @@
 import os
 import json
-from typing import List, Tuple, Dict
-from tqdm import tqdm  # type: ignore
+from typing import List, Tuple, Dict, Optional
 from dataset_builder.core.utility import save_manifest_parquet, write_data_to_json
+from dataset_builder.manifest.class_weights import DEFAULT_BETA, write_class_weights
+from dataset_builder.manifest.embedded_export import EMBEDDED_FORMATS, write_embedded_dataset
+from dataset_builder.manifest.species_partitions import write_species_partitions
 
 
 def _write_species_lists(
@@ -13,37 +15,17 @@ def _write_species_lists(
     """
     Writes species-specific image lists to the specified output path.
 
-    Groups the images by species, creates directories for each species, and saves 
-    the list of image paths to a Parquet file for each species.
+    The lists are saved as a hive-partitioned Parquet dataset under `species_lists/`
+    (`class=<class>/species=<species>/part-0.parquet`), see `write_species_partitions`.
 
     Args:
         base_output_path (str): The base directory where species lists will be saved.
         image_list (List[Tuple[str, int]]): A list of image paths and their corresponding species IDs.
         species_dict (Dict[int, str]): A dictionary mapping species IDs to species names.
     """
-
     species_list_dir = os.path.join(base_output_path, "species_lists")
     os.makedirs(species_list_dir, exist_ok=True)
-
-    species_group: Dict[str, List[Tuple[str, int]]] = {}
-    for img_path, label in image_list:
-        species = species_dict[label]
-        if species not in species_group:
-            species_group[species] = []
-        species_group[species].append((img_path, label))
-
-
-    for species, tuple_list in tqdm(species_group.items(), f"Writing species specific manifest to {species_list_dir}"):
-        class_name = tuple_list[0][0].split(os.sep)[-3]
-        species_dir = os.path.join(species_list_dir, class_name, species)
-        os.makedirs(species_dir, exist_ok=True)
-        file_name = os.path.join(species_dir, "images.parquet")
-
-        # save_manifest_parquet(tuple_list, file_name)
-        write_data_to_json(file_name, "Per-species data", tuple_list, False)
-
-        # with open(os.path.join(species_dir, "images.txt"), "w") as file:
-        #     file.write("\n".join(tuple_list))
+    write_species_partitions(species_list_dir, image_list, species_dict)
 
 
 def export_dataset_files(
@@ -54,6 +36,9 @@ def export_dataset_files(
     species_dict: Dict[int, str],
     species_composition: Dict[str, int],
     per_species_list: bool = False,
+    embed_format: Optional[str] = None,
+    relative_root: Optional[str] = None,
+    class_weight_beta: float = DEFAULT_BETA,
 ):
     """
     Exports dataset manifests, composition, and optional per-species image lists to the specified output directory.
@@ -63,7 +48,10 @@ def export_dataset_files(
         - Train/validation splits (`train.parquet`, `val.parquet`)
         - Species label mapping (`dataset_species_labels.json`)
         - Species image count summary (`species_composition.json`)
-        - Optional: per-species image lists as JSON under `species_lists/` subfolder.
+        - Train split label counts, class weights and per-row sampling weights as `.npy`
+          arrays under `class_weights/` (see `write_class_weights`)
+        - Optional: per-species image lists as a partitioned Parquet dataset under `species_lists/`.
+        - Optional: train/val images embedded as bytes (`train_images.parquet` / `.arrow`, `val_images.*`).
 
     Args:
         output_dir (str): Directory where output files will be saved.
@@ -73,15 +61,30 @@ def export_dataset_files(
         species_dict (Dict[int, str]): Mapping from label IDs to species names.
         species_composition (Dict[str, int]): Mapping from species names to image counts.
         per_species_list (bool): If True, also saves per-species image lists in a subdirectory.
+        embed_format (Optional[str]): If "parquet" or "arrow", also writes the train/val images
+            with their bytes embedded in that format. See `write_embedded_dataset`.
+        relative_root (Optional[str]): If given, manifests store paths relative to this dataset root
+            (dictionary-encoded class/species plus filename) instead of absolute `image_path` strings.
+        class_weight_beta (float): Beta of the effective-number class weights.
     """
     os.makedirs(output_dir, exist_ok=True)
     with open(os.path.join(output_dir, "dataset_species_labels.json"), "w", encoding="utf-8") as f:
         json.dump(species_dict, f, indent=4)
 
-    save_manifest_parquet(image_list, os.path.join(output_dir, "dataset_manifest.parquet"))
-    save_manifest_parquet(train_data, os.path.join(output_dir, "train.parquet"))
-    save_manifest_parquet(val_data, os.path.join(output_dir, "val.parquet"))
+    save_manifest_parquet(image_list, os.path.join(output_dir, "dataset_manifest.parquet"), relative_root)
+    save_manifest_parquet(train_data, os.path.join(output_dir, "train.parquet"), relative_root)
+    save_manifest_parquet(val_data, os.path.join(output_dir, "val.parquet"), relative_root)
     write_data_to_json(os.path.join(output_dir, "species_composition.json"), "species_composition", species_composition)
+    write_class_weights(output_dir, train_data, species_dict, class_weight_beta)
 
     if per_species_list:
         _write_species_lists(output_dir, image_list, species_dict)
+
+    if embed_format:
+        extension = EMBEDDED_FORMATS.get(embed_format, "")
+        for split_name, split_data in (("train", train_data), ("val", val_data)):
+            write_embedded_dataset(
+                split_data,
+                os.path.join(output_dir, f"{split_name}_images{extension}"),
+                embed_format,
+            )
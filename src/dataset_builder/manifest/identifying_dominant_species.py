@@ -1,8 +1,10 @@
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
+import pyarrow as pa  # type: ignore
 
+from dataset_builder.core.properties import PROPERTIES, ClassCounts
 from dataset_builder.core.utility import _prepare_data_cdf_ppf, SpeciesDict
 from dataset_builder.core.log import log
 from dataset_builder.core.exceptions import PipelineError
@@ -99,3 +101,102 @@ def identifying_dominant_species(properties_json_path: str, threshold: float, cl
         dominant_species = analyze_single_class(properties_json_path, species_class, threshold)
         species_data[species_class] = dominant_species
     return species_data
+
+
+SWEEP_SCHEMA = pa.schema([
+    ("class", pa.string()),
+    ("threshold", pa.float64()),
+    ("total_species", pa.int64()),
+    ("dominant_species", pa.int64()),
+    ("images_covered", pa.int64()),
+    ("coverage", pa.float64()),
+    ("other_share", pa.float64()),
+    ("valid", pa.bool_()),
+])
+
+
+def dominance_curve(class_counts: ClassCounts, thresholds: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorized `analyze_single_class` for many thresholds of one class.
+
+    Each threshold is located on the cumulative image counts with `searchsorted`,
+    then widened to every species tied with the cut-off count, exactly as
+    `analyze_single_class` selects them.
+
+    Args:
+        class_counts (ClassCounts): Counts of the class, sorted largest first.
+        thresholds (np.ndarray): Cumulative percentage thresholds, each in [0, 1].
+
+    Returns:
+        Dict[str, np.ndarray]: Per threshold, the number of dominant species
+        (`dominant_species`), the images they hold (`images_covered`), their share
+        of the class (`coverage`), the share left to "Other" (`other_share`), and
+        whether `analyze_single_class` would accept the threshold (`valid`).
+    """
+    counts, cumulative = class_counts.counts, class_counts.cumulative
+    cdf_values = cumulative / class_counts.total
+    cut_index = np.minimum(np.searchsorted(cdf_values, thresholds, side="left"), len(counts) - 1)
+    # Counts are descending, so the species at or above the cut-off count are a prefix
+    dominant = np.searchsorted(-counts, -counts[cut_index], side="right")
+    images_covered = cumulative[dominant - 1]
+    coverage = images_covered / class_counts.total
+    return {
+        "dominant_species": dominant,
+        "images_covered": images_covered,
+        "coverage": coverage,
+        "other_share": 1.0 - coverage,
+        "valid": ~((cut_index == 0) & (cdf_values[0] > thresholds)),
+    }
+
+
+def sweep_dominance_thresholds(
+    properties_json_path: str,
+    thresholds: Sequence[float],
+    classes_to_analyze: List[str],
+) -> pa.Table:
+    """
+    Evaluates many dominance thresholds at once, to pick `dominant_threshold`.
+
+    The sorted counts come from the shared properties store, so the dataset is not
+    rescanned and each class is computed in one vectorized pass (see
+    `dominance_curve`), instead of running the manifest generator per threshold.
+
+    Args:
+        properties_json_path (str): Path to the JSON file containing image statistics per species per class.
+        thresholds (Sequence[float]): Cumulative percentage thresholds to evaluate (e.g., 0.5 to 0.95).
+        classes_to_analyze (List[str]): Classes to evaluate.
+
+    Returns:
+        pa.Table: One row per class and threshold with the columns `class`, `threshold`,
+        `total_species`, `dominant_species`, `images_covered`, `coverage`, `other_share`
+        and `valid` (False where the threshold is too low to select any species).
+
+    Raises:
+        PipelineError: If a threshold is outside [0, 1], or a class cannot be loaded.
+    """
+    threshold_array = np.asarray(thresholds, dtype=np.float64)
+    if ((threshold_array < 0) | (threshold_array > 1)).any():
+        raise PipelineError("Threshold must be between 0 and 1")
+
+    columns: Dict[str, list] = defaultdict(list)
+    for species_class in classes_to_analyze:
+        try:
+            class_counts = PROPERTIES.class_counts(properties_json_path, species_class)
+        except (OSError, ValueError) as e:
+            raise PipelineError(f"ERROR: Data preparation failed for {species_class}: {e}") from e
+        if class_counts is None:
+            raise PipelineError(f"ERROR: Data preparation failed for {species_class}")
+        if class_counts.total == 0:
+            log(f"No data available for {species_class}", True, "WARNING")
+            continue
+
+        columns["class"].append(np.full(len(threshold_array), species_class, dtype=object))
+        columns["threshold"].append(threshold_array)
+        columns["total_species"].append(np.full(len(threshold_array), len(class_counts.names)))
+        for name, values in dominance_curve(class_counts, threshold_array).items():
+            columns[name].append(values)
+
+    return pa.table(
+        [pa.array(np.concatenate(columns[f.name]) if columns[f.name] else [], f.type) for f in SWEEP_SCHEMA],
+        schema=SWEEP_SCHEMA,
+    )
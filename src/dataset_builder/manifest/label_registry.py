@@ -0,0 +1,84 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+from dataset_builder.core.exceptions import PipelineError
+
+OTHER_LABEL = "Other"
+REGISTRY_VERSION = 1
+
+
+class LabelRegistry:
+    """
+    Persistent mapping from species names to label IDs.
+
+    IDs are never reused or renumbered: a species keeps the ID it was first given,
+    and species seen for the first time are appended after the existing ones. The
+    registry is stored as JSON (`{"version": 1, "labels": [name_of_id_0, ...]}`)
+    and kept in memory as a list plus a name index, so lookups are O(1).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._loaded = 0
+        if path and os.path.isfile(path):
+            self._load(path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            names = data["labels"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise PipelineError(f"Invalid label registry {path}: {e}") from e
+        for name in names:
+            if not isinstance(name, str) or name in self._ids:
+                raise PipelineError(f"Invalid label registry {path}: bad or duplicate label {name!r}")
+            self._ids[name] = len(self._names)
+            self._names.append(name)
+        self._loaded = len(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    @property
+    def names(self) -> List[str]:
+        """Registered names, indexed by label ID."""
+        return list(self._names)
+
+    @property
+    def added(self) -> List[str]:
+        """Names registered since the registry was loaded."""
+        return self._names[self._loaded:]
+
+    def get(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+    def label_for(self, name: str) -> int:
+        """Returns the ID of `name`, appending it to the registry if it is new."""
+        label = self._ids.get(name)
+        if label is None:
+            label = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return label
+
+    def name_of(self, label: int) -> str:
+        return self._names[label]
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Writes the registry through a temp file renamed into place."""
+        path = path or self.path
+        if not path:
+            raise PipelineError("The label registry has no path to save to")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".part"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": REGISTRY_VERSION, "labels": self._names}, f, indent=2)
+        os.replace(tmp, path)
+        self.path = path
+        self._loaded = len(self._names)
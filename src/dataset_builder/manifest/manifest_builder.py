@@ -1,9 +1,14 @@
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, Union
+from dataset_builder.core.events import add_counters, span, traced
+from dataset_builder.core.log import log
 from dataset_builder.manifest.data_preparer import get_dominant_species_if_needed, collect_images
+from dataset_builder.manifest.dominance_policy import DominancePolicy
 from dataset_builder.manifest.composition import generate_species_composition, split_train_val
 from dataset_builder.manifest.exporter import export_dataset_files
+from dataset_builder.manifest.label_registry import LabelRegistry
 
 
+@traced("manifest")
 def run_manifest_generator(
     data_dir: str,
     output_dir: str,
@@ -11,11 +16,15 @@ def run_manifest_generator(
     train_size: float,
     random_state: int,
     target_classes: List[str],
-    threshold: float,
+    threshold: Union[float, DominancePolicy],
     per_species_list: bool = False,
     export: bool = True,
     just_other: bool = False,
-    binary_classification: bool = False
+    binary_classification: bool = False,
+    embed_format: Optional[str] = None,
+    relative_paths: bool = False,
+    max_images_per_species: Optional[int] = None,
+    label_registry_path: Optional[str] = None,
 ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]], List[Tuple[str, int]], Dict[int, str], Dict[str, int]]:
     """
     Builds a dataset manifest by collecting species images, identifying dominant species, 
@@ -33,9 +42,21 @@ def run_manifest_generator(
         train_size (float): Fraction of data to use for training (0 < train_size < 1).
         random_state (int): Seed for reproducibility of the train/val split.
         target_classes (List[str]): List of species classes (e.g., "Aves", "Mammalia") to process.
-        threshold (float): CDF threshold (e.g., 0.9). If < 1.0, low-count species are grouped into "Other".
+        threshold (Union[float, DominancePolicy]): CDF threshold (e.g., 0.9). If < 1.0, low-count species are
+            grouped into "Other". A `DominancePolicy` selects the dominant species with its own rules instead.
         per_species_list (bool, optional): Whether to export per-species image manifests. Default is False.
         export (bool, optional): Whether to save dataset files to disk. Default is True.
+        just_other (bool, optional): Only keep the non-dominant species, each with its own label.
+        binary_classification (bool, optional): Label images as dominant (0) vs. other (1).
+        embed_format (Optional[str], optional): "parquet" or "arrow" to also export the train/val
+            images with their bytes embedded. Default is None.
+        relative_paths (bool, optional): Store manifest paths relative to `data_dir` in the compact,
+            dictionary-encoded layout so the dataset can be moved. Default is False.
+        max_images_per_species (Optional[int], optional): Cap on the images kept per species, sampled
+            while the dataset is scanned with `random_state` as seed. Default is None (all images).
+        label_registry_path (Optional[str], optional): JSON label registry (see `LabelRegistry`) to take
+            label IDs from, so existing species keep their IDs across runs; it is created if missing and
+            saved back with the new species appended. Default is None (IDs follow the sorted listing).
 
     Returns:
         Tuple containing:
@@ -55,14 +76,30 @@ def run_manifest_generator(
             - species_lists/ (optional per-species files)
     """
     dominant_species = get_dominant_species_if_needed(dataset_properties_path, threshold, target_classes)
-    image_list, species_dict, _ = collect_images(data_dir, dominant_species, just_other, binary_classification)
+    label_registry = LabelRegistry(label_registry_path) if label_registry_path else None
+    with span("collect"):
+        image_list, species_dict, _ = collect_images(
+            data_dir, dominant_species, just_other, binary_classification,
+            max_images_per_species=max_images_per_species, seed=random_state,
+            label_registry=label_registry,
+        )
+    if label_registry is not None:
+        if label_registry.added:
+            log(f"Label registry: {len(label_registry.added)} new labels, {len(label_registry)} in total", True)
+        label_registry.save()
+    add_counters(files=len(image_list), species=len(species_dict))
     species_composition = generate_species_composition(image_list, species_dict)
     train_data, val_data = split_train_val(image_list, train_size, random_state)
 
     if export:
-        export_dataset_files(output_dir, image_list, train_data, val_data, species_dict, species_composition, per_species_list)
+        with span("export"):
+            export_dataset_files(
+                output_dir, image_list, train_data, val_data, species_dict, species_composition, per_species_list,
+                embed_format=embed_format,
+                relative_root=data_dir if relative_paths else None,
+            )
 
-    print(f"Total species ({'no Other' if threshold == 1.0 else 'with Other'}): {len(species_dict)}")
+    print(f"Total species ({'no Other' if dominant_species is None else 'with Other'}): {len(species_dict)}")
     print(f"Total Images: {len(image_list)} | Train: {len(train_data)} | Val: {len(val_data)}")
 
     return image_list, train_data, val_data, species_dict, species_composition
@@ -0,0 +1,114 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa  # type: ignore
+import pyarrow.parquet as pq  # type: ignore
+from tqdm import tqdm  # type: ignore
+
+from dataset_builder.core.manifest_view import ManifestView, load_manifest_view
+
+PARTITION_FILE_NAME = "part-0.parquet"
+
+
+def species_partition_path(species_lists_dir: str, class_name: str, species: str) -> str:
+    """
+    Returns the Parquet file of one hive-style `class=<class>/species=<species>` partition.
+    """
+    return os.path.join(species_lists_dir, f"class={class_name}", f"species={species}", PARTITION_FILE_NAME)
+
+
+def _write_partition(path: str, partition: pa.Table) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(partition, path)
+
+
+def write_species_partitions(
+    species_lists_dir: str,
+    image_list: List[Tuple[str, int]],
+    species_dict: Dict[int, str],
+    max_workers: Optional[int] = None,
+) -> int:
+    """
+    Writes per-species manifests as a hive-partitioned Parquet dataset in one columnar pass.
+
+    All rows are put into a single Arrow table, sorted once by (class, species) and
+    sliced into zero-copy partitions, which are then written on a thread pool to
+    `<species_lists_dir>/class=<class>/species=<species>/part-0.parquet`.
+    The class comes from the image path, the species from the label, so the "Other"
+    label gets one partition per class.
+
+    Args:
+        species_lists_dir (str): Root directory of the partitioned dataset.
+        image_list (List[Tuple[str, int]]): A list of image paths and their corresponding species IDs.
+        species_dict (Dict[int, str]): A dictionary mapping species IDs to species names.
+        max_workers (Optional[int]): Number of writer threads. Defaults to the executor's default.
+
+    Returns:
+        int: Number of partitions written.
+    """
+    if not image_list:
+        return 0
+
+    image_paths, labels = zip(*image_list)
+    table = pa.table({
+        "image_path": pa.array(image_paths, pa.string()),
+        "label_id": pa.array([int(label) for label in labels], pa.int64()),
+    })
+    partition_keys = pa.array(
+        [f"{path.split(os.sep)[-3]}{os.sep}{species_dict[label]}" for path, label in image_list],
+        pa.string(),
+    ).dictionary_encode()
+
+    codes = partition_keys.indices.to_numpy()
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    table = table.take(pa.array(order))
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_codes)) + 1))
+    ends = np.append(starts[1:], len(sorted_codes))
+
+    jobs: List[Tuple[str, pa.Table]] = []
+    for start, end in zip(starts, ends):
+        class_name, species = partition_keys.dictionary[sorted_codes[start]].as_py().split(os.sep, 1)
+        path = species_partition_path(species_lists_dir, class_name, species)
+        jobs.append((path, table.slice(start, end - start)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_write_partition, path, partition) for path, partition in jobs]
+        for future in tqdm(futures, f"Writing species specific manifest to {species_lists_dir}"):
+            future.result()
+    return len(jobs)
+
+
+def load_species_partition(species_lists_dir: str, class_name: str, species: str) -> ManifestView:
+    """
+    Loads the manifest of a single species partition without touching the others.
+
+    Args:
+        species_lists_dir (str): Root directory written by `write_species_partitions`.
+        class_name (str): The class of the species (e.g., "Aves").
+        species (str): The species name, or "Other".
+
+    Returns:
+        ManifestView: Lazy view over the partition's (image_path, label_id) rows.
+
+    Raises:
+        FileNotFoundError: If the partition does not exist.
+    """
+    return load_manifest_view(species_partition_path(species_lists_dir, class_name, species))
+
+
+def list_species_partitions(species_lists_dir: str) -> List[Tuple[str, str]]:
+    """
+    Lists the (class, species) partitions present under `species_lists_dir`.
+    """
+    partitions: List[Tuple[str, str]] = []
+    for class_entry in sorted(os.listdir(species_lists_dir)):
+        if not class_entry.startswith("class="):
+            continue
+        class_dir = os.path.join(species_lists_dir, class_entry)
+        for species_entry in sorted(os.listdir(class_dir)):
+            if species_entry.startswith("species="):
+                partitions.append((class_entry[len("class="):], species_entry[len("species="):]))
+    return partitions
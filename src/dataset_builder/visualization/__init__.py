@@ -1 +1,14 @@
-from .visualizer import run_visualization, venn_diagram, visualize_ppf_multiple_species_class
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from dataset_builder._lazy import lazy_exports
+
+_EXPORTS = {
+    "run_visualization": ".visualizer",
+    "venn_diagram": ".visualizer",
+    "visualize_ppf_multiple_species_class": ".visualizer",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .visualizer import run_visualization, venn_diagram, visualize_ppf_multiple_species_class
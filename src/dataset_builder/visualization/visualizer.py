@@ -1,4 +1,3 @@
-import json
 import multiprocessing
 import os
 from collections import defaultdict
@@ -6,7 +5,6 @@ from typing import Dict, List, Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 from matplotlib_venn import venn2  # type: ignore
 
 from dataset_builder.analysis.matching import _aggregate_all_species
@@ -15,6 +13,8 @@ from dataset_builder.core.utility import (
     log,
     read_species_from_json,
 )
+from dataset_builder.core.events import add_counters, traced
+from dataset_builder.core.properties import PROPERTIES
 from dataset_builder.core.exceptions import PipelineError
 
 
@@ -145,25 +145,18 @@ def _class_composition_bar_chart(
         log(f"{os.path.basename(save_path)} already exists, skipping", True, "INFO")
         return
 
-    with open(properties_json_path, "r", encoding='utf-8') as file:
-        species_data = json.load(file)
+    class_counts = PROPERTIES.class_counts(properties_json_path, class_to_analyze)
 
     # Allow for failing since we still can generate other plot
-    if class_to_analyze not in species_data:
+    if class_counts is None:
         log(f"Class '{class_to_analyze}' not found.", True, "WARNING")
         return
 
-    species_dict: Dict[str, int] = species_data[class_to_analyze]
-
-    species_df = pd.DataFrame(species_dict.items(), columns=['Species', 'Image Count'])
-    species_df = species_df.sort_values(by="Image Count", ascending=True)
-
-    total_images = species_df["Image Count"].sum()
-    species_df["Percentage"] = (species_df["Image Count"] / total_images) * 100
-    percentages = species_df["Percentage"]
-
-    labels = species_df["Species"]
-    image_counts = species_df["Image Count"]
+    # Smallest first, so the largest species end up at the top of the chart
+    labels = class_counts.names[::-1]
+    image_counts = class_counts.counts[::-1]
+    total_images = class_counts.total
+    percentages = image_counts / total_images * 100 if total_images else np.zeros(len(image_counts))
 
     fig, ax = plt.subplots(figsize=(18, min(int(len(labels) * 0.3), 200)))
     ax.barh(labels, image_counts)
@@ -390,6 +383,7 @@ def _visualize_class(
     )
 
 
+@traced("visualize")
 def run_visualization(
         src_dataset_path: str,
         dst_dataset_path: str,
@@ -427,6 +421,9 @@ def run_visualization(
     properties_file_1 = os.path.join(output_dir, f"{src_dataset_name}_composition.json")
     properties_file_2 = os.path.join(output_dir, f"{dst_dataset_name}_composition.json")
 
+    add_counters(classes=len(target_classes_src) + len(target_classes_dst))
+    # Parsed once here; forked workers inherit the store instead of re-reading the files
+    PROPERTIES.preload(properties_file_1, properties_file_2)
     with multiprocessing.Pool(processes=multiprocessing.cpu_count()) as pool:
         pool.starmap(
             _visualize_class,
@@ -99,3 +99,19 @@ def test_filter_species_from_json_missing_file():
 def test_filter_species_from_json_no_matching_class(dummy_json_file):
     with pytest.raises(ValueError):
         filter_species_from_json(dummy_json_file, ["class_x"])
+
+
+def test_scan_from_archive(tmp_path):
+    import io
+    import tarfile
+    archive = tmp_path / "images.tar"
+    with tarfile.open(archive, "w") as tar:
+        for name in ["root/class_a/sp1/1.jpg", "root/class_a/sp1/2.jpg", "root/class_b/sp2/3.jpg"]:
+            info = tarfile.TarInfo(name)
+            info.size = 1
+            tar.addfile(info, io.BytesIO(b"x"))
+
+    assert scan_image_counts(str(archive), ["class_a"]) == {"class_a": {"sp1": 2}}
+    species, total = scan_species_list(str(archive))
+    assert species == {"class_a": ["sp1"], "class_b": ["sp2"]}
+    assert total == 2
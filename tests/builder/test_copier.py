@@ -1,9 +1,14 @@
+import errno
+import json
+import time
+import os
+import sys
 import pytest
 from pathlib import Path
 import shutil
 
-from dataset_builder.builder.walker import CopyTask  # type: ignore
-from dataset_builder.builder.copier import copy_one_species_data, copy_all_species, CopyStatus  # type: ignore
+from dataset_builder.builder.walker import CopyOrder, CopyTask  # type: ignore
+from dataset_builder.builder.copier import atomic_copy, copy_one_species_data, copy_all_species, copy_file_data, ShortCopyError, CopyBackend, CopyScheduler, CopyStats, CopyStatus, TokenBucket, list_source_files  # type: ignore
 
 # Helpers
 def make_sample_src(tmp_path: Path):
@@ -102,4 +107,161 @@ def test_copy_all_mixed(tmp_path: Path, capsys):
     out = capsys.readouterr().out
     assert "[INFO] Copied Aves/sparrow/a.jpg" in out
     assert "[INFO] Skipping existing Aves/peacock/a.jpg" in out
-    assert "[ERROR] Missing source directory:" in out
\ No newline at end of file
+    assert "[ERROR] Missing source directory:" in out
+
+@pytest.mark.parametrize("backend", list(CopyBackend))
+def test_copy_file_data_backends_preserve_content_and_metadata(tmp_path: Path, backend):
+    src = tmp_path / "src.jpg"
+    payload = bytes(range(256)) * 5000
+    src.write_bytes(payload)
+    src.chmod(0o640)
+    os.utime(src, ns=(1_000_000_000_000_000_000, 1_200_000_000_123_456_789))
+
+    dst = tmp_path / "dst.jpg"
+    size = copy_file_data(src, dst, backend, fadvise=True)
+
+    assert size == len(payload)
+    assert dst.read_bytes() == payload
+    assert dst.stat().st_mode & 0o777 == 0o640
+    assert dst.stat().st_mtime_ns // 1000 == src.stat().st_mtime_ns // 1000
+
+
+def test_copy_file_data_falls_back_when_kernel_copy_unsupported(tmp_path: Path, monkeypatch):
+    src = tmp_path / "src.jpg"
+    src.write_bytes(b"x" * 1000)
+
+    def unsupported(*args, **kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    dst = tmp_path / "dst.jpg"
+    copy_file_data(src, dst, CopyBackend.COPY_FILE_RANGE)
+    assert dst.read_bytes() == b"x" * 1000
+
+
+
+
+@pytest.mark.parametrize("backend", [CopyBackend.AUTO, CopyBackend.SENDFILE, CopyBackend.COPY_FILE_RANGE])
+def test_copy_file_data_works_with_macos_sendfile(tmp_path: Path, monkeypatch, backend):
+    # macOS: no copy_file_range, and sendfile only writes to sockets
+    src = tmp_path / "src.jpg"
+    src.write_bytes(b"x" * 1000)
+
+    def socket_only(*args):
+        raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    monkeypatch.setattr(os, "sendfile", socket_only, raising=False)
+    for platform in ("darwin", "linux"):
+        monkeypatch.setattr(sys, "platform", platform)
+        dst = tmp_path / f"dst_{platform}.jpg"
+        copy_file_data(src, dst, backend)
+        assert dst.read_bytes() == b"x" * 1000
+
+
+def test_copy_file_data_falls_back_when_kernel_copy_stops_early(tmp_path: Path, monkeypatch):
+    src = tmp_path / "src.jpg"
+    src.write_bytes(b"x" * 1000)
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+
+    dst = tmp_path / "dst.jpg"
+    copy_file_data(src, dst, CopyBackend.COPY_FILE_RANGE)
+    assert dst.read_bytes() == b"x" * 1000
+
+
+def test_atomic_copy_never_publishes_a_short_copy(tmp_path: Path, monkeypatch):
+    src = tmp_path / "src.jpg"
+    src.write_bytes(b"x" * 1000)
+    real_read = os.read
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, "read", lambda fd, n: real_read(fd, min(n, 100)) if os.lseek(fd, 0, os.SEEK_CUR) < 500 else b"")
+
+    target = tmp_path / "dst.jpg"
+    with pytest.raises(ShortCopyError):
+        atomic_copy(src, target)
+    assert list(tmp_path.iterdir()) == [src]
+
+
+def test_copy_all_collects_byte_progress_and_timings(tmp_path: Path):
+    src = make_sample_src(tmp_path)
+    task: CopyTask = ("Aves", "sparrow", src, tmp_path / "out" / "Aves" / "sparrow")
+    stats = CopyStats()
+    progressed = []
+
+    copy_all_species(iter([task]), stats=stats, progress=progressed.append)
+
+    expected_bytes = len("data-a.jpg") + len("data-b.png")
+    assert sum(progressed) == expected_bytes
+    assert stats.files == 2
+    assert stats.bytes == expected_bytes
+    assert stats.species[0].species == "sparrow"
+    assert stats.wall_seconds >= stats.species[0].copy_seconds
+    summary = stats.summary()
+    assert "Copied 2 files" in summary
+    assert "Aves/sparrow" in summary
+
+
+def test_copy_stats_report_throttle_wait_apart_from_copy_time(tmp_path: Path):
+    src = make_sample_src(tmp_path)
+    task: CopyTask = ("Aves", "sparrow", src, tmp_path / "out" / "Aves" / "sparrow")
+    stats = CopyStats()
+    # One file per 0.2s: the second file waits about 0.2s for its token
+    scheduler = CopyScheduler(max_files_per_s=5)
+    scheduler.files_bucket._tokens = 1
+
+    copy_all_species(iter([task]), stats=stats, scheduler=scheduler)
+
+    timing = stats.species[0]
+    assert timing.throttle_seconds >= 0.15
+    assert timing.copy_seconds < timing.throttle_seconds
+    assert timing.stat_seconds > 0
+    assert timing.total_seconds <= stats.wall_seconds
+    summary = stats.summary()
+    assert "Throttle wait (summed over workers):" in summary
+
+
+def test_token_bucket_limits_rate_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    bucket = TokenBucket(rate=100, burst_seconds=0.1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: bucket.acquire(10), range(8)))
+    # 80 tokens at 100/s with a 10-token burst take at least ~0.7s
+    assert time.monotonic() - start >= 0.6
+    assert TokenBucket(rate=None).acquire(10**9) == 0.0
+
+
+def test_scheduler_reloads_limits_from_control_file(tmp_path: Path):
+    control = tmp_path / "limits.json"
+    control.write_text(json.dumps({"max_mb_per_s": 5, "max_files_per_s": None}))
+    scheduler = CopyScheduler(max_files_per_s=10, control_file=str(control), reload_interval=0)
+    assert scheduler.max_mb_per_s == 5
+    assert scheduler.max_files_per_s is None
+
+    control.write_text(json.dumps({"max_mb_per_s": None}))
+    os.utime(control, (time.time() + 5, time.time() + 5))
+    scheduler.throttle(10**9)  # unlimited again: must not block
+    assert scheduler.max_mb_per_s is None
+
+
+def test_copy_all_with_scheduler(tmp_path: Path):
+    src = tmp_path / "src" / "Aves" / "sparrow"
+    src.mkdir(parents=True)
+    for i in range(3):
+        (src / f"{i}.jpg").write_bytes(b"x" * 10)
+    dst = tmp_path / "dst" / "Aves" / "sparrow"
+    scheduler = CopyScheduler(max_files_per_s=1000)
+    copied, skipped, missing = copy_all_species([("Aves", "sparrow", src, dst)], scheduler=scheduler)
+    assert (copied, skipped, missing) == (1, 0, 0)
+    assert len(list(dst.iterdir())) == 3
+
+
+def test_list_source_files_orders(tmp_path: Path):
+    for name in ["b.jpg", "a.jpg", "c.jpg"]:
+        (tmp_path / name).write_text(name)
+    (tmp_path / "subdir").mkdir()
+
+    assert [p.name for p in list_source_files(tmp_path, CopyOrder.NAME)] == ["a.jpg", "b.jpg", "c.jpg"]
+    inodes = [os.stat(p).st_ino for p in list_source_files(tmp_path, CopyOrder.INODE)]
+    assert inodes == sorted(inodes) and len(inodes) == 3
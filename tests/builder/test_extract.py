@@ -0,0 +1,56 @@
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from dataset_builder.builder.extract import extract_matched_species  # type: ignore
+from dataset_builder.builder.copy_matched_species import run_copy_matched_species  # type: ignore
+from dataset_builder.core.exceptions import FailedOperation  # type: ignore
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> str:
+    path = tmp_path / "train_val_images.tar.gz"
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in {
+            "train_val_images/Aves/sparrow/1.jpg": b"a",
+            "train_val_images/Aves/sparrow/2.jpg": b"bb",
+            "train_val_images/Aves/hawk/3.jpg": b"ccc",
+            "train_val_images/Insecta/ant/4.jpg": b"d",
+        }.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = 1_000_000
+            tar.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+def test_extracts_only_matched_species(archive, tmp_path: Path):
+    dst = tmp_path / "dst"
+    (dst / "Aves" / "sparrow").mkdir(parents=True)
+    (dst / "Aves" / "sparrow" / "2.jpg").write_bytes(b"bb")
+
+    result = extract_matched_species(
+        archive, dst, {"Aves": ["sparrow", "owl"], "Insecta": ["ant"]}, ["Aves"], use_pigz=False
+    )
+
+    assert (result.files, result.bytes, result.skipped) == (1, 1, 1)
+    assert result.missing_species == [("Aves", "owl")]
+    assert (dst / "Aves" / "sparrow" / "1.jpg").read_bytes() == b"a"
+    assert (dst / "Aves" / "sparrow" / "1.jpg").stat().st_mtime == 1_000_000
+    assert not (dst / "Aves" / "hawk").exists()
+    assert not (dst / "Insecta").exists()
+
+
+def test_run_copy_matched_species_from_archive(archive, tmp_path: Path):
+    matched = tmp_path / "matched.json"
+    matched.write_text(json.dumps({"Aves": ["hawk"], "Insecta": ["ant"]}))
+    dst = tmp_path / "dst"
+
+    run_copy_matched_species(archive, str(dst), str(matched), ["Aves", "Insecta"])
+    assert sorted(str(p.relative_to(dst)) for p in dst.rglob("*.jpg")) == ["Aves/hawk/3.jpg", "Insecta/ant/4.jpg"]
+
+    with pytest.raises(FailedOperation, match="directory source"):
+        run_copy_matched_species(archive, str(dst), str(matched), ["Aves"], sync=True)
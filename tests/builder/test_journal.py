@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from dataset_builder.builder import copier  # type: ignore
+from dataset_builder.builder.journal import CopyJournal, journal_path_for  # type: ignore
+from dataset_builder.builder.copy_matched_species import run_copy_matched_species  # type: ignore
+
+
+def test_journal_roundtrip_ignores_torn_line(tmp_path: Path):
+    path = tmp_path / "run.copy_journal"
+    with CopyJournal(str(path)) as journal:
+        journal.mark_done("Aves", "Parus major")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('["Aves", "trunc')
+
+    reloaded = CopyJournal(str(path))
+    assert len(reloaded) == 1
+    assert reloaded.is_done("Aves", "Parus major")
+    assert not reloaded.is_done("Aves", "sparrow")
+
+    reloaded.discard()
+    assert not path.exists()
+
+
+def test_journal_path_is_outside_dataset(tmp_path: Path):
+    dst = tmp_path / "dst"
+    assert journal_path_for(str(dst) + "/") == str(tmp_path / "dst.copy_journal")
+
+
+def test_atomic_copy_leaves_no_partial_file(tmp_path: Path, monkeypatch):
+    src = tmp_path / "a.jpg"
+    src.write_text("data")
+    target = tmp_path / "out.jpg"
+
+    def failing_copy(a, b, backend):
+        Path(b).write_text("trunc")
+        raise RuntimeError("simulated crash")
+
+    monkeypatch.setattr(copier, "copy_file_data", failing_copy)
+    with pytest.raises(RuntimeError, match="simulated crash"):
+        copier.atomic_copy(src, target)
+    assert list(tmp_path.iterdir()) == [src]
+
+
+def test_interrupted_copy_resumes_from_journal(tmp_path: Path, monkeypatch):
+    src = tmp_path / "src"
+    for species in ["hawk", "sparrow"]:
+        (src / "Aves" / species).mkdir(parents=True)
+        (src / "Aves" / species / "a.jpg").write_text(species)
+    matched = tmp_path / "matched.json"
+    matched.write_text(json.dumps({"Aves": ["hawk", "sparrow"]}))
+    dst = tmp_path / "dst"
+
+    real_copy = copier.copy_one_species_data
+    seen = []
+    crashed = []
+
+    def interrupt_on_sparrow(task, verbose=False, **kwargs):
+        seen.append(task[1])
+        if task[1] == "sparrow" and not crashed:
+            crashed.append(True)
+            raise RuntimeError("simulated crash")
+        return real_copy(task, verbose, **kwargs)
+
+    monkeypatch.setattr(copier, "copy_one_species_data", interrupt_on_sparrow)
+    with pytest.raises(RuntimeError, match="simulated crash"):
+        run_copy_matched_species(str(src), str(dst), str(matched), ["Aves"])
+
+    journal_file = Path(journal_path_for(str(dst)))
+    assert CopyJournal(str(journal_file)).is_done("Aves", "hawk")
+
+    seen.clear()
+    run_copy_matched_species(str(src), str(dst), str(matched), ["Aves"])
+    assert seen == ["sparrow"]
+    assert (dst / "Aves" / "sparrow" / "a.jpg").read_text() == "sparrow"
+    assert not journal_file.exists()
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from dataset_builder.builder import planner  # type: ignore
+from dataset_builder.builder.copier import CopyScheduler  # type: ignore
+from dataset_builder.builder.planner import CopyPlan, plan_copy, execute_plan  # type: ignore
+from dataset_builder.builder.walker import build_copy_tasks  # type: ignore
+from dataset_builder.builder.copy_matched_species import run_copy_matched_species, run_copy_plan  # type: ignore
+from dataset_builder.core.exceptions import FailedOperation  # type: ignore
+
+
+@pytest.fixture
+def dataset(tmp_path: Path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    for cls, species, name, size in [
+        ("Aves", "sparrow", "a.jpg", 100),
+        ("Aves", "sparrow", "b.jpg", 50),
+        ("Insecta", "ant", "c.jpg", 10),
+    ]:
+        (src / cls / species).mkdir(parents=True, exist_ok=True)
+        (src / cls / species / name).write_bytes(b"x" * size)
+    (dst / "Aves" / "sparrow").mkdir(parents=True)
+    (dst / "Aves" / "sparrow" / "b.jpg").write_bytes(b"x" * 50)
+    matched = {"Aves": ["sparrow", "hawk"], "Insecta": ["ant"]}
+    return src, dst, matched
+
+
+def test_plan_counts_bytes_and_classes(dataset, tmp_path: Path):
+    src, dst, matched = dataset
+    scratch = tmp_path / "scratch"
+    plan = plan_copy(build_copy_tasks(matched, ["Aves", "Insecta"], src, dst), scratch)
+
+    assert plan.files_to_copy == 2
+    assert plan.files_to_skip == 1
+    assert plan.bytes_to_copy == 110
+    assert plan.missing_species == [("Aves", "hawk")]
+    assert plan.per_class()["Aves"] == {"files_to_copy": 1, "files_to_skip": 1, "bytes_to_copy": 100}
+    assert plan.throughput and plan.eta_seconds() is not None
+    # The throughput probe cleans up after itself and never touches the destination
+    assert list(scratch.iterdir()) == []
+    assert sorted(p.name for p in dst.iterdir()) == ["Aves"]
+
+
+def test_plan_uses_given_throughput_without_probing(dataset, monkeypatch):
+    src, dst, matched = dataset
+    monkeypatch.setattr(planner, "_measure_throughput", lambda *args: pytest.fail("probed"))
+    plan = plan_copy(build_copy_tasks(matched, ["Aves", "Insecta"], src, dst), throughput_mb_s=1.0)
+    assert plan.eta_seconds() == pytest.approx(110 / 1e6)
+
+
+def test_plan_probe_goes_through_the_scheduler(dataset, tmp_path: Path):
+    src, dst, matched = dataset
+    scheduler = CopyScheduler(max_mb_per_s=100)
+    throttled = []
+    scheduler.throttle = throttled.append  # type: ignore[method-assign]
+    plan = plan_copy(build_copy_tasks(matched, ["Aves", "Insecta"], src, dst), tmp_path / "scratch", scheduler=scheduler)
+    assert plan.throughput
+    assert sorted(throttled) == [10, 100]
+
+
+def test_saved_plan_executes_without_rescan(dataset, tmp_path: Path):
+    src, dst, matched = dataset
+    plan = plan_copy(build_copy_tasks(matched, ["Aves", "Insecta"], src, dst))
+    plan_file = tmp_path / "plan.json"
+    plan.save(str(plan_file))
+
+    loaded = CopyPlan.load(str(plan_file))
+    assert loaded.entries == plan.entries
+    files, copied_bytes = execute_plan(loaded, max_workers=2)
+    assert (files, copied_bytes) == (2, 110)
+    assert (dst / "Insecta" / "ant" / "c.jpg").read_bytes() == b"x" * 10
+
+
+def test_dry_run_copies_nothing_and_plan_runs_later(dataset, tmp_path: Path, capsys):
+    src, dst, matched = dataset
+    matched_json = tmp_path / "matched.json"
+    matched_json.write_text(json.dumps({"Aves": ["sparrow"]}))
+    plan_file = tmp_path / "plans" / "copy.json"
+
+    new_dst = tmp_path / "new_dst"
+    plan = run_copy_matched_species(
+        str(src), str(dst), str(matched_json), ["Aves"], dry_run=True, plan_path=str(plan_file)
+    )
+    assert plan.files_to_copy == 1
+    assert plan.throughput is None
+    assert not (dst / "Aves" / "sparrow" / "a.jpg").exists()
+    assert sorted(p.name for p in (dst / "Aves" / "sparrow").iterdir()) == ["b.jpg"]
+    run_copy_matched_species(str(src), str(new_dst), str(matched_json), ["Aves"], dry_run=True)
+    assert not new_dst.exists()
+    assert "Files to copy: 1 | Files to skip: 1" in capsys.readouterr().out
+
+    run_copy_plan(str(plan_file))
+    assert (dst / "Aves" / "sparrow" / "a.jpg").exists()
+
+
+def test_run_copy_plan_with_missing_species_raises(dataset, tmp_path: Path):
+    src, dst, matched = dataset
+    plan_file = tmp_path / "plan.json"
+    plan_copy(build_copy_tasks(matched, ["Aves"], src, dst)).save(str(plan_file))
+    with pytest.raises(FailedOperation, match="1 missing species"):
+        run_copy_plan(str(plan_file))
@@ -0,0 +1,105 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from dataset_builder.builder.sync import SyncAction, plan_sync, apply_sync  # type: ignore
+from dataset_builder.builder.copy_matched_species import run_copy_matched_species  # type: ignore
+from dataset_builder.core.exceptions import FailedOperation  # type: ignore
+
+
+def write(path: Path, text: str, mtime: float = 1_000_000.0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def trees(tmp_path: Path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    write(src / "Aves" / "sparrow" / "new.jpg", "new")
+    write(src / "Aves" / "sparrow" / "same.jpg", "same")
+    write(src / "Aves" / "sparrow" / "changed.jpg", "changed!", mtime=2_000_000.0)
+    write(dst / "Aves" / "sparrow" / "same.jpg", "same")
+    write(dst / "Aves" / "sparrow" / "changed.jpg", "old")
+    write(dst / "Aves" / "sparrow" / "gone.jpg", "gone")
+    write(dst / "Aves" / "dropped" / "x.jpg", "x")
+    write(dst / "Insecta" / "ant" / "y.jpg", "y")
+    return src, dst
+
+
+def test_plan_sync_detects_every_change(trees):
+    src, dst = trees
+    plan = plan_sync({"Aves": ["sparrow"]}, ["Aves"], src, dst)
+
+    by_action = {(op.action, op.dst.name) for op in plan.operations}
+    assert by_action == {
+        (SyncAction.COPY, "new.jpg"),
+        (SyncAction.UPDATE, "changed.jpg"),
+        (SyncAction.DELETE_FILE, "gone.jpg"),
+        (SyncAction.DELETE_SPECIES, "dropped"),
+    }
+    assert plan.unchanged == 1
+    assert plan.bytes_to_copy == len("new") + len("changed!")
+
+
+def test_checksum_catches_same_size_and_mtime(trees):
+    src, dst = trees
+    write(src / "Aves" / "sparrow" / "same.jpg", "SAME")
+    plan = plan_sync({"Aves": ["sparrow"]}, ["Aves"], src, dst, checksum=True)
+    assert (SyncAction.UPDATE, "same.jpg") in {(op.action, op.dst.name) for op in plan.operations}
+
+
+def test_apply_sync_with_quarantine(trees, tmp_path: Path):
+    src, dst = trees
+    quarantine = tmp_path / "quarantine"
+    plan = plan_sync({"Aves": ["sparrow"]}, ["Aves"], src, dst)
+    done = apply_sync(plan, dst, quarantine, max_workers=2)
+
+    assert done[SyncAction.COPY] == 1
+    assert sorted(p.name for p in (dst / "Aves" / "sparrow").iterdir()) == ["changed.jpg", "new.jpg", "same.jpg"]
+    assert (dst / "Aves" / "sparrow" / "changed.jpg").read_text() == "changed!"
+    assert not (dst / "Aves" / "dropped").exists()
+    assert (quarantine / "Aves" / "dropped" / "x.jpg").exists()
+    assert (quarantine / "Aves" / "sparrow" / "gone.jpg").exists()
+    # Classes outside target_classes are never touched
+    assert (dst / "Insecta" / "ant" / "y.jpg").exists()
+
+
+def test_run_copy_matched_species_sync_mode(trees, tmp_path: Path, capsys):
+    src, dst = trees
+    matched = tmp_path / "matched.json"
+    matched.write_text(json.dumps({"Aves": ["sparrow"]}))
+
+    run_copy_matched_species(str(src), str(dst), str(matched), ["Aves"], sync=True)
+    assert not (dst / "Aves" / "dropped").exists()
+
+    run_copy_matched_species(str(src), str(dst), str(matched), ["Aves"], sync=True)
+    assert "All 1 species already up-to-date" in capsys.readouterr().out
+
+
+def test_sync_missing_species_raises(trees, tmp_path: Path):
+    src, dst = trees
+    matched = tmp_path / "matched.json"
+    matched.write_text(json.dumps({"Aves": ["sparrow", "hawk"]}))
+    with pytest.raises(FailedOperation, match="Missing images in 1 of 2 species"):
+        run_copy_matched_species(str(src), str(dst), str(matched), ["Aves"], sync=True)
+
+
+def test_quarantining_the_same_entries_twice_keeps_both(trees, tmp_path: Path):
+    src, dst = trees
+    quarantine = tmp_path / "quarantine"
+    apply_sync(plan_sync({"Aves": ["sparrow"]}, ["Aves"], src, dst), dst, quarantine)
+    # The same species and file turn up again and are dropped by a later sync
+    write(dst / "Aves" / "dropped" / "x.jpg", "x again")
+    write(dst / "Aves" / "sparrow" / "gone.jpg", "gone again")
+    apply_sync(plan_sync({"Aves": ["sparrow"]}, ["Aves"], src, dst), dst, quarantine)
+
+    dropped = sorted((quarantine / "Aves").glob("dropped*"))
+    assert [p.name for p in dropped][0] == "dropped" and len(dropped) == 2
+    assert sorted((d / "x.jpg").read_text() for d in dropped) == ["x", "x again"]
+    assert not (quarantine / "Aves" / "dropped" / "dropped").exists()
+    gone = sorted((quarantine / "Aves" / "sparrow").glob("gone*.jpg"))
+    assert sorted(p.read_text() for p in gone) == ["gone", "gone again"]
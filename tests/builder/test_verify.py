@@ -0,0 +1,79 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from dataset_builder.builder.verify import DigestCache, Mismatch, verify_copy  # type: ignore
+from dataset_builder.builder.copy_matched_species import run_verify_copy  # type: ignore
+from dataset_builder.core.exceptions import FailedOperation  # type: ignore
+
+
+def write(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+@pytest.fixture
+def trees(tmp_path: Path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    for name, data in {"ok.jpg": b"same", "short.jpg": b"12345", "flip.jpg": b"abcd", "lost.jpg": b"x"}.items():
+        write(src / "Aves" / "sparrow" / name, data)
+    write(dst / "Aves" / "sparrow" / "ok.jpg", b"same")
+    write(dst / "Aves" / "sparrow" / "short.jpg", b"123")
+    write(dst / "Aves" / "sparrow" / "flip.jpg", b"abcD")
+    write(dst / "Aves" / "sparrow" / "stray.jpg", b"?")
+    write(src / "Insecta" / "ant" / "a.jpg", b"a")
+    write(dst / "Insecta" / "ant" / "a.jpg", b"a")
+    return src, dst
+
+
+def test_size_only_and_checksum_verification(trees):
+    src, dst = trees
+    matched = {"Aves": ["sparrow", "owl"], "Insecta": ["ant"]}
+
+    report = verify_copy(matched, ["Aves", "Insecta"], src, dst)
+    assert report.files_checked == 5
+    assert report.missing_species == [("Aves", "owl")]
+    assert report.mismatches == {("Aves", "sparrow"): [
+        Mismatch("lost.jpg", "missing"), Mismatch("short.jpg", "size"), Mismatch("stray.jpg", "extra"),
+    ]}
+
+    report = verify_copy(matched, ["Aves", "Insecta"], src, dst, checksum="blake2b", max_workers=4)
+    assert Mismatch("flip.jpg", "digest") in report.mismatches[("Aves", "sparrow")]
+    assert ("Insecta", "ant") not in report.mismatches
+    assert not report.ok
+
+
+def test_digest_cache_only_rehashes_changed_files(trees, tmp_path: Path):
+    src, dst = trees
+    matched = {"Insecta": ["ant"], "Aves": ["sparrow"]}
+    cache_path = str(tmp_path / "digests.json")
+
+    cache = DigestCache(cache_path)
+    assert verify_copy(matched, ["Aves", "Insecta"], src, dst, "blake2b", cache=cache).files_hashed == 6
+    cache.save()
+
+    os.utime(dst / "Insecta" / "ant" / "a.jpg", (1, 1))
+    report = verify_copy(matched, ["Aves", "Insecta"], src, dst, "blake2b", cache=DigestCache(cache_path))
+    assert report.files_hashed == 1
+
+
+def test_unknown_checksum_raises(trees):
+    src, dst = trees
+    with pytest.raises(FailedOperation, match="Unknown checksum"):
+        verify_copy({"Aves": ["sparrow"]}, ["Aves"], src, dst, checksum="md4")
+
+
+def test_run_verify_copy_writes_report_and_sidecar(trees, tmp_path: Path, capsys):
+    src, dst = trees
+    matched_json = tmp_path / "matched.json"
+    matched_json.write_text(json.dumps({"Aves": ["sparrow"], "Insecta": ["ant"]}))
+    report_path = tmp_path / "report.json"
+
+    report = run_verify_copy(str(src), str(dst), str(matched_json), ["Aves", "Insecta"], "blake2b", str(report_path))
+    assert "Aves/sparrow: 1 digest, 1 extra, 1 missing, 1 size" in capsys.readouterr().out
+    assert os.path.isfile(str(dst) + ".digests.json")
+    saved = json.loads(report_path.read_text())
+    assert saved["mismatches"][0]["species"] == "sparrow"
+    assert report.files_checked == 5
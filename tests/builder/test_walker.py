@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from dataset_builder.builder.walker import build_copy_tasks  # type: ignore
+from dataset_builder.builder.walker import CopyOrder, build_copy_tasks, order_copy_tasks  # type: ignore
 
 
 def test_build_copy_tasks_empty():
@@ -17,4 +18,16 @@ def test_build_copy_tasks_filters_targets(tmp_path: Path):
     assert cls == "Aves"
     assert sp == "sparrow"
     assert src == src_root / "Aves" / "sparrow"
-    assert dst == dst_root / "Aves" / "sparrow"
\ No newline at end of file
+    assert dst == dst_root / "Aves" / "sparrow"
+
+
+def test_order_copy_tasks(tmp_path: Path):
+    for name in ["b", "a", "c"]:
+        (tmp_path / "Aves" / name).mkdir(parents=True)
+    matched = {"Aves": ["c", "missing", "a", "b"]}
+    tasks = list(build_copy_tasks(matched, ["Aves"], tmp_path, Path("dst")))
+
+    assert [t[1] for t in order_copy_tasks(tasks)] == ["c", "missing", "a", "b"]
+    assert [t[1] for t in order_copy_tasks(tasks, CopyOrder.NAME)] == ["a", "b", "c", "missing"]
+    by_inode = sorted(["a", "b", "c"], key=lambda s: os.stat(tmp_path / "Aves" / s).st_ino)
+    assert [t[1] for t in order_copy_tasks(tasks, CopyOrder.INODE)] == by_inode + ["missing"]
@@ -0,0 +1,78 @@
+import io
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from dataset_builder.core.archive import (  # type: ignore
+    build_archive_index,
+    is_archive,
+    load_archive_index,
+    open_archive_stream,
+    split_member_name,
+)
+
+
+def make_archive(path: Path, members: dict) -> str:
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = 1_000_000
+            tar.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> str:
+    return make_archive(tmp_path / "train_val_images.tar.gz", {
+        "train_val_images/Aves/sparrow/1.jpg": b"a",
+        "train_val_images/Aves/sparrow/2.jpg": b"bb",
+        "train_val_images/Aves/hawk/3.jpg": b"ccc",
+        "train_val_images/Insecta/ant/4.jpg": b"d",
+        "train_val_images/README.txt": b"not an image",
+    })
+
+
+def test_split_member_name():
+    assert split_member_name("train_val_images/Aves/sparrow/1.jpg") == ("Aves", "sparrow", "1.jpg")
+    assert split_member_name("Aves/sparrow/1.jpg") == ("Aves", "sparrow", "1.jpg")
+    assert split_member_name("train_val_images/README.txt") is None
+    assert split_member_name("sparrow/1.jpg") is None
+
+
+def test_index_is_cached_until_archive_changes(archive):
+    assert is_archive(archive)
+    counts = load_archive_index(archive)
+    assert counts == {"Aves": {"sparrow": 2, "hawk": 1}, "Insecta": {"ant": 1}}
+    assert os.path.isfile(archive + ".index.json")
+
+    stat = os.stat(archive)
+    os.utime(archive, (stat.st_atime, stat.st_mtime + 10))
+    with open(archive + ".index.json", "w") as f:
+        f.write("{corrupt")
+    assert load_archive_index(archive) == counts
+
+
+def test_open_archive_stream_without_pigz(archive):
+    with open_archive_stream(archive, use_pigz=False) as tar:
+        assert sum(1 for member in tar if member.isfile()) == 5
+    assert build_archive_index(archive, use_pigz=False)["Insecta"] == {"ant": 1}
+
+
+def test_index_can_live_elsewhere(archive, tmp_path: Path):
+    index_path = str(tmp_path / "cache.index.json")
+    counts = load_archive_index(archive, use_pigz=False, index_path=index_path)
+    assert os.path.isfile(index_path)
+    assert not os.path.exists(archive + ".index.json")
+    assert load_archive_index(archive, use_pigz=False, index_path=index_path) == counts
+
+
+def test_unwritable_index_is_not_fatal(archive, tmp_path: Path, capsys):
+    # Stands in for an archive on a read-only mount
+    index_path = str(tmp_path / "missing_dir" / "archive.index.json")
+    counts = build_archive_index(archive, use_pigz=False, index_path=index_path)
+    assert counts["Aves"] == {"sparrow": 2, "hawk": 1}
+    assert not os.path.exists(index_path)
+    assert "[WARNING] Cannot save archive index" in capsys.readouterr().out
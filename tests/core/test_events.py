@@ -0,0 +1,95 @@
+import sys
+
+import pytest
+
+from dataset_builder.core import events  # type: ignore
+from dataset_builder.core.events import (  # type: ignore
+    add_counters,
+    close_event_log,
+    flush_events,
+    initialize_event_log,
+    load_events,
+    span,
+    summarize_events,
+    traced,
+)
+
+
+@pytest.fixture
+def event_log(tmp_path):
+    path = tmp_path / "events" / "run.jsonl"
+    initialize_event_log(str(path))
+    yield str(path)
+    close_event_log()
+
+
+def test_spans_nest_and_record_counters(event_log):
+    @traced("copy")
+    def copy():
+        add_counters(files=2, bytes=100)
+        with span("verify", checksum="blake2b"):
+            add_counters(files=2)
+        add_counters(files=1)
+
+    copy()
+    with pytest.raises(RuntimeError):
+        with span("manifest"):
+            raise RuntimeError("boom")
+    flush_events()
+
+    spans = {e["path"]: e for e in load_events(event_log)}
+    assert spans["copy/verify"]["counters"] == {"files": 2}
+    assert spans["copy/verify"]["checksum"] == "blake2b"
+    assert spans["copy"]["counters"] == {"files": 3, "bytes": 100}
+    assert spans["copy"]["duration"] >= spans["copy/verify"]["duration"]
+    assert spans["copy"]["peak_rss_mb"] > 0
+    assert spans["manifest"]["status"] == "error"
+
+
+def test_summarize_events(event_log):
+    with span("analyze"):
+        add_counters(species=10)
+    with span("copy"):
+        with span("verify"):
+            pass
+    flush_events()
+    with open(event_log, "a") as f:
+        f.write('{"torn": \n')
+
+    lines = summarize_events(event_log).splitlines()
+    assert [line.split()[0] for line in lines[1:]] == ["analyze", "copy", "verify"]
+    assert lines[3].startswith("  verify")
+    assert "species=10" in lines[1]
+
+
+def test_counters_outside_spans_are_ignored(tmp_path):
+    add_counters(files=1)
+    with span("noop") as s:
+        s.add(files=1)
+    assert s.counters == {"files": 1}
+
+
+def test_spans_without_resource_module(event_log, monkeypatch):
+    # Windows has no `resource` module: spans still work, without peak RSS
+    monkeypatch.setitem(sys.modules, "resource", None)
+    assert events.peak_rss_mb() is None
+    with span("copy"):
+        pass
+    flush_events()
+
+    assert load_events(event_log)[-1]["peak_rss_mb"] is None
+    summary = summarize_events(event_log)
+    assert "calls=1" in summary and "peak_rss" not in summary
+
+
+def test_close_event_log_stops_writing(event_log):
+    with span("copy"):
+        pass
+    writer = events._events_file
+    close_event_log()
+
+    assert events.EVENTS_FILE_PATH is None and events._events_file is None
+    assert writer._fd is None and writer._thread is None
+    with span("dropped"):
+        pass
+    assert [e["path"] for e in load_events(event_log)] == ["copy"]
@@ -1,7 +1,12 @@
+import multiprocessing
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as real_datetime
+
+import pytest
+
 from dataset_builder.core import log as log_mod  # type: ignore
-from dataset_builder.core.log import initialize_logger, log  # type: ignore
+from dataset_builder.core.log import flush_logs, initialize_logger, log, set_log_level  # type: ignore
 
 
 def test_initialize_logger_default(tmp_path, monkeypatch):
@@ -34,6 +39,7 @@ def test_log_writes_and_prints(tmp_path, capsys):
     captured = capsys.readouterr()
     assert "[DEBUG] hello world\n" in captured.out
 
+    flush_logs()
     content = (tmp_path / "testlog.txt").read_text(encoding="utf-8")
     assert "[DEBUG] hello world\n" == content
 
@@ -47,6 +53,7 @@ def test_log_without_verbose(tmp_path, capsys):
     assert captured.out == ""  # no console output
 
     # File still receives the log
+    flush_logs()
     content = (tmp_path / "silent.txt").read_text(encoding="utf-8")
     assert "[INFO] quiet message\n" == content
 
@@ -56,6 +63,7 @@ def test_log_appends(tmp_path):
     log("first", verbose=False, level="INFO")
     log("second", verbose=False, level="INFO")
 
+    flush_logs()
     lines = (tmp_path / "append.txt").read_text(encoding="utf-8").splitlines()
     assert lines == ["[INFO] first", "[INFO] second"]
 
@@ -67,3 +75,65 @@ def test_log_before_initialize(monkeypatch, capsys):
     log("no file", verbose=True, level="WARN")
     captured = capsys.readouterr()
     assert "[WARN] no file\n" in captured.out
+
+
+
+def test_level_filter_skips_message_building(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_mod, "LOG_LEVEL", "DEBUG")
+    initialize_logger(log_dir=str(tmp_path), filename="levels.txt")
+    built = []
+
+    def message():
+        built.append(1)
+        return "expensive"
+
+    set_log_level("WARNING")
+    log(message, verbose=False, level="INFO")
+    log(message, verbose=False, level="ERROR")
+    flush_logs()
+    assert built == [1]
+    assert (tmp_path / "levels.txt").read_text(encoding="utf-8") == "[ERROR] expensive\n"
+    with pytest.raises(ValueError):
+        set_log_level("LOUD")
+
+
+def test_log_from_threads_keeps_whole_lines(tmp_path):
+    initialize_logger(log_dir=str(tmp_path), filename="threads.txt")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: log(f"line {i}", verbose=False), range(5000)))
+    flush_logs()
+    lines = (tmp_path / "threads.txt").read_text(encoding="utf-8").splitlines()
+    assert sorted(lines) == sorted(f"[INFO] line {i}" for i in range(5000))
+
+
+def _log_in_child(i):
+    log(f"child {i}", verbose=False)
+
+
+def test_log_from_forked_workers(tmp_path):
+    initialize_logger(log_dir=str(tmp_path), filename="procs.txt")
+    log("parent", verbose=False)
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        pool.map(_log_in_child, range(4))
+    flush_logs()
+    lines = (tmp_path / "procs.txt").read_text(encoding="utf-8").splitlines()
+    assert sorted(lines) == ["[INFO] child 0", "[INFO] child 1", "[INFO] child 2", "[INFO] child 3", "[INFO] parent"]
+
+
+def _log_and_exit(i):
+    log(f"worker {i}", verbose=False)
+    os._exit(0)
+
+
+def test_log_from_forked_child_exiting_without_flush(tmp_path):
+    initialize_logger(log_dir=str(tmp_path), filename="exit.txt")
+    log("parent", verbose=False)
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_log_and_exit, args=(i,)) for i in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    flush_logs()
+    lines = (tmp_path / "exit.txt").read_text(encoding="utf-8").splitlines()
+    assert sorted(lines) == ["[INFO] parent", "[INFO] worker 0", "[INFO] worker 1", "[INFO] worker 2"]
@@ -0,0 +1,89 @@
+import os
+import pytest
+import numpy as np
+
+from dataset_builder.core.manifest_view import ManifestView, load_manifest_view  # type: ignore
+from dataset_builder.core.exceptions import PipelineError  # type: ignore
+from dataset_builder.core.utility import save_manifest_parquet  # type: ignore
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    manifest = [
+        (os.path.join("/data", "Aves", "sp1", "a.jpg"), 0),
+        (os.path.join("/data", "Aves", "sp2", "b.jpg"), 1),
+        (os.path.join("/data", "Insecta", "sp3", "c.jpg"), 2),
+        (os.path.join("/data", "Insecta", "sp3", "d.jpg"), 2),
+    ]
+    path = str(tmp_path / "manifest.parquet")
+    save_manifest_parquet(manifest, path)
+    return path, manifest
+
+
+def test_view_is_lazy_and_indexable(manifest_path):
+    path, manifest = manifest_path
+    view = load_manifest_view(path)
+    assert view._table is None
+
+    assert len(view) == 4
+    assert view[1] == manifest[1]
+    assert view[-1] == manifest[-1]
+    assert list(view) == manifest
+
+
+def test_view_index_out_of_range(manifest_path):
+    path, _ = manifest_path
+    with pytest.raises(IndexError):
+        load_manifest_view(path)[4]
+
+
+def test_labels_only_projection(manifest_path):
+    path, _ = manifest_path
+    view = load_manifest_view(path, columns=["label_id"])
+    assert view.table.column_names == ["label_id"]
+    assert view[2] == (2,)
+    np.testing.assert_array_equal(view.labels(), np.array([0, 1, 2, 2]))
+
+
+def test_filter_by_label(manifest_path):
+    path, manifest = manifest_path
+    view = load_manifest_view(path, label_ids=[2])
+    assert list(view) == manifest[2:]
+
+
+def test_filter_by_class_from_path(manifest_path):
+    path, manifest = manifest_path
+    view = load_manifest_view(path, columns=["label_id"], classes=["Aves"])
+    assert view.table.column_names == ["label_id"]
+    assert list(view) == [(0,), (1,)]
+
+
+def test_missing_file_raises_on_open(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ManifestView(str(tmp_path / "nope.parquet"))
+
+
+def test_compact_manifest_roundtrip_and_relocation(tmp_path):
+    root = str(tmp_path / "dataset")
+    manifest = [
+        (os.path.join(root, "Aves", "Parus major", "a.jpg"), 0),
+        (os.path.join(root, "Aves", "Parus major", "b.jpg"), 0),
+        (os.path.join(root, "Insecta", "sp3", "c.jpg"), 1),
+    ]
+    path = str(tmp_path / "compact.parquet")
+    save_manifest_parquet(manifest, path, root=root)
+
+    view = load_manifest_view(path)
+    assert view.compact
+    assert "image_path" not in view.schema.names
+    assert view[0] == manifest[0]
+    assert list(view) == manifest
+    assert list(load_manifest_view(path, classes=["Insecta"])) == manifest[2:]
+
+    moved = load_manifest_view(path, root="/mnt/elsewhere")
+    assert moved[2] == (os.path.join("/mnt/elsewhere", "Insecta", "sp3", "c.jpg"), 1)
+
+
+def test_compact_manifest_rejects_paths_outside_root(tmp_path):
+    with pytest.raises(PipelineError, match="is not under"):
+        save_manifest_parquet([("/other/Aves/sp1/a.jpg", 0)], str(tmp_path / "m.parquet"), root=str(tmp_path))
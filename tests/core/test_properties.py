@@ -0,0 +1,61 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from dataset_builder.core.properties import PropertiesStore
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_sorts_each_class_by_count(tmp_path):
+    path = tmp_path / "data_composition.json"
+    _write(path, {"Aves": {"sparrow": 2, "hawk": 5, "crow": 3, "owl": 3}, "Insecta": {}})
+    store = PropertiesStore()
+
+    aves = store.class_counts(str(path), "Aves")
+    assert aves.names == ["hawk", "crow", "owl", "sparrow"]
+    np.testing.assert_array_equal(aves.counts, [5, 3, 3, 2])
+    np.testing.assert_array_equal(aves.cumulative, [5, 8, 11, 13])
+    assert aves.total == 13
+    assert store.class_counts(str(path), "Insecta").total == 0
+    assert store.class_counts(str(path), "Mammalia") is None
+
+
+def test_load_is_cached_until_the_file_changes(tmp_path):
+    path = tmp_path / "data_composition.json"
+    _write(path, {"Aves": {"hawk": 5}}, mtime_ns=1_000_000_000)
+    store = PropertiesStore()
+
+    first = store.load(str(path))
+    assert store.load(str(path)) is first
+    assert store.loads == 1
+
+    _write(path, {"Aves": {"hawk": 5, "crow": 7}}, mtime_ns=2_000_000_000)
+    assert store.class_counts(str(path), "Aves").names == ["crow", "hawk"]
+    assert store.loads == 2
+
+
+def test_cached_arrays_are_read_only(tmp_path):
+    path = tmp_path / "data_composition.json"
+    _write(path, {"Aves": {"hawk": 5}})
+    counts = PropertiesStore().class_counts(str(path), "Aves").counts
+    with pytest.raises(ValueError):
+        counts[0] = 1
+
+
+def test_preload_skips_unreadable_files(tmp_path):
+    good = tmp_path / "good.json"
+    bad = tmp_path / "bad.json"
+    _write(good, {"Aves": {"hawk": 5}})
+    bad.write_text("{oops")
+    store = PropertiesStore()
+    store.preload(str(good), str(bad), str(tmp_path / "missing.json"))
+    assert store.loads == 1
+    with pytest.raises(json.JSONDecodeError):
+        store.load(str(bad))
@@ -0,0 +1,164 @@
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from dataset_builder.builder.copier import transfer_all_species  # type: ignore
+from dataset_builder.core.storage import (  # type: ignore
+    LocalStorage,
+    S3Storage,
+    TarStorage,
+    ZipStorage,
+    is_local_dir,
+    open_storage,
+)
+from dataset_builder.manifest.data_preparer import collect_images  # type: ignore
+
+FILES = {
+    "Aves/sparrow/1.jpg": b"a",
+    "Aves/sparrow/2.jpg": b"bb",
+    "Aves/hawk/3.jpg": b"ccc",
+    "Insecta/ant/4.jpg": b"d",
+}
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client calls the storage layer uses."""
+
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+        self.list_calls = []
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys, Delimiter=None, ContinuationToken=None):
+        self.list_calls.append(Prefix)
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        contents, prefixes = [], []
+        for key in keys:
+            rest = key[len(Prefix):]
+            if Delimiter and Delimiter in rest:
+                prefix = Prefix + rest.split(Delimiter)[0] + Delimiter
+                if prefix not in prefixes:
+                    prefixes.append(prefix)
+            else:
+                contents.append({"Key": key, "Size": len(self.objects[key])})
+        entries = [("c", c) for c in contents] + [("p", p) for p in prefixes]
+        start = int(ContinuationToken or 0)
+        page = entries[start:start + MaxKeys]
+        result = {
+            "Contents": [e for kind, e in page if kind == "c"],
+            "CommonPrefixes": [{"Prefix": e} for kind, e in page if kind == "p"],
+            "IsTruncated": start + MaxKeys < len(entries),
+        }
+        if result["IsTruncated"]:
+            result["NextContinuationToken"] = str(start + MaxKeys)
+        return result
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+
+
+@pytest.fixture
+def local_tree(tmp_path: Path) -> Path:
+    root = tmp_path / "local"
+    for key, data in FILES.items():
+        (root / key).parent.mkdir(parents=True, exist_ok=True)
+        (root / key).write_bytes(data)
+    return root
+
+
+def make_zip(path: Path) -> str:
+    with zipfile.ZipFile(path, "w") as zf:
+        for key, data in FILES.items():
+            zf.writestr(key, data)
+    return str(path)
+
+
+def make_tar(path: Path) -> str:
+    with tarfile.open(path, "w:gz") as tar:
+        for key, data in FILES.items():
+            info = tarfile.TarInfo(key)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+def test_backends_expose_the_same_tree(local_tree: Path, tmp_path: Path):
+    client = FakeS3Client({f"datasets/inat/{key}": data for key, data in FILES.items()})
+    storages = [
+        LocalStorage(str(local_tree)),
+        ZipStorage(make_zip(tmp_path / "d.zip")),
+        TarStorage(make_tar(tmp_path / "d.tar.gz")),
+        S3Storage("bucket", "datasets/inat", client),
+    ]
+    for storage in storages:
+        assert sorted(storage.list_dir().dirs) == ["Aves", "Insecta"]
+        assert sorted(storage.list_dir("Aves").dirs) == ["hawk", "sparrow"]
+        assert storage.list_dir("Aves/sparrow").files == {"1.jpg": 1, "2.jpg": 2}
+        assert storage.read_bytes("Aves/hawk/3.jpg") == b"ccc"
+        assert storage.exists("Aves/hawk/3.jpg") and not storage.exists("Aves/owl")
+        with pytest.raises(FileNotFoundError):
+            storage.list_dir("Reptilia")
+
+
+def test_s3_listing_is_one_paginated_list_per_class():
+    objects = {f"Aves/sp{i}/{j}.jpg": b"x" for i in range(5) for j in range(3)}
+    objects.update({f"Insecta/sp{i}/0.jpg": b"x" for i in range(2)})
+    client = FakeS3Client(objects)
+    storage = S3Storage("bucket", "", client, page_size=4)
+
+    for class_name in storage.list_dir().dirs:
+        for species in storage.list_dir(class_name).dirs:
+            assert storage.list_dir(f"{class_name}/{species}").files
+    # 1 root page, 15 Aves keys in 4 pages, 2 Insecta keys in 1 page; no per-species requests
+    assert client.list_calls == ["", "Aves/", "Aves/", "Aves/", "Aves/", "Insecta/"]
+
+
+def test_s3_species_listing_caches_its_class():
+    objects = {f"Aves/sp{i}/{j}.jpg": b"x" for i in range(5) for j in range(3)}
+    client = FakeS3Client(objects)
+    storage = S3Storage("bucket", "", client)
+
+    for i in range(5):
+        assert len(storage.list_dir(f"Aves/sp{i}").files) == 3
+    assert not storage.exists("Aves/sp9/0.jpg")
+    assert client.list_calls == ["Aves/"]
+
+
+def test_transfer_from_s3_lists_each_class_once(tmp_path: Path):
+    objects = {f"Aves/sp{i}/{j}.jpg": b"x" for i in range(5) for j in range(2)}
+    client = FakeS3Client(objects)
+    species = [("Aves", f"sp{i}") for i in range(5)]
+    copied, _, missing = transfer_all_species(S3Storage("bucket", "", client), LocalStorage(str(tmp_path / "dst")), species)
+    assert (copied, missing) == (5, 0)
+    assert len(list((tmp_path / "dst").rglob("*.jpg"))) == 10
+    assert client.list_calls == ["Aves/"]
+
+
+def test_transfer_between_local_and_s3(local_tree: Path, tmp_path: Path):
+    client = FakeS3Client({"Aves/sparrow/1.jpg": b"a"})
+    bucket = S3Storage("bucket", "", client)
+    copied, skipped, missing = transfer_all_species(
+        LocalStorage(str(local_tree)), bucket, [("Aves", "sparrow"), ("Insecta", "ant"), ("Aves", "owl")]
+    )
+    assert (copied, skipped, missing) == (2, 0, 1)
+    assert client.objects["Aves/sparrow/2.jpg"] == b"bb"
+    assert bucket.exists("Aves/sparrow/2.jpg")
+
+    back = tmp_path / "back"
+    assert transfer_all_species(bucket, LocalStorage(str(back)), [("Insecta", "ant")]) == (1, 0, 0)
+    assert (back / "Insecta" / "ant" / "4.jpg").read_bytes() == b"d"
+
+
+def test_collect_images_from_zip(tmp_path: Path):
+    archive = make_zip(tmp_path / "d.zip")
+    assert not is_local_dir(archive)
+    assert isinstance(open_storage(archive), ZipStorage)
+
+    image_list, species_dict, _ = collect_images(archive, None)
+    assert species_dict == {0: "hawk", 1: "sparrow", 2: "ant"}
+    assert image_list[0] == (f"{archive}/Aves/hawk/3.jpg", 0)
@@ -0,0 +1,130 @@
+import json
+import os
+
+import pyarrow.parquet as pq  # type: ignore
+import pytest
+
+from dataset_builder.core.exceptions import PipelineError
+from dataset_builder.manifest import batch
+from dataset_builder.manifest.batch import (
+    ManifestVariant,
+    relabel_file_table,
+    run_manifest_batch,
+    scan_file_table,
+    standard_variants,
+)
+from dataset_builder.manifest.data_preparer import collect_images
+from dataset_builder.manifest.manifest_builder import run_manifest_generator
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    layout = {
+        "Aves": {"sp_a": 12, "sp_b": 6, "sp_c": 3, "sp_d": 2},
+        "Insecta": {"sp_x": 8, "sp_y": 4, "sp_z": 2},
+    }
+    counts = {}
+    for class_name, species_counts in layout.items():
+        for species, n in species_counts.items():
+            species_dir = tmp_path / "data" / class_name / species
+            species_dir.mkdir(parents=True)
+            for i in range(n):
+                (species_dir / f"img_{i:02d}.jpg").write_text("")
+        counts[class_name] = species_counts
+    properties = tmp_path / "data_composition.json"
+    properties.write_text(json.dumps(counts))
+    return str(tmp_path / "data"), str(properties)
+
+
+def test_file_table_layout(dataset):
+    data_dir, _ = dataset
+    table = scan_file_table(data_dir)
+
+    assert table.classes == ["Aves", "Insecta"]
+    assert table.species == ["sp_a", "sp_b", "sp_c", "sp_d", "sp_x", "sp_y", "sp_z"]
+    assert table.class_offsets.tolist() == [0, 4, 7]
+    assert table.offsets.tolist() == [0, 12, 18, 21, 23, 31, 35, 37]
+    arrow = table.to_arrow()
+    assert arrow.num_rows == len(table) == 37
+    assert arrow.column("species").to_pylist()[12] == "sp_b"
+
+
+@pytest.mark.parametrize("dominant, just_other, binary", [
+    (None, False, False),
+    ({"Aves": ["sp_a", "sp_b"], "Insecta": ["sp_x"]}, False, False),
+    ({"Aves": ["sp_a", "sp_b"], "Insecta": ["sp_x"]}, True, False),
+    ({"Aves": ["sp_a", "sp_b"], "Insecta": ["sp_x"]}, False, True),
+])
+def test_relabel_matches_collect_images(dataset, dominant, just_other, binary):
+    data_dir, _ = dataset
+    expected_images, expected_dict, _ = collect_images(data_dir, dominant, just_other, binary)
+    assert relabel_file_table(scan_file_table(data_dir), dominant, just_other, binary) == (expected_images, expected_dict)
+
+
+def test_batch_matches_separate_runs(dataset, tmp_path, monkeypatch):
+    data_dir, properties = dataset
+    common = dict(dataset_properties_path=properties, train_size=0.5, random_state=7, target_classes=["Aves", "Insecta"])
+    variants = standard_variants(0.8)
+
+    scans = []
+    real_scan = batch.scan_dataset
+    monkeypatch.setattr(batch, "scan_dataset", lambda *args: scans.append(args) or real_scan(*args))
+    results = run_manifest_batch(data_dir, str(tmp_path / "batch"), variants=variants, **common)
+
+    assert len(scans) == 1
+    assert list(results) == ["full", "dominant", "just_other", "binary"]
+    for variant in variants:
+        expected = run_manifest_generator(
+            data_dir, str(tmp_path / "single" / variant.name), threshold=variant.threshold,
+            just_other=variant.just_other, binary_classification=variant.binary_classification, **common,
+        )
+        assert results[variant.name] == expected
+        for name in ("train.parquet", "val.parquet", "species_composition.json"):
+            batch_file = os.path.join(tmp_path, "batch", variant.name, name)
+            single_file = os.path.join(tmp_path, "single", variant.name, name)
+            if name.endswith(".parquet"):
+                assert pq.read_table(batch_file).equals(pq.read_table(single_file))
+            else:
+                assert open(batch_file).read() == open(single_file).read()
+
+
+def test_batch_rejects_duplicate_variant_names(dataset, tmp_path):
+    data_dir, properties = dataset
+    with pytest.raises(PipelineError, match="unique"):
+        run_manifest_batch(
+            data_dir, str(tmp_path / "out"), properties, 0.5, 0, ["Aves"],
+            [ManifestVariant("a"), ManifestVariant("a", 0.8)], export=False,
+        )
+
+
+def test_batch_uses_label_registries_like_separate_runs(dataset, tmp_path):
+    data_dir, properties = dataset
+    common = dict(dataset_properties_path=properties, train_size=0.5, random_state=7,
+                  target_classes=["Aves", "Insecta"], export=False)
+    for name in ("batch", "single", "binary_batch"):
+        (tmp_path / f"{name}_labels.json").write_text(json.dumps({"version": 1, "labels": ["sp_z", "Other"]}))
+    variants = [
+        ManifestVariant("full"),
+        ManifestVariant("dominant", 0.8),
+        ManifestVariant("binary", 0.8, binary_classification=True,
+                        label_registry_path=str(tmp_path / "binary_batch_labels.json")),
+    ]
+
+    results = run_manifest_batch(
+        data_dir, str(tmp_path / "batch"), variants=variants,
+        label_registry_path=str(tmp_path / "batch_labels.json"), **common,
+    )
+
+    for variant in variants[:2]:
+        expected = run_manifest_generator(
+            data_dir, str(tmp_path / "single"), threshold=variant.threshold,
+            label_registry_path=str(tmp_path / "single_labels.json"), **common,
+        )
+        assert results[variant.name] == expected
+    assert results["full"][3][0] == "sp_z"
+    assert results["dominant"][3][1] == "Other"
+    saved = json.loads((tmp_path / "batch_labels.json").read_text())["labels"]
+    assert saved == json.loads((tmp_path / "single_labels.json").read_text())["labels"]
+    assert saved[:2] == ["sp_z", "Other"] and len(saved) == 8
+    # Binary labels are fixed, so the binary variant's own registry is left as it was
+    assert json.loads((tmp_path / "binary_batch_labels.json").read_text())["labels"] == ["sp_z", "Other"]
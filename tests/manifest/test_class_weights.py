@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+import pyarrow.parquet as pq  # type: ignore
+import pytest
+
+from dataset_builder.core.exceptions import PipelineError
+from dataset_builder.manifest.class_weights import (
+    EFFECTIVE_NUMBER,
+    INVERSE_FREQUENCY,
+    LABEL_COUNTS,
+    SAMPLE_WEIGHTS,
+    compute_class_weights,
+    load_class_weights,
+    write_class_weights,
+)
+from dataset_builder.manifest.exporter import export_dataset_files
+
+
+def test_compute_class_weights():
+    labels = np.array([0, 0, 0, 1, 2, 2, 0, 0])
+    weights = compute_class_weights(labels, num_labels=4, beta=0.9)
+
+    np.testing.assert_array_equal(weights[LABEL_COUNTS], [5, 1, 2, 0])
+    np.testing.assert_allclose(weights[INVERSE_FREQUENCY], [8 / 15, 8 / 3, 8 / 6, 0], rtol=1e-6)
+    raw = np.array([(1 - 0.9) / (1 - 0.9 ** n) for n in (5, 1, 2)])
+    np.testing.assert_allclose(weights[EFFECTIVE_NUMBER][:3], raw * 3 / raw.sum(), rtol=1e-6)
+    assert weights[EFFECTIVE_NUMBER][3] == 0
+    np.testing.assert_allclose(weights[SAMPLE_WEIGHTS], weights[INVERSE_FREQUENCY][labels])
+    # Every label gets the same total sampling mass
+    mass = np.bincount(labels, weights=weights[SAMPLE_WEIGHTS])
+    np.testing.assert_allclose(mass, mass[0])
+
+
+def test_compute_class_weights_rejects_bad_input():
+    with pytest.raises(PipelineError, match="beta"):
+        compute_class_weights(np.array([0]), 1, beta=1.0)
+    with pytest.raises(PipelineError, match="Label ids"):
+        compute_class_weights(np.array([0, 3]), 2)
+
+
+def test_write_and_mmap_class_weights(tmp_path):
+    train_data = [("a.jpg", 0), ("b.jpg", 1), ("c.jpg", 1)]
+    write_class_weights(str(tmp_path), train_data, {0: "sp1", 1: "sp2", 2: "Other"})
+
+    weights = load_class_weights(str(tmp_path))
+    assert isinstance(weights[LABEL_COUNTS], np.memmap)
+    np.testing.assert_array_equal(weights[LABEL_COUNTS], [1, 2, 0])
+    assert weights[SAMPLE_WEIGHTS].dtype == np.float32
+    assert len(weights[SAMPLE_WEIGHTS]) == len(train_data)
+
+
+def test_export_dataset_files_writes_class_weights(tmp_path):
+    image_list = [(f"/data/Aves/sp{i % 3}/{i}.jpg", i % 3) for i in range(12)]
+    train_data, val_data = image_list[:9], image_list[9:]
+    export_dataset_files(str(tmp_path), image_list, train_data, val_data, {0: "sp0", 1: "sp1", 2: "Other"}, {})
+
+    weights = load_class_weights(str(tmp_path))
+    train_labels = pq.read_table(os.path.join(tmp_path, "train.parquet")).column("label_id").to_numpy()
+    np.testing.assert_array_equal(weights[SAMPLE_WEIGHTS], weights[INVERSE_FREQUENCY][train_labels])
+    np.testing.assert_array_equal(weights[LABEL_COUNTS], [3, 3, 3])
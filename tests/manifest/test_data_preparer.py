@@ -1,5 +1,7 @@
+import os
 import pytest
-from dataset_builder.manifest.data_preparer import collect_images_by_dominance  # type: ignore
+from dataset_builder.manifest import data_preparer  # type: ignore
+from dataset_builder.manifest.data_preparer import collect_images_by_dominance, collect_images  # type: ignore
 
 
 @pytest.fixture
@@ -86,4 +88,92 @@ def test_collect_all_non_dominant(setup_test_dirs):
     )
 
     assert len(image_list) == 4  # both sp1 and sp2 fall into "Other"
-    assert list(species_dict.values()) == ["Other"]
\ No newline at end of file
+    assert list(species_dict.values()) == ["Other"]
+
+@pytest.fixture
+def multi_class_dataset(tmp_path):
+    root = tmp_path / "dataset"
+    for class_name, species_list in {"class_b": ["sp_z", "sp_y"], "class_a": ["sp_b", "sp_a"]}.items():
+        for species in species_list:
+            species_dir = root / class_name / species
+            species_dir.mkdir(parents=True)
+            for i in range(2):
+                (species_dir / f"img_{i}.jpg").write_text("")
+    return str(root)
+
+
+def test_collect_images_labels_follow_sorted_names(multi_class_dataset):
+    image_list, species_dict, species_to_id = collect_images(multi_class_dataset, None, max_workers=4)
+
+    assert species_dict == {0: "sp_a", 1: "sp_b", 2: "sp_y", 3: "sp_z"}
+    assert image_list[0] == (os.path.join(multi_class_dataset, "class_a", "sp_a", "img_0.jpg"), 0)
+    assert collect_images(multi_class_dataset, None, max_workers=1)[0] == image_list
+
+
+def test_collect_images_lists_each_species_once(multi_class_dataset, monkeypatch):
+    calls = []
+    real_listdir = os.listdir
+
+    def counting_listdir(path):
+        calls.append(path)
+        return real_listdir(path)
+
+    monkeypatch.setattr(data_preparer.os, "listdir", counting_listdir)
+    dominant = {"class_a": ["sp_a"], "class_b": ["sp_z"]}
+    image_list, species_dict, _ = collect_images(multi_class_dataset, dominant)
+
+    species_listings = [path for path in calls if path.count(os.sep) > multi_class_dataset.count(os.sep) + 1]
+    assert len(species_listings) == 4
+    assert len(set(species_listings)) == 4
+    assert species_dict == {0: "sp_a", 1: "sp_z", 2: "Other"}
+    assert len(image_list) == 8
+
+
+def test_sample_image_files_is_bounded_and_order_independent():
+    names = [f"img_{i}.jpg" for i in range(1000)]
+    sample = data_preparer.sample_image_files(iter(names), 10, seed=42)
+
+    assert len(sample) == 10
+    assert sample == sorted(sample)
+    assert set(sample) <= set(names)
+    assert data_preparer.sample_image_files(reversed(names), 10, seed=42) == sample
+    assert data_preparer.sample_image_files(sample, 10, seed=42) == sample
+    assert data_preparer.sample_image_files(names, 10, seed=7) != sample
+    assert data_preparer.sample_image_files(names[:3], 10, seed=42) == names[:3]
+
+
+def test_collect_images_caps_images_per_species(tmp_path):
+    big = tmp_path / "dataset" / "class_a" / "sp_big"
+    small = tmp_path / "dataset" / "class_a" / "sp_small"
+    big.mkdir(parents=True)
+    small.mkdir()
+    for i in range(50):
+        (big / f"img_{i:02d}.jpg").write_text("")
+    (small / "img_0.jpg").write_text("")
+
+    image_list, species_dict, _ = collect_images(str(tmp_path / "dataset"), None, max_images_per_species=5, seed=1)
+
+    labels = [label for _, label in image_list]
+    assert species_dict == {0: "sp_big", 1: "sp_small"}
+    assert labels.count(0) == 5 and labels.count(1) == 1
+    assert collect_images(str(tmp_path / "dataset"), None, max_images_per_species=5, seed=1)[0] == image_list
+
+
+def test_collect_images_by_dominance_caps_prescanned_listing(setup_test_dirs):
+    image_list = []
+    species_files = data_preparer.scan_class_dirs([setup_test_dirs])[0]
+    collect_images_by_dominance(
+        dataset_path=setup_test_dirs,
+        class_name="class_a",
+        dominant_species=None,
+        species_to_id={},
+        species_dict={},
+        image_list=image_list,
+        current_id=0,
+        species_files=species_files,
+        max_images_per_species=1,
+    )
+    assert len(image_list) == 2
+
+    with pytest.raises(data_preparer.PipelineError, match="max_images_per_species"):
+        collect_images_by_dominance(setup_test_dirs, "class_a", None, {}, {}, [], 0, max_images_per_species=0)
@@ -0,0 +1,96 @@
+import json
+
+import numpy as np
+import pytest
+
+from dataset_builder.core.exceptions import PipelineError
+from dataset_builder.manifest.data_preparer import get_dominant_species_if_needed
+from dataset_builder.manifest.dominance_policy import CombineMode, DominancePolicy, select_dominant_species
+from dataset_builder.manifest.identifying_dominant_species import identifying_dominant_species
+
+
+@pytest.fixture
+def properties_file(tmp_path):
+    path = tmp_path / "data_composition.json"
+    path.write_text(json.dumps({
+        "Aves": {"sp1": 100, "sp2": 50, "sp3": 30, "sp4": 10},
+        "Insecta": {"ins1": 40, "ins2": 40, "ins3": 5},
+        "Empty": {},
+    }))
+    return str(path)
+
+
+def test_policy_needs_a_valid_rule():
+    with pytest.raises(PipelineError, match="at least one rule"):
+        DominancePolicy()
+    with pytest.raises(PipelineError, match="class_cdf must be between 0 and 1"):
+        DominancePolicy(class_cdf=1.5)
+    with pytest.raises(PipelineError, match="top_k must not be negative"):
+        DominancePolicy(top_k=-1)
+
+
+@pytest.mark.parametrize("threshold", [0.6, 0.8, 0.9, 0.95, 1.0])
+def test_class_cdf_matches_identifying_dominant_species(properties_file, threshold):
+    classes = ["Aves", "Insecta"]
+    expected = identifying_dominant_species(properties_file, threshold, classes)
+    assert select_dominant_species(properties_file, DominancePolicy(class_cdf=threshold), classes) == dict(expected)
+
+
+def test_class_cdf_matches_on_random_data(tmp_path):
+    rng = np.random.default_rng(0)
+    data = {f"class_{c}": {f"sp{i}": int(x) for i, x in enumerate(rng.integers(1, 50, size=n))}
+            for c, n in enumerate([3, 7, 40, 300])}
+    path = tmp_path / "random.json"
+    path.write_text(json.dumps(data))
+    for threshold in np.linspace(0.0, 1.0, 21):
+        policy = DominancePolicy(class_cdf=float(threshold))
+        try:
+            expected = dict(identifying_dominant_species(str(path), float(threshold), list(data)))
+        except PipelineError:
+            with pytest.raises(PipelineError, match="too low"):
+                select_dominant_species(str(path), policy, list(data))
+            continue
+        assert select_dominant_species(str(path), policy, list(data)) == expected
+
+
+def test_class_cdf_too_low_raises(properties_file):
+    with pytest.raises(PipelineError, match="too low .* class 'Aves'"):
+        select_dominant_species(properties_file, DominancePolicy(class_cdf=0.3), ["Aves"])
+
+
+def test_top_k_and_min_images(properties_file):
+    classes = ["Aves", "Insecta", "Empty"]
+    assert select_dominant_species(properties_file, DominancePolicy(top_k=1), classes) == {
+        "Aves": ["sp1"], "Insecta": ["ins1"], "Empty": [],
+    }
+    assert select_dominant_species(properties_file, DominancePolicy(min_images=40), classes) == {
+        "Aves": ["sp1", "sp2"], "Insecta": ["ins1", "ins2"], "Empty": [],
+    }
+
+
+def test_global_cdf_spans_all_classes(properties_file):
+    # 275 images in total; the top species (100, 50, 40, 40) reach 230 / 275 = 0.84
+    policy = DominancePolicy(global_cdf=0.8)
+    assert select_dominant_species(properties_file, policy, ["Aves", "Insecta"]) == {
+        "Aves": ["sp1", "sp2"], "Insecta": ["ins1", "ins2"],
+    }
+
+
+def test_rules_combine_with_mode(properties_file):
+    classes = ["Aves", "Insecta"]
+    both = DominancePolicy(top_k=2, min_images=45)
+    either = DominancePolicy(top_k=1, min_images=30, mode=CombineMode.ANY)
+    assert select_dominant_species(properties_file, both, classes) == {"Aves": ["sp1", "sp2"], "Insecta": []}
+    assert select_dominant_species(properties_file, either, classes) == {
+        "Aves": ["sp1", "sp2", "sp3"], "Insecta": ["ins1", "ins2"],
+    }
+
+
+def test_unknown_class_raises(properties_file):
+    with pytest.raises(PipelineError, match="Data preparation failed for Mammalia"):
+        select_dominant_species(properties_file, DominancePolicy(top_k=1), ["Mammalia"])
+
+
+def test_get_dominant_species_if_needed_accepts_a_policy(properties_file):
+    assert get_dominant_species_if_needed(properties_file, DominancePolicy(top_k=1), ["Aves"]) == {"Aves": ["sp1"]}
+    assert get_dominant_species_if_needed(properties_file, 1.0, ["Aves"]) is None
@@ -0,0 +1,61 @@
+import os
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dataset_builder.core.exceptions import PipelineError  # type: ignore
+from dataset_builder.manifest.embedded_export import write_embedded_dataset, open_embedded_dataset  # type: ignore
+from dataset_builder.manifest.exporter import export_dataset_files  # type: ignore
+
+
+@pytest.fixture
+def image_list(tmp_path):
+    images = []
+    for class_name, species, label in [("Aves", "sp1", 0), ("Aves", "sp2", 1), ("Insecta", "sp3", 2)]:
+        species_dir = tmp_path / "data" / class_name / species
+        species_dir.mkdir(parents=True)
+        for i in range(3):
+            img = species_dir / f"{i}.jpg"
+            img.write_bytes(f"{species}-{i}".encode() * 10)
+            images.append((str(img), label))
+    return images
+
+
+def test_parquet_row_groups_are_bounded(tmp_path, image_list):
+    out = str(tmp_path / "images.parquet")
+    written = write_embedded_dataset(image_list, out, "parquet", max_rows_per_group=4)
+
+    assert written == 9
+    parquet_file = open_embedded_dataset(out)
+    assert parquet_file.metadata.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.column_names == ["image", "label_id", "species", "class"]
+    assert table.column("image")[0].as_py() == open(image_list[0][0], "rb").read()
+    assert table.column("class").to_pylist()[-1] == "Insecta"
+
+
+def test_arrow_ipc_roundtrip_is_memory_mapped(tmp_path, image_list):
+    out = str(tmp_path / "images.arrow")
+    write_embedded_dataset(image_list, out, "arrow", row_group_bytes=1)
+
+    table = open_embedded_dataset(out)
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 9
+    assert table.column("label_id").to_pylist() == [label for _, label in image_list]
+    assert table.column("species").to_pylist()[3] == "sp2"
+
+
+def test_unsupported_format_raises(tmp_path, image_list):
+    with pytest.raises(PipelineError, match="Unsupported embedded format"):
+        write_embedded_dataset(image_list, str(tmp_path / "x.tar"), "tar")
+
+
+def test_export_dataset_files_with_embedded_images(tmp_path, image_list):
+    out_dir = str(tmp_path / "out")
+    export_dataset_files(
+        out_dir, image_list, image_list[:6], image_list[6:], {0: "sp1", 1: "sp2", 2: "sp3"},
+        {"sp1": 3, "sp2": 3, "sp3": 3}, embed_format="parquet",
+    )
+
+    assert pq.read_table(os.path.join(out_dir, "train_images.parquet")).num_rows == 6
+    assert pq.read_table(os.path.join(out_dir, "val_images.parquet")).num_rows == 3
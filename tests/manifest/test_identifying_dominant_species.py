@@ -1,7 +1,13 @@
+import json
+
 import pytest
 from unittest.mock import patch
 
-from dataset_builder.manifest.identifying_dominant_species import identifying_dominant_species  # type: ignore
+from dataset_builder.manifest.identifying_dominant_species import (  # type: ignore
+    analyze_single_class,
+    identifying_dominant_species,
+    sweep_dominance_thresholds,
+)
 from dataset_builder.core.exceptions import PipelineError  # type: ignore
 
 
@@ -80,4 +86,54 @@ def test_zero_total_images_triggers_warning(capsys):
         result = identifying_dominant_species("dummy.json", 0.5, ["class_a"])
     
     assert result["class_a"] == []
-    assert "No data available for class_a" in capsys.readouterr().out
\ No newline at end of file
+    assert "No data available for class_a" in capsys.readouterr().out
+
+
+@pytest.fixture
+def properties_file(tmp_path):
+    path = tmp_path / "data_composition.json"
+    path.write_text(json.dumps({
+        "class_a": {"sp1": 100, "sp2": 50, "sp3": 30, "sp4": 10},
+        "class_b": {"sp5": 5, "sp6": 5, "sp7": 1},
+        "class_c": {"sp8": 0},
+    }))
+    return str(path)
+
+
+def test_sweep_matches_analyze_single_class(properties_file):
+    thresholds = [0.0, 0.3, 0.5, 0.53, 0.8, 0.9, 0.95, 1.0]
+    table = sweep_dominance_thresholds(properties_file, thresholds, ["class_a", "class_b"])
+
+    assert table.num_rows == 2 * len(thresholds)
+    for row in table.to_pylist():
+        try:
+            expected = len(analyze_single_class(properties_file, row["class"], row["threshold"]))
+        except PipelineError:
+            assert not row["valid"]
+            continue
+        assert row["valid"]
+        assert row["dominant_species"] == expected
+
+
+def test_sweep_reports_coverage_and_other_share(properties_file):
+    rows = sweep_dominance_thresholds(properties_file, [0.6, 0.95], ["class_a", "class_b"]).to_pylist()
+
+    assert [(r["class"], r["dominant_species"], r["images_covered"]) for r in rows] == [
+        ("class_a", 2, 150), ("class_a", 4, 190), ("class_b", 2, 10), ("class_b", 3, 11),
+    ]
+    assert rows[0]["total_species"] == 4
+    assert rows[0]["coverage"] == pytest.approx(150 / 190)
+    assert rows[0]["other_share"] == pytest.approx(40 / 190)
+
+
+def test_sweep_skips_classes_without_images(properties_file, capsys):
+    table = sweep_dominance_thresholds(properties_file, [0.5], ["class_c"])
+    assert table.num_rows == 0
+    assert "No data available for class_c" in capsys.readouterr().out
+
+
+def test_sweep_rejects_bad_thresholds_and_classes(properties_file):
+    with pytest.raises(PipelineError, match="Threshold must be between 0 and 1"):
+        sweep_dominance_thresholds(properties_file, [0.5, 1.2], ["class_a"])
+    with pytest.raises(PipelineError, match="Data preparation failed for class_x"):
+        sweep_dominance_thresholds(properties_file, [0.5], ["class_x"])
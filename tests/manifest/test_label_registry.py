@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from dataset_builder.core.exceptions import PipelineError
+from dataset_builder.manifest.data_preparer import collect_images
+from dataset_builder.manifest.label_registry import LabelRegistry
+
+
+def _make_dataset(root, layout, images=1):
+    for class_name, species_list in layout.items():
+        for species in species_list:
+            species_dir = root / class_name / species
+            species_dir.mkdir(parents=True, exist_ok=True)
+            for i in range(images):
+                (species_dir / f"img_{i}.jpg").write_text("")
+    return str(root)
+
+
+def test_registry_appends_and_persists(tmp_path):
+    path = str(tmp_path / "labels.json")
+    registry = LabelRegistry(path)
+    assert registry.label_for("sp_b") == 0
+    assert registry.label_for("sp_a") == 1
+    assert registry.label_for("sp_b") == 0
+    registry.save()
+
+    reloaded = LabelRegistry(path)
+    assert reloaded.names == ["sp_b", "sp_a"]
+    assert "sp_a" in reloaded and reloaded.get("sp_c") is None
+    assert reloaded.added == []
+    assert reloaded.label_for("sp_c") == 2
+    assert reloaded.added == ["sp_c"]
+    assert reloaded.name_of(2) == "sp_c"
+
+
+def test_registry_rejects_corrupt_files(tmp_path):
+    path = tmp_path / "labels.json"
+    path.write_text(json.dumps({"labels": ["sp_a", "sp_a"]}))
+    with pytest.raises(PipelineError, match="duplicate"):
+        LabelRegistry(str(path))
+    path.write_text("{oops")
+    with pytest.raises(PipelineError, match="Invalid label registry"):
+        LabelRegistry(str(path))
+
+
+def test_new_species_keep_existing_ids(tmp_path):
+    registry_path = str(tmp_path / "labels.json")
+    first = _make_dataset(tmp_path / "v1", {"Aves": ["sp_b", "sp_d"], "Insecta": ["sp_x"]})
+    registry = LabelRegistry(registry_path)
+    _, species_dict, _ = collect_images(first, {"Aves": ["sp_b", "sp_d"], "Insecta": []}, label_registry=registry)
+    registry.save()
+    assert species_dict == {0: "sp_b", 1: "sp_d", 2: "Other"}
+
+    # A new species sorts before the existing ones and a new class appears
+    second = _make_dataset(tmp_path / "v2", {"Aves": ["sp_a", "sp_b", "sp_d"], "Amphibia": ["sp_f"], "Insecta": ["sp_x"]})
+    registry = LabelRegistry(registry_path)
+    dominant = {"Aves": ["sp_a", "sp_b", "sp_d"], "Amphibia": ["sp_f"], "Insecta": []}
+    image_list, species_dict, species_to_id = collect_images(second, dominant, label_registry=registry)
+
+    assert species_dict == {0: "sp_b", 1: "sp_d", 2: "Other", 3: "sp_f", 4: "sp_a"}
+    assert species_to_id["sp_b"] == 0 and species_to_id["sp_a"] == 4
+    assert sorted(label for _, label in image_list) == [0, 1, 2, 3, 4]
+
+
+def test_manifest_generator_creates_and_extends_registry(tmp_path):
+    from dataset_builder.manifest.manifest_builder import run_manifest_generator
+
+    registry_path = str(tmp_path / "labels.json")
+    data_dir = _make_dataset(tmp_path / "data", {"Aves": ["sp_b"]}, images=4)
+    kwargs = dict(
+        output_dir=str(tmp_path / "out"), dataset_properties_path="unused.json", train_size=0.5,
+        random_state=0, target_classes=["Aves"], threshold=1.0, export=False, label_registry_path=registry_path,
+    )
+    run_manifest_generator(data_dir, **kwargs)
+    _make_dataset(tmp_path / "data", {"Aves": ["sp_a"]}, images=4)
+    species_dict = run_manifest_generator(data_dir, **kwargs)[3]
+
+    assert species_dict == {0: "sp_b", 1: "sp_a"}
+    assert LabelRegistry(registry_path).names == ["sp_b", "sp_a"]
@@ -87,7 +87,7 @@ def test_run_manifest_generator_basic_flow():
         species_list_dir = os.path.join(output_dir, "species_lists")
         assert os.path.isdir(species_list_dir)
         species_folders = [f for root, dirs, files in os.walk(species_list_dir) for f in dirs]
-        assert set(species_folders) >= {"sp1", "sp2", "sp3"}
+        assert set(species_folders) >= {"species=sp1", "species=sp2", "species=sp3"}
 
         # check species_dict contents
         # assumes deterministic ordering (sorted by label index)
@@ -0,0 +1,49 @@
+import os
+import pytest
+
+from dataset_builder.manifest.species_partitions import (  # type: ignore
+    write_species_partitions,
+    load_species_partition,
+    list_species_partitions,
+    species_partition_path,
+)
+
+
+@pytest.fixture
+def image_list():
+    return [
+        (os.path.join("/data", "Aves", "sp1", "a.jpg"), 0),
+        (os.path.join("/data", "Insecta", "sp3", "b.jpg"), 2),
+        (os.path.join("/data", "Aves", "sp1", "c.jpg"), 0),
+        (os.path.join("/data", "Aves", "sp2", "d.jpg"), 1),
+        (os.path.join("/data", "Insecta", "sp4", "e.jpg"), 1),
+    ]
+
+
+def test_write_hive_partitions(tmp_path, image_list):
+    species_dict = {0: "sp1", 1: "Other", 2: "sp3"}
+    written = write_species_partitions(str(tmp_path), image_list, species_dict, max_workers=2)
+
+    assert written == 4
+    assert list_species_partitions(str(tmp_path)) == [
+        ("Aves", "Other"), ("Aves", "sp1"), ("Insecta", "Other"), ("Insecta", "sp3"),
+    ]
+    assert os.path.isfile(species_partition_path(str(tmp_path), "Aves", "sp1"))
+
+
+def test_load_single_partition(tmp_path, image_list):
+    write_species_partitions(str(tmp_path), image_list, {0: "sp1", 1: "sp2", 2: "sp3"})
+
+    view = load_species_partition(str(tmp_path), "Aves", "sp1")
+    assert list(view) == [image_list[0], image_list[2]]
+
+
+def test_load_missing_partition_raises(tmp_path, image_list):
+    write_species_partitions(str(tmp_path), image_list, {0: "sp1", 1: "sp2", 2: "sp3"})
+    with pytest.raises(FileNotFoundError):
+        load_species_partition(str(tmp_path), "Aves", "nope")
+
+
+def test_empty_image_list_writes_nothing(tmp_path):
+    assert write_species_partitions(str(tmp_path), [], {}) == 0
+    assert os.listdir(tmp_path) == []
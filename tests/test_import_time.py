@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["pandas", "pyarrow", "matplotlib", "matplotlib_venn", "sklearn", "bs4", "requests", "yaml"]
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+
+@pytest.mark.parametrize("module", [
+    "dataset_builder",
+    "dataset_builder.builder.copy_matched_species",
+    "dataset_builder.analysis.scanner",
+])
+def test_import_does_not_load_heavy_dependencies(module):
+    loaded = _run(
+        f"import sys, {module}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    ).strip()
+    assert loaded == ""
+
+
+def test_import_within_startup_budget():
+    elapsed = float(_run(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import dataset_builder\n"
+        "print(time.perf_counter() - start)"
+    ))
+    assert elapsed < STARTUP_BUDGET_SECONDS
+
+
+def test_lazy_names_resolve_on_first_use():
+    out = _run(
+        "import sys, dataset_builder\n"
+        "fn = dataset_builder.run_manifest_generator\n"
+        "print(fn.__module__, 'sklearn' in sys.modules, 'run_manifest_generator' in dir(dataset_builder))"
+    )
+    assert out.split() == ["dataset_builder.manifest.manifest_builder", "True", "True"]
+    with pytest.raises(AttributeError):
+        import dataset_builder
+        dataset_builder.does_not_exist